@@ -0,0 +1,69 @@
+"""
+Storing new addresses on SQLite: ORM unit of work vs Core executemany.
+
+"orm" adds one AddressDB object per row with add_all (the previous behaviour),
+"core" is AddressRepository.create_many, one executemany per chunk. Each run
+starts from an empty database file and commits once.
+
+Usage: python -m benchmarks.address_bulk_insert [--rows 1000 10000 100000] [--chunk-size 1000]
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from src.core.entities.address import Address
+from src.core.constants import ADDRESS_INSERT_CHUNK_SIZE
+from src.infra.database.config import Base
+from src.infra.database import models
+from src.infra.database.repositories import AddressRepository
+
+
+def build_addresses(count: int) -> list:
+    # Random-looking values of the real sizes, generating keys is not what is measured
+    return [
+        Address(public_address="0x" + os.urandom(20).hex(), encrypted_private_key=os.urandom(100).hex())
+        for _ in range(count)
+    ]
+
+
+async def insert_orm(session, addresses: list, chunk_size: int) -> None:
+    session.add_all([models.AddressDB(**address.model_dump()) for address in addresses])
+    await session.commit()
+
+
+async def insert_core(session, addresses: list, chunk_size: int) -> None:
+    await AddressRepository(session, insert_chunk_size=chunk_size).create_many(addresses)
+
+
+async def run(insert, addresses: list, chunk_size: int) -> float:
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{directory}/benchmark.db")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with async_sessionmaker(engine)() as session:
+            started = time.perf_counter()
+            await insert(session, addresses, chunk_size)
+            elapsed = time.perf_counter() - started
+        await engine.dispose()
+    return elapsed
+
+
+async def main(row_counts: list, chunk_size: int) -> None:
+    print(f"{'rows':>8} {'orm (s)':>10} {'core (s)':>10} {'core rows/s':>12} {'speedup':>8}")
+    for count in row_counts:
+        addresses = build_addresses(count)
+        orm = await run(insert_orm, addresses, chunk_size)
+        core = await run(insert_core, addresses, chunk_size)
+        print(f"{count:>8,} {orm:>10.3f} {core:>10.3f} {count / core:>12,.0f} {orm / core:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000],
+                        help="Batch sizes to store")
+    parser.add_argument("--chunk-size", type=int, default=ADDRESS_INSERT_CHUNK_SIZE,
+                        help="Rows per executemany of the core path")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.chunk_size))
@@ -0,0 +1,96 @@
+"""
+Event-loop blocking while transactions are decrypted and signed.
+
+A ticker wakes up every millisecond and records how late it runs, while a burst
+of decrypt+sign jobs goes through TransactionService's CPU path. "inline" runs the
+jobs on the event loop (the previous behaviour), "thread" and "process" hand them
+to a BoundedExecutor.
+
+Usage: python -m benchmarks.event_loop_blocking [--jobs 200] [--workers 4]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from cryptography.fernet import Fernet
+from eth_account import Account
+from src.infra.concurrency import BoundedExecutor
+from src.core.services.transaction_service import sign_transaction
+
+TICK_SECONDS = 0.001
+
+
+def build_tx(nonce: int) -> dict:
+    return {
+        "to": "0x000000000000000000000000000000000000dEaD",
+        "value": 1,
+        "gas": 21000,
+        "maxFeePerGas": 2 * 10**9,
+        "maxPriorityFeePerGas": 10**9,
+        "nonce": nonce,
+        "chainId": 1,
+        "type": 2,
+    }
+
+
+def decrypt_and_sign(encryption_service, encrypted_key: bytes, tx_dict: dict) -> str:
+    return sign_transaction(tx_dict, encryption_service.decrypt(encrypted_key))
+
+
+async def measure_lag(stop: asyncio.Event) -> list:
+    lags = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append(time.perf_counter() - started - TICK_SECONDS)
+    return lags
+
+
+async def run(mode: str, jobs: int, workers: int, encryption_service, encrypted_key: bytes):
+    executor = None if mode == "inline" else BoundedExecutor(mode, workers, queue_size=workers * 4)
+
+    async def job(nonce: int) -> str:
+        tx_dict = build_tx(nonce)
+        if executor is None:
+            return decrypt_and_sign(encryption_service, encrypted_key, tx_dict)
+        return await executor.run(decrypt_and_sign, encryption_service, encrypted_key, tx_dict)
+
+    if executor is not None:
+        await asyncio.gather(*(job(i) for i in range(workers)))  # Warms the pool up
+
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(measure_lag(stop))
+    await asyncio.sleep(TICK_SECONDS * 5)
+    started = time.perf_counter()
+    await asyncio.gather(*(job(i) for i in range(jobs)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    lags = await ticker
+    if executor is not None:
+        executor.shutdown()
+
+    p99 = statistics.quantiles(lags, n=100, method="inclusive")[98] if len(lags) > 1 else lags[0]
+    return jobs / elapsed, max(lags), p99, sum(lag for lag in lags if lag > TICK_SECONDS)
+
+
+async def main(jobs: int, workers: int) -> None:
+    os.environ.setdefault("ENCRYPTION_KEYS", Fernet.generate_key().decode())
+    from src.infra.security.encryption import EncryptionService
+    encryption_service = EncryptionService()
+    encrypted_key = encryption_service.encrypt(Account.create().key)
+
+    print(f"{'mode':>8} {'jobs/s':>10} {'max lag (ms)':>14} {'p99 lag (ms)':>14} {'blocked (ms)':>14}")
+    for mode in ("inline", "thread", "process"):
+        rate, max_lag, p99, blocked = await run(mode, jobs, workers, encryption_service, encrypted_key)
+        print(f"{mode:>8} {rate:>10,.0f} {max_lag * 1000:>14.1f} {p99 * 1000:>14.1f} {blocked * 1000:>14.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=200,
+                        help="Transactions decrypted and signed in the burst")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="Pool size of the thread and process modes")
+    args = parser.parse_args()
+    asyncio.run(main(args.jobs, args.workers))
@@ -0,0 +1,80 @@
+"""
+Nonce allocation throughput as the number of concurrent senders grows.
+
+Compares NonceManager's per-address locks with a single global lock (the previous
+behaviour). Every address pays one simulated RPC round trip on first use.
+
+Usage: python -m benchmarks.nonce_contention [--latency-ms 50] [--allocations 200]
+"""
+import argparse
+import asyncio
+import io
+import time
+from contextlib import asynccontextmanager, redirect_stdout
+from unittest.mock import AsyncMock
+from src.core.entities import Address
+from src.core.interfaces import IAddressRepository, IBlockchainService
+from src.infra.blockchain.nonce_manager import NonceManager
+
+SENDER_COUNTS = [1, 2, 4, 8, 16, 32, 64]
+
+
+class GlobalLockNonceManager(NonceManager):
+    """Baseline: every address shares one lock."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._global_lock = asyncio.Lock()
+
+    def _lock_for(self, address: str) -> asyncio.Lock:
+        return self._global_lock
+
+
+def build_manager(manager_cls, rpc_latency: float) -> NonceManager:
+    address_repo = AsyncMock(spec=IAddressRepository)
+    address_repo.find_by_public_address.side_effect = lambda address: Address(
+        public_address=address, encrypted_private_key="key")
+
+    @asynccontextmanager
+    async def repo_scope():
+        yield address_repo
+
+    async def get_transaction_count(address: str) -> int:
+        await asyncio.sleep(rpc_latency)
+        return 0
+
+    blockchain_service = AsyncMock(spec=IBlockchainService)
+    blockchain_service.get_transaction_count.side_effect = get_transaction_count
+    return manager_cls(repo_scope, blockchain_service)
+
+
+async def run(manager_cls, senders: int, allocations: int, rpc_latency: float) -> float:
+    manager = build_manager(manager_cls, rpc_latency)
+
+    async def sender(address: str) -> None:
+        for _ in range(allocations):
+            await manager.get_next_nonce(address)
+
+    started = time.perf_counter()
+    with redirect_stdout(io.StringIO()):  # Silences the per-address init log
+        await asyncio.gather(*(sender(f"0x{i:040x}") for i in range(senders)))
+    elapsed = time.perf_counter() - started
+    return senders * allocations / elapsed
+
+
+async def main(allocations: int, rpc_latency: float) -> None:
+    print(f"{'senders':>8} {'global lock (nonces/s)':>24} {'per-address (nonces/s)':>24} {'speedup':>8}")
+    for senders in SENDER_COUNTS:
+        baseline = await run(GlobalLockNonceManager, senders, allocations, rpc_latency)
+        per_address = await run(NonceManager, senders, allocations, rpc_latency)
+        print(f"{senders:>8} {baseline:>24,.0f} {per_address:>24,.0f} {per_address / baseline:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency-ms", type=float, default=50,
+                        help="Simulated eth_getTransactionCount latency")
+    parser.add_argument("--allocations", type=int, default=200,
+                        help="Nonces allocated by each sender")
+    args = parser.parse_args()
+    asyncio.run(main(args.allocations, args.latency_ms / 1000))
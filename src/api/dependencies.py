@@ -1,17 +1,89 @@
+import asyncio
 import os
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.core.interfaces import (
     IBlockchainService, IEncryptionService, ITransactionRepository,
-    IAddressRepository, INonceManager, ITransactionService, IAddressService
+    IAddressRepository, INonceManager, ITransactionService, IAddressService,
+    IConfirmationScheduler, INonceRepository, INonceCheckpointRepository, ITaskExecutor,
+    IFeeOracle, IGasLimitResolver, IAddressPool, IHDWallet, IManagedAddressIndex
 )
 from src.infra.database.config import SessionLocal
 from src.infra.blockchain.web3_service import Web3BlockchainService
+from src.infra.blockchain.rate_limiter import PriorityRateLimiter, RpcPriority, use_rpc_priority
 from src.infra.security.encryption import EncryptionService
-from src.infra.database.repositories import TransactionRepository, AddressRepository
+from src.infra.security.hd_wallet import HDWallet
+from src.infra.concurrency import BoundedExecutor
+from src.infra.database.repositories import (
+    TransactionRepository, AddressRepository, NonceRepository, NonceCheckpointRepository,
+)
 from src.infra.blockchain.nonce_manager import NonceManager
-from src.core.services import AddressService, TransactionService
+from src.infra.blockchain.database_nonce_manager import DatabaseNonceManager
+from src.core.services import (
+    AddressService, TransactionService, ConfirmationScheduler, FeeOracle, GasLimitResolver,
+    AddressPool, ManagedAddressIndex
+)
+from src.core.enums import TransactionStatus
+from src.core.constants import (
+    RPC_POOL_SIZE,
+    RPC_KEEPALIVE_TIMEOUT_SECONDS,
+    RPC_CONNECT_TIMEOUT_SECONDS,
+    RPC_REQUEST_TIMEOUT_SECONDS,
+    HEAD_POLL_INTERVAL_SECONDS,
+    HEAD_MAX_STALENESS_SECONDS,
+    MIN_CONFIRMATIONS,
+    TX_CACHE_MAX_ENTRIES,
+    TX_CACHE_MAX_BYTES,
+    RPC_HEDGE_READS,
+    RPC_HEDGE_DELAY_SECONDS,
+    RPC_COALESCED_METHODS,
+    RPC_RATE_LIMIT_PER_SECOND,
+    RPC_RATE_LIMIT_BURST,
+    RPC_BROADCAST_RATE_PER_SECOND,
+    RPC_BROADCAST_BURST,
+    RPC_USER_READ_RATE_PER_SECOND,
+    RPC_USER_READ_BURST,
+    RPC_BACKGROUND_RATE_PER_SECOND,
+    RPC_BACKGROUND_BURST,
+    CONFIRMATION_POLL_INTERVAL_SECONDS,
+    CONFIRMATION_BATCH_SIZE,
+    CONFIRMATION_MAX_CONCURRENT_BATCHES,
+    TRANSACTION_CONFIRMATION_TIMEOUT_SECONDS,
+    NONCE_WARM_UP_CONCURRENCY,
+    NONCE_REPAIR_INTERVAL_SECONDS,
+    NONCE_MANAGER_BACKEND,
+    NONCE_LEASE_SIZE,
+    NONCE_LEASE_TTL_SECONDS,
+    NONCE_RESERVATION_TTL_SECONDS,
+    NONCE_CHECKPOINTS_ENABLED,
+    NONCE_CHECKPOINT_INTERVAL_SECONDS,
+    CPU_EXECUTOR_KIND,
+    CPU_EXECUTOR_MAX_WORKERS,
+    CPU_EXECUTOR_QUEUE_SIZE,
+    DEFAULT_PRIORITY_FEE_GWEI,
+    FEE_HISTORY_BLOCKS,
+    FEE_BASE_FEE_MULTIPLIER,
+    GAS_CACHE_MAX_ENTRIES,
+    GAS_NO_CODE_TTL_SECONDS,
+    GAS_ESTIMATE_TTL_SECONDS,
+    GAS_ESTIMATE_MARGIN,
+    ADDRESS_GENERATION_CHUNK_SIZE,
+    ADDRESS_EXECUTOR_KIND,
+    ADDRESS_EXECUTOR_QUEUE_SIZE,
+    ADDRESS_POOL_ENABLED,
+    ADDRESS_POOL_LOW_WATERMARK,
+    ADDRESS_POOL_HIGH_WATERMARK,
+    ADDRESS_POOL_CHECK_INTERVAL_SECONDS,
+    ADDRESS_POOL_REFILL_LEASE_SECONDS,
+    HD_WALLET_ENABLED,
+    HD_WALLET_BASE_PATH,
+    HD_KEY_CACHE_SIZE,
+    ADDRESS_INSERT_CHUNK_SIZE,
+    ADDRESS_INDEX_REFRESH_INTERVAL_SECONDS,
+    ADDRESS_INDEX_PAGE_SIZE,
+)
 
 
 # --- Infrastructure Dependencies ---
@@ -25,17 +97,103 @@ def get_encryption_service() -> IEncryptionService:
     return EncryptionService()
 
 
-def get_blockchain_service() -> IBlockchainService:
+# --- Shared Blockchain Client ---
+# A single client per process, so every request reuses the same pooled connections.
+_blockchain_service_singleton: Optional[Web3BlockchainService] = None
+
+
+def _create_rate_limiter() -> PriorityRateLimiter:
+    def budget(name: str, rate: float, burst: float):
+        return (float(os.getenv(f"{name}_RATE_PER_SECOND", rate)),
+                float(os.getenv(f"{name}_BURST", burst)))
+
+    return PriorityRateLimiter(
+        total=(float(os.getenv("RPC_RATE_LIMIT_PER_SECOND", RPC_RATE_LIMIT_PER_SECOND)),
+               float(os.getenv("RPC_RATE_LIMIT_BURST", RPC_RATE_LIMIT_BURST))),
+        budgets={
+            RpcPriority.BROADCAST: budget(
+                "RPC_BROADCAST", RPC_BROADCAST_RATE_PER_SECOND, RPC_BROADCAST_BURST),
+            RpcPriority.USER_READ: budget(
+                "RPC_USER_READ", RPC_USER_READ_RATE_PER_SECOND, RPC_USER_READ_BURST),
+            RpcPriority.BACKGROUND: budget(
+                "RPC_BACKGROUND", RPC_BACKGROUND_RATE_PER_SECOND, RPC_BACKGROUND_BURST),
+        },
+    )
+
+
+def _create_blockchain_service() -> Web3BlockchainService:
     rpc_url = os.getenv("ETHEREUM_RPC_URL")
     if not rpc_url:
         raise ValueError("ETHEREUM_RPC_URL environment variable is not set.")
-    return Web3BlockchainService(rpc_url=rpc_url)
+    return Web3BlockchainService(
+        # Comma separated list of endpoints, the first one is the primary
+        rpc_url=rpc_url.split(','),
+        pool_size=int(os.getenv("RPC_POOL_SIZE", RPC_POOL_SIZE)),
+        keepalive_timeout=float(
+            os.getenv("RPC_KEEPALIVE_TIMEOUT_SECONDS", RPC_KEEPALIVE_TIMEOUT_SECONDS)),
+        connect_timeout=float(
+            os.getenv("RPC_CONNECT_TIMEOUT_SECONDS", RPC_CONNECT_TIMEOUT_SECONDS)),
+        request_timeout=float(
+            os.getenv("RPC_REQUEST_TIMEOUT_SECONDS", RPC_REQUEST_TIMEOUT_SECONDS)),
+        head_poll_interval=float(
+            os.getenv("HEAD_POLL_INTERVAL_SECONDS", HEAD_POLL_INTERVAL_SECONDS)),
+        head_max_staleness=float(
+            os.getenv("HEAD_MAX_STALENESS_SECONDS", HEAD_MAX_STALENESS_SECONDS)),
+        min_confirmations=int(os.getenv("MIN_CONFIRMATIONS", MIN_CONFIRMATIONS)),
+        tx_cache_max_entries=int(
+            os.getenv("TX_CACHE_MAX_ENTRIES", TX_CACHE_MAX_ENTRIES)),
+        tx_cache_max_bytes=int(
+            os.getenv("TX_CACHE_MAX_BYTES", TX_CACHE_MAX_BYTES)),
+        hedge_reads=os.getenv(
+            "RPC_HEDGE_READS", str(RPC_HEDGE_READS)).lower() == "true",
+        hedge_delay=float(
+            os.getenv("RPC_HEDGE_DELAY_SECONDS", RPC_HEDGE_DELAY_SECONDS)),
+        coalesced_methods=os.getenv(
+            "RPC_COALESCED_METHODS", ",".join(RPC_COALESCED_METHODS)).split(','),
+        rate_limiter=_create_rate_limiter(),
+    )
+
+
+async def start_blockchain_service() -> None:
+    """
+    Creates the shared blockchain client and opens its connection pool.
+    Called once from the API lifespan.
+    """
+    global _blockchain_service_singleton
+    if _blockchain_service_singleton is None:
+        _blockchain_service_singleton = _create_blockchain_service()
+    await _blockchain_service_singleton.connect()
+
+
+async def stop_blockchain_service() -> None:
+    """Closes the shared blockchain client on API shutdown."""
+    global _blockchain_service_singleton
+    if _blockchain_service_singleton is not None:
+        await _blockchain_service_singleton.close()
+        _blockchain_service_singleton = None
+
+
+def get_blockchain_service() -> IBlockchainService:
+    global _blockchain_service_singleton
+    if _blockchain_service_singleton is None:
+        # Lifespan did not run (e.g. scripts), create it on first use
+        _blockchain_service_singleton = _create_blockchain_service()
+    return _blockchain_service_singleton
 
 # --- Repository Dependencies ---
 
 
+def _create_address_repository(db: AsyncSession) -> AddressRepository:
+    # Addresses stored by this process go straight into the managed-address index
+    return AddressRepository(
+        db,
+        insert_chunk_size=int(os.getenv("ADDRESS_INSERT_CHUNK_SIZE", ADDRESS_INSERT_CHUNK_SIZE)),
+        address_index=get_address_index()
+    )
+
+
 def get_address_repository(db: AsyncSession = Depends(get_db)) -> IAddressRepository:
-    return AddressRepository(db)
+    return _create_address_repository(db)
 
 
 def get_transaction_repository(db: AsyncSession = Depends(get_db)) -> ITransactionRepository:
@@ -45,26 +203,302 @@ def get_transaction_repository(db: AsyncSession = Depends(get_db)) -> ITransacti
 # --- Cached Singleton Instance ---
 # This will hold our single NonceManager instance once created.
 _nonce_manager_singleton: Optional[INonceManager] = None
+_nonce_warm_up_task: Optional[asyncio.Task] = None
 
 
-async def get_nonce_manager(
-    address_repo: IAddressRepository = Depends(get_address_repository),
-    blockchain_service: IBlockchainService = Depends(get_blockchain_service)
-) -> INonceManager:
+@asynccontextmanager
+async def address_repository_scope() -> AsyncIterator[IAddressRepository]:
+    """Repository with its own session, for work running outside of a request."""
+    async with SessionLocal() as session:
+        yield _create_address_repository(session)
+
+
+# --- Managed Address Index ---
+# One in-memory set per process, so membership checks skip the database.
+_address_index_singleton: Optional[ManagedAddressIndex] = None
+
+
+def get_address_index() -> IManagedAddressIndex:
+    global _address_index_singleton
+    if _address_index_singleton is None:
+        _address_index_singleton = ManagedAddressIndex(
+            address_repo_factory=address_repository_scope,
+            refresh_interval=float(os.getenv(
+                "ADDRESS_INDEX_REFRESH_INTERVAL_SECONDS", ADDRESS_INDEX_REFRESH_INTERVAL_SECONDS)),
+            page_size=int(os.getenv("ADDRESS_INDEX_PAGE_SIZE", ADDRESS_INDEX_PAGE_SIZE)),
+        )
+    return _address_index_singleton
+
+
+async def start_address_index() -> int:
+    """
+    Loads every managed address on API startup, then refreshes the index in the
+    background with the addresses stored by other processes.
+    Returns the number of addresses loaded.
+    """
+    address_index = get_address_index()
+    loaded = await address_index.refresh()
+    address_index.start()
+    return loaded
+
+
+async def stop_address_index() -> None:
+    """Stops the index refreshes on API shutdown."""
+    global _address_index_singleton
+    if _address_index_singleton is not None:
+        await _address_index_singleton.stop()
+        _address_index_singleton = None
+
+
+@asynccontextmanager
+async def nonce_repository_scope() -> AsyncIterator[INonceRepository]:
+    """Repository with its own session, for work running outside of a request."""
+    async with SessionLocal() as session:
+        yield NonceRepository(session)
+
+
+@asynccontextmanager
+async def nonce_checkpoint_repository_scope() -> AsyncIterator[INonceCheckpointRepository]:
+    """Repository with its own session, for work running outside of a request."""
+    async with SessionLocal() as session:
+        yield NonceCheckpointRepository(session)
+
+
+def get_nonce_manager() -> INonceManager:
     """
     Dependency to get the singleton NonceManager instance.
-    On the first call, it creates, initializes, and caches the instance.
-    Subsequent calls will return the cached instance.
+    Nonces are fetched lazily, per address, on first use. With NONCE_MANAGER_BACKEND
+    set to "database", they are allocated from the shared database, so several
+    workers can send from the same addresses.
     """
     global _nonce_manager_singleton
     if _nonce_manager_singleton is None:
-        _nonce_manager_singleton = NonceManager(
-            address_repo=address_repo,
-            blockchain_service=blockchain_service
+        common = dict(
+            address_repo_factory=address_repository_scope,
+            blockchain_service=get_blockchain_service(),
+            warm_up_concurrency=int(os.getenv(
+                "NONCE_WARM_UP_CONCURRENCY", NONCE_WARM_UP_CONCURRENCY)),
+            repair_interval=float(os.getenv(
+                "NONCE_REPAIR_INTERVAL_SECONDS", NONCE_REPAIR_INTERVAL_SECONDS)),
+            reservation_ttl=float(os.getenv(
+                "NONCE_RESERVATION_TTL_SECONDS", NONCE_RESERVATION_TTL_SECONDS)),
         )
-        await _nonce_manager_singleton.initialize_nonces()
+        if os.getenv("NONCE_MANAGER_BACKEND", NONCE_MANAGER_BACKEND).lower() == "database":
+            _nonce_manager_singleton = DatabaseNonceManager(
+                nonce_repo_factory=nonce_repository_scope,
+                lease_size=int(os.getenv("NONCE_LEASE_SIZE", NONCE_LEASE_SIZE)),
+                lease_ttl=float(os.getenv(
+                    "NONCE_LEASE_TTL_SECONDS", NONCE_LEASE_TTL_SECONDS)),
+                **common,
+            )
+        else:
+            checkpoints = os.getenv(
+                "NONCE_CHECKPOINTS_ENABLED", str(NONCE_CHECKPOINTS_ENABLED)).lower() == "true"
+            _nonce_manager_singleton = NonceManager(
+                checkpoint_repo_factory=nonce_checkpoint_repository_scope if checkpoints else None,
+                checkpoint_interval=float(os.getenv(
+                    "NONCE_CHECKPOINT_INTERVAL_SECONDS", NONCE_CHECKPOINT_INTERVAL_SECONDS)),
+                **common,
+            )
     return _nonce_manager_singleton
 
+
+async def load_nonce_checkpoints() -> int:
+    """Loads the nonces stored before the last shutdown, returns how many were found."""
+    return await get_nonce_manager().load_checkpoints()
+
+
+def start_nonce_warm_up() -> None:
+    """Fetches every managed nonce in the background, without delaying startup."""
+    global _nonce_warm_up_task
+    _nonce_warm_up_task = asyncio.create_task(
+        get_nonce_manager().initialize_nonces())
+
+
+def start_nonce_repair() -> None:
+    """Periodically compares the managed nonces with the node's pending transaction count."""
+    with use_rpc_priority(RpcPriority.BACKGROUND):
+        get_nonce_manager().start()
+
+
+async def stop_nonce_manager() -> None:
+    """Stops the nonce repair and any warm-up still running."""
+    global _nonce_warm_up_task, _nonce_manager_singleton
+    if _nonce_manager_singleton is not None:
+        await _nonce_manager_singleton.stop()
+    if _nonce_warm_up_task is not None:
+        _nonce_warm_up_task.cancel()
+        try:
+            await _nonce_warm_up_task
+        except (asyncio.CancelledError, Exception):
+            pass
+        _nonce_warm_up_task = None
+    _nonce_manager_singleton = None
+
+_cpu_executor_singleton: Optional[BoundedExecutor] = None
+
+
+def get_cpu_executor() -> ITaskExecutor:
+    """
+    Dependency to get the shared pool for key decryption and signing.
+    CPU_EXECUTOR_KIND selects a "thread" or a "process" pool.
+    """
+    global _cpu_executor_singleton
+    if _cpu_executor_singleton is None:
+        _cpu_executor_singleton = BoundedExecutor(
+            kind=os.getenv("CPU_EXECUTOR_KIND", CPU_EXECUTOR_KIND),
+            max_workers=int(os.getenv("CPU_EXECUTOR_MAX_WORKERS", CPU_EXECUTOR_MAX_WORKERS)),
+            queue_size=int(os.getenv("CPU_EXECUTOR_QUEUE_SIZE", CPU_EXECUTOR_QUEUE_SIZE)),
+        )
+    return _cpu_executor_singleton
+
+
+def stop_cpu_executor() -> None:
+    """Shuts the CPU pool down on API shutdown."""
+    global _cpu_executor_singleton
+    if _cpu_executor_singleton is not None:
+        _cpu_executor_singleton.shutdown()
+        _cpu_executor_singleton = None
+
+
+_address_executor_singleton: Optional[BoundedExecutor] = None
+
+
+def get_address_executor() -> ITaskExecutor:
+    """
+    Dependency to get the pool generating new addresses, one worker per core
+    unless ADDRESS_EXECUTOR_MAX_WORKERS is set.
+    """
+    global _address_executor_singleton
+    if _address_executor_singleton is None:
+        _address_executor_singleton = BoundedExecutor(
+            kind=os.getenv("ADDRESS_EXECUTOR_KIND", ADDRESS_EXECUTOR_KIND),
+            max_workers=int(os.getenv("ADDRESS_EXECUTOR_MAX_WORKERS", os.cpu_count() or 1)),
+            queue_size=int(os.getenv("ADDRESS_EXECUTOR_QUEUE_SIZE", ADDRESS_EXECUTOR_QUEUE_SIZE)),
+        )
+    return _address_executor_singleton
+
+
+def stop_address_executor() -> None:
+    """Shuts the address generation pool down on API shutdown."""
+    global _address_executor_singleton
+    if _address_executor_singleton is not None:
+        _address_executor_singleton.shutdown()
+        _address_executor_singleton = None
+
+
+_hd_wallet_singleton: Optional[HDWallet] = None
+
+
+def _hd_wallet_enabled() -> bool:
+    return os.getenv("HD_WALLET_ENABLED", str(HD_WALLET_ENABLED)).lower() == "true"
+
+
+def get_hd_wallet() -> Optional[IHDWallet]:
+    """
+    Dependency to get the HD wallet deriving the managed addresses, None unless
+    HD_WALLET_ENABLED is set. HD_WALLET_ENCRYPTED_SEED holds the BIP-39 mnemonic,
+    encrypted with the ENCRYPTION_KEYS (see generate_hd_seed.py).
+    """
+    global _hd_wallet_singleton
+    if not _hd_wallet_enabled():
+        return None
+    if _hd_wallet_singleton is None:
+        encrypted_seed = os.getenv("HD_WALLET_ENCRYPTED_SEED")
+        if not encrypted_seed:
+            raise ValueError("HD_WALLET_ENCRYPTED_SEED environment variable is not set.")
+        _hd_wallet_singleton = HDWallet(
+            encrypted_mnemonic=encrypted_seed.encode(),
+            encryption_service=get_encryption_service(),
+            base_path=os.getenv("HD_WALLET_BASE_PATH", HD_WALLET_BASE_PATH),
+            cache_size=int(os.getenv("HD_KEY_CACHE_SIZE", HD_KEY_CACHE_SIZE)),
+        )
+    return _hd_wallet_singleton
+
+
+_address_pool_singleton: Optional[AddressPool] = None
+
+
+def get_address_pool() -> Optional[IAddressPool]:
+    """
+    Dependency to get the pool of pre-generated addresses, None unless
+    ADDRESS_POOL_ENABLED is set. Derived addresses need no pool, so there is none
+    in HD wallet mode.
+    """
+    global _address_pool_singleton
+    if os.getenv("ADDRESS_POOL_ENABLED", str(ADDRESS_POOL_ENABLED)).lower() != "true" or _hd_wallet_enabled():
+        return None
+    if _address_pool_singleton is None:
+        _address_pool_singleton = AddressPool(
+            address_repo_factory=address_repository_scope,
+            encryption_service=get_encryption_service(),
+            address_executor=get_address_executor(),
+            low_watermark=int(os.getenv("ADDRESS_POOL_LOW_WATERMARK", ADDRESS_POOL_LOW_WATERMARK)),
+            high_watermark=int(os.getenv("ADDRESS_POOL_HIGH_WATERMARK", ADDRESS_POOL_HIGH_WATERMARK)),
+            chunk_size=int(os.getenv("ADDRESS_GENERATION_CHUNK_SIZE", ADDRESS_GENERATION_CHUNK_SIZE)),
+            check_interval=float(os.getenv(
+                "ADDRESS_POOL_CHECK_INTERVAL_SECONDS", ADDRESS_POOL_CHECK_INTERVAL_SECONDS)),
+            lease_ttl=float(os.getenv(
+                "ADDRESS_POOL_REFILL_LEASE_SECONDS", ADDRESS_POOL_REFILL_LEASE_SECONDS)),
+        )
+    return _address_pool_singleton
+
+
+def start_address_pool() -> bool:
+    """Starts refilling the address pool in the background, if it is enabled."""
+    address_pool = get_address_pool()
+    if address_pool is None:
+        return False
+    address_pool.start()
+    return True
+
+
+async def stop_address_pool() -> None:
+    """Stops the address pool refills on API shutdown."""
+    global _address_pool_singleton
+    if _address_pool_singleton is not None:
+        await _address_pool_singleton.stop()
+        _address_pool_singleton = None
+
+_fee_oracle_singleton: Optional[FeeOracle] = None
+
+
+def get_fee_oracle() -> IFeeOracle:
+    """
+    Dependency to get the shared fee oracle, so every request reuses the
+    fee history fetched for the current block.
+    """
+    global _fee_oracle_singleton
+    if _fee_oracle_singleton is None:
+        _fee_oracle_singleton = FeeOracle(
+            blockchain_service=get_blockchain_service(),
+            block_count=int(os.getenv("FEE_HISTORY_BLOCKS", FEE_HISTORY_BLOCKS)),
+            base_fee_multiplier=float(os.getenv("FEE_BASE_FEE_MULTIPLIER", FEE_BASE_FEE_MULTIPLIER)),
+            default_priority_fee=int(os.getenv(
+                "DEFAULT_PRIORITY_FEE_GWEI", DEFAULT_PRIORITY_FEE_GWEI)) * 10**9,
+        )
+    return _fee_oracle_singleton
+
+
+_gas_limit_resolver_singleton: Optional[GasLimitResolver] = None
+
+
+def get_gas_limit_resolver() -> IGasLimitResolver:
+    """
+    Dependency to get the shared gas limit resolver, so the eth_getCode results
+    and estimates cached by one request serve the next ones.
+    """
+    global _gas_limit_resolver_singleton
+    if _gas_limit_resolver_singleton is None:
+        _gas_limit_resolver_singleton = GasLimitResolver(
+            blockchain_service=get_blockchain_service(),
+            max_entries=int(os.getenv("GAS_CACHE_MAX_ENTRIES", GAS_CACHE_MAX_ENTRIES)),
+            no_code_ttl=float(os.getenv("GAS_NO_CODE_TTL_SECONDS", GAS_NO_CODE_TTL_SECONDS)),
+            estimate_ttl=float(os.getenv("GAS_ESTIMATE_TTL_SECONDS", GAS_ESTIMATE_TTL_SECONDS)),
+            estimate_margin=float(os.getenv("GAS_ESTIMATE_MARGIN", GAS_ESTIMATE_MARGIN)),
+        )
+    return _gas_limit_resolver_singleton
+
 # --- Service Dependencies ---
 
 
@@ -74,25 +508,98 @@ def get_transaction_service(
     address_repo: IAddressRepository = Depends(get_address_repository),
     blockchain_service: IBlockchainService = Depends(get_blockchain_service),
     encryption_service: IEncryptionService = Depends(get_encryption_service),
-    nonce_manager: INonceManager = Depends(get_nonce_manager)
+    nonce_manager: INonceManager = Depends(get_nonce_manager),
+    cpu_executor: ITaskExecutor = Depends(get_cpu_executor),
+    fee_oracle: IFeeOracle = Depends(get_fee_oracle),
+    gas_limit_resolver: IGasLimitResolver = Depends(get_gas_limit_resolver),
+    hd_wallet: Optional[IHDWallet] = Depends(get_hd_wallet),
+    address_index: IManagedAddressIndex = Depends(get_address_index)
 ) -> ITransactionService:
     return TransactionService(
         transaction_repo=transaction_repo,
         address_repo=address_repo,
         blockchain_service=blockchain_service,
         encryption_service=encryption_service,
-        nonce_manager=nonce_manager
+        nonce_manager=nonce_manager,
+        cpu_executor=cpu_executor,
+        fee_oracle=fee_oracle,
+        gas_limit_resolver=gas_limit_resolver,
+        hd_wallet=hd_wallet,
+        address_index=address_index
     )
 
 
 def get_address_service(
     address_repo: IAddressRepository = Depends(get_address_repository),
-    encryption_service: IEncryptionService = Depends(get_encryption_service)
+    encryption_service: IEncryptionService = Depends(get_encryption_service),
+    address_executor: ITaskExecutor = Depends(get_address_executor),
+    address_pool: Optional[IAddressPool] = Depends(get_address_pool),
+    hd_wallet: Optional[IHDWallet] = Depends(get_hd_wallet)
 ) -> IAddressService:
     """
     Dependency that provides an AddressService instance.
     """
     return AddressService(
         address_repo=address_repo,
-        encryption_service=encryption_service
+        encryption_service=encryption_service,
+        address_executor=address_executor,
+        chunk_size=int(os.getenv("ADDRESS_GENERATION_CHUNK_SIZE", ADDRESS_GENERATION_CHUNK_SIZE)),
+        address_pool=address_pool,
+        hd_wallet=hd_wallet
     )
+
+
+# --- Confirmation Scheduler ---
+# One task monitors every pending transaction, instead of one background task each.
+_confirmation_scheduler_singleton: Optional[ConfirmationScheduler] = None
+
+
+@asynccontextmanager
+async def transaction_repository_scope() -> AsyncIterator[ITransactionRepository]:
+    """Repository with its own session, for work running outside of a request."""
+    async with SessionLocal() as session:
+        yield TransactionRepository(session)
+
+
+def get_confirmation_scheduler() -> IConfirmationScheduler:
+    global _confirmation_scheduler_singleton
+    if _confirmation_scheduler_singleton is None:
+        _confirmation_scheduler_singleton = ConfirmationScheduler(
+            blockchain_service=get_blockchain_service(),
+            transaction_repo_factory=transaction_repository_scope,
+            poll_interval=float(os.getenv(
+                "CONFIRMATION_POLL_INTERVAL_SECONDS", CONFIRMATION_POLL_INTERVAL_SECONDS)),
+            batch_size=int(os.getenv(
+                "CONFIRMATION_BATCH_SIZE", CONFIRMATION_BATCH_SIZE)),
+            max_concurrent_batches=int(os.getenv(
+                "CONFIRMATION_MAX_CONCURRENT_BATCHES", CONFIRMATION_MAX_CONCURRENT_BATCHES)),
+            timeout=float(os.getenv(
+                "TRANSACTION_CONFIRMATION_TIMEOUT_SECONDS", TRANSACTION_CONFIRMATION_TIMEOUT_SECONDS)),
+        )
+    return _confirmation_scheduler_singleton
+
+
+async def start_confirmation_scheduler() -> int:
+    """
+    Resumes monitoring of the PENDING rows left by a previous run and starts the
+    scheduler loop. Called once from the API lifespan.
+    Receipts are fetched by the loop, so a large backlog does not delay startup.
+    Returns the number of recovered transactions.
+    """
+    async with transaction_repository_scope() as transaction_repo:
+        pending = await transaction_repo.get_by_status(TransactionStatus.PENDING)
+
+    scheduler = get_confirmation_scheduler()
+    scheduler.watch_many(pending)
+
+    # Receipt polling is background work for the RPC rate limiter
+    with use_rpc_priority(RpcPriority.BACKGROUND):
+        scheduler.start()
+    return len(pending)
+
+
+async def stop_confirmation_scheduler() -> None:
+    global _confirmation_scheduler_singleton
+    if _confirmation_scheduler_singleton is not None:
+        await _confirmation_scheduler_singleton.stop()
+        _confirmation_scheduler_singleton = None
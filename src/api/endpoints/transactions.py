@@ -1,20 +1,29 @@
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query, status
+from typing import Dict, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from src.api.schemas import (
     TransactionValidateRequest,
     TransactionValidateResponse,
     TransactionCreateRequest,
     TransactionCreateResponse,
+    TransactionBatchCreateRequest,
+    TransactionBatchCreateResponse,
+    TransactionBatchItemResult,
     TransactionHistoryResponse,
     TransferDetail
 )
-from src.core.interfaces import ITransactionService
-from src.api.dependencies import get_transaction_service
+from src.core.entities import Transfer
+from src.core.interfaces import ITransactionService, IConfirmationScheduler
+from src.api.dependencies import get_transaction_service, get_confirmation_scheduler
 from web3.exceptions import Web3RPCError
 
 router = APIRouter()
 
 
+def _server_timing(timings: Dict[str, float]) -> str:
+    # Shown per request in the browser dev tools and most APM agents
+    return ", ".join(f"{stage};dur={seconds * 1000:.1f}" for stage, seconds in timings.items())
+
+
 @router.post(
     "/validate",
     response_model=TransactionValidateResponse,
@@ -55,19 +64,22 @@ async def validate_transaction(
 )
 async def create_transaction(
     request: TransactionCreateRequest,
-    background_tasks: BackgroundTasks,
-    service: ITransactionService = Depends(get_transaction_service)
+    response: Response,
+    service: ITransactionService = Depends(get_transaction_service),
+    confirmation_scheduler: IConfirmationScheduler = Depends(
+        get_confirmation_scheduler)
 ):
     try:
         pending_tx = await service.create_onchain_transaction(
             from_address=request.from_address,
             to_address=request.to_address,
             asset=request.asset,
-            value=request.value
+            value=request.value,
+            fee_tier=request.fee_tier
         )
+        response.headers["Server-Timing"] = _server_timing(service.get_stage_timings())
 
-        background_tasks.add_task(
-            service.wait_for_confirmation, pending_tx.tx_hash)
+        confirmation_scheduler.watch(pending_tx)
 
         return TransactionCreateResponse(
             status=pending_tx.status.value,
@@ -90,6 +102,47 @@ async def create_transaction(
         )
 
 
+@router.post(
+    "/create-batch",
+    response_model=TransactionBatchCreateResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Create and Broadcast a Batch of Transactions",
+    description="Creates, signs, and broadcasts many transactions at once. Transfers are grouped by sender, with consecutive nonces and a single batched broadcast per sender. Returns one result per transfer, in the order of the request."
+)
+async def create_transaction_batch(
+    request: TransactionBatchCreateRequest,
+    service: ITransactionService = Depends(get_transaction_service),
+    confirmation_scheduler: IConfirmationScheduler = Depends(
+        get_confirmation_scheduler)
+):
+    try:
+        results = await service.create_onchain_transactions([
+            Transfer(**transfer.model_dump()) for transfer in request.transfers
+        ])
+    except Web3RPCError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An error occurred with the blockchain node: {str(e)}"
+        )
+
+    pending = [result.transaction for result in results if result.transaction]
+    confirmation_scheduler.watch_many(pending)
+
+    return TransactionBatchCreateResponse(
+        broadcast=len(pending),
+        failed=len(results) - len(pending),
+        results=[
+            TransactionBatchItemResult(
+                index=index,
+                status=result.transaction.status.value if result.transaction else "failed",
+                tx_hash=result.transaction.tx_hash if result.transaction else None,
+                error=result.error
+            )
+            for index, result in enumerate(results)
+        ]
+    )
+
+
 @router.get(
     "/history",
     response_model=TransactionHistoryResponse,
@@ -1,10 +1,27 @@
+import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from dotenv import load_dotenv
 from src.api.endpoints import transactions, addresses
 from src.infra.database.config import engine
-from src.infra.database.config import Base
-from src.core.constants import API_VERSION, API_PREFIX
+from src.infra.database.schema import create_schema
+from src.api.dependencies import (
+    start_blockchain_service,
+    stop_blockchain_service,
+    start_confirmation_scheduler,
+    stop_confirmation_scheduler,
+    load_nonce_checkpoints,
+    start_nonce_warm_up,
+    start_nonce_repair,
+    stop_nonce_manager,
+    stop_cpu_executor,
+    stop_address_executor,
+    start_address_pool,
+    stop_address_pool,
+    start_address_index,
+    stop_address_index,
+)
+from src.core.constants import API_VERSION, API_PREFIX, NONCE_WARM_UP_ON_STARTUP
 
 load_dotenv()
 
@@ -19,15 +36,47 @@ async def lifespan(app: FastAPI):
 
     # Use Alembic for production
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(create_schema)
 
     print("Database tables created.")
 
+    loaded = await start_address_index()
+    print(f"Managed-address index loaded with {loaded} addresses.")
+
+    if start_address_pool():
+        print("Address pool refills started in the background.")
+
+    if os.getenv("ETHEREUM_RPC_URL"):
+        await start_blockchain_service()
+        print("Blockchain client connection pool opened.")
+
+        recovered = await start_confirmation_scheduler()
+        print(
+            f"Confirmation scheduler started, resumed monitoring of {recovered} pending transactions.")
+
+        checkpoints = await load_nonce_checkpoints()
+        print(f"Loaded {checkpoints} nonce checkpoints.")
+
+        if os.getenv("NONCE_WARM_UP_ON_STARTUP", str(NONCE_WARM_UP_ON_STARTUP)).lower() == "true":
+            start_nonce_warm_up()
+            print("Nonce warm-up started in the background.")
+
+        start_nonce_repair()
+        print("Nonce repair task started.")
+
     yield  # The API runs here
 
     # Code to run on shutdown
     print("API is shutting down...")
 
+    await stop_address_pool()
+    await stop_address_index()
+    await stop_nonce_manager()
+    await stop_confirmation_scheduler()
+    await stop_blockchain_service()
+    stop_cpu_executor()
+    stop_address_executor()
+
 
 app = FastAPI(
     title="Ethereum Interaction API",
@@ -1,5 +1,6 @@
 from .requests.addresses import AddressCreateRequest
 from .requests.transactions import (
+    TransactionBatchCreateRequest,
     TransactionCreateRequest,
     TransactionValidateRequest,
 )
@@ -9,6 +10,8 @@ from .responses.addresses import (
     AddressResponse,
 )
 from .responses.transactions import (
+    TransactionBatchCreateResponse,
+    TransactionBatchItemResult,
     TransactionCreateResponse,
     TransactionHistoryItem,
     TransactionHistoryResponse,
@@ -18,11 +21,14 @@ from .responses.transactions import (
 
 __all__ = [
     "AddressCreateRequest",
+    "TransactionBatchCreateRequest",
     "TransactionCreateRequest",
     "TransactionValidateRequest",
     "AddressCreateResponse",
     "AddressListResponse",
     "AddressResponse",
+    "TransactionBatchCreateResponse",
+    "TransactionBatchItemResult",
     "TransactionCreateResponse",
     "TransactionHistoryItem",
     "TransactionHistoryResponse",
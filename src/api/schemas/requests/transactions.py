@@ -1,6 +1,8 @@
 from pydantic import BaseModel, Field
 from decimal import Decimal
-from src.core.constants import ETH_ASSET_IDENTIFIER
+from typing import List
+from src.core.constants import ETH_ASSET_IDENTIFIER, MAX_TRANSFERS_PER_BATCH
+from src.core.enums import FeeTier
 
 
 class TransactionValidateRequest(BaseModel):
@@ -19,3 +21,11 @@ class TransactionCreateRequest(BaseModel):
                        description=f"The asset to be transferred (e.g., '{ETH_ASSET_IDENTIFIER}').")
     value: Decimal = Field(..., gt=0,
                            description="The amount to be transferred.")
+    fee_tier: FeeTier = Field(FeeTier.NORMAL,
+                              description="Inclusion speed: 'slow', 'normal' or 'fast'. Faster tiers pay a higher priority fee.")
+
+
+class TransactionBatchCreateRequest(BaseModel):
+    """Request body to create many transactions at once."""
+    transfers: List[TransactionCreateRequest] = Field(..., min_length=1, max_length=MAX_TRANSFERS_PER_BATCH,
+                                                      description=f"The transfers to be created (1-{MAX_TRANSFERS_PER_BATCH}).")
@@ -25,6 +25,21 @@ class TransactionCreateResponse(BaseModel):
     tx_hash: str
 
 
+class TransactionBatchItemResult(BaseModel):
+    """Outcome of one transfer of a batch, in the order of the request."""
+    index: int
+    status: str
+    tx_hash: Optional[str] = None
+    error: Optional[str] = None
+
+
+class TransactionBatchCreateResponse(BaseModel):
+    """Response from the batch creation endpoint."""
+    broadcast: int
+    failed: int
+    results: List[TransactionBatchItemResult]
+
+
 class TransactionHistoryItem(BaseModel):
     """Represents an item in the transaction history."""
     tx_hash: str
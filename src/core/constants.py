@@ -7,9 +7,108 @@ DEFAULT_PRIORITY_FEE_GWEI = 2
 MIN_CONFIRMATIONS = 12
 CHAIN_ID = 11155111  # Sepolia testnet
 TRANSACTION_CONFIRMATION_TIMEOUT_SECONDS = 300
+CONFIRMATION_POLL_INTERVAL_SECONDS = 2
+CONFIRMATION_BATCH_SIZE = 100  # Receipts per JSON-RPC batch, kept under provider limits
+CONFIRMATION_MAX_CONCURRENT_BATCHES = 4
+
+# RPC Client Configuration
+RPC_POOL_SIZE = 20
+RPC_KEEPALIVE_TIMEOUT_SECONDS = 30
+RPC_CONNECT_TIMEOUT_SECONDS = 5
+RPC_REQUEST_TIMEOUT_SECONDS = 10
+
+# Multi-Endpoint RPC Routing
+RPC_EWMA_ALPHA = 0.3
+RPC_LATENCY_WINDOW = 100  # Samples kept per endpoint for the p95 latency
+RPC_ERROR_RATE_THRESHOLD = 0.5
+RPC_UNHEALTHY_COOLDOWN_SECONDS = 30
+RPC_HEDGE_READS = False
+RPC_HEDGE_DELAY_SECONDS = 0.25  # Used until an endpoint has latency samples
+
+# Idempotent reads whose concurrent identical calls share one request
+RPC_COALESCED_METHODS = (
+    "eth_getTransactionByHash",
+    "eth_getTransactionReceipt",
+    "eth_blockNumber",
+    "eth_getBlockByNumber",
+    "eth_getTransactionCount",
+    "eth_getBalance",
+    "eth_getCode",
+    "eth_estimateGas",
+    "eth_feeHistory",
+)
+
+# Client-side RPC Rate Limiting (requests per second, burst)
+RPC_RATE_LIMIT_PER_SECOND = 50
+RPC_RATE_LIMIT_BURST = 100
+RPC_BROADCAST_RATE_PER_SECOND = 20
+RPC_BROADCAST_BURST = 40
+RPC_USER_READ_RATE_PER_SECOND = 40
+RPC_USER_READ_BURST = 80
+RPC_BACKGROUND_RATE_PER_SECOND = 10
+RPC_BACKGROUND_BURST = 20
+
+# Block Head Tracking
+HEAD_POLL_INTERVAL_SECONDS = 2
+HEAD_MAX_STALENESS_SECONDS = 12  # One Proof-of-Stake slot
+
+# Fee Oracle (eth_feeHistory)
+FEE_HISTORY_BLOCKS = 20
+# Reward percentile of recent blocks used as priority fee, per fee tier
+FEE_TIER_PERCENTILES = {"slow": 10, "normal": 50, "fast": 90}
+FEE_BASE_FEE_MULTIPLIER = 2  # Headroom of maxFeePerGas over the next base fee
+
+# Gas Limit Resolution
+ETH_TRANSFER_GAS = 21000  # Plain value transfer to an account without code
+GAS_CACHE_MAX_ENTRIES = 10_000
+GAS_NO_CODE_TTL_SECONDS = 3600  # An empty account may still get code deployed (CREATE2)
+GAS_ESTIMATE_TTL_SECONDS = 600
+GAS_ESTIMATE_MARGIN = 1.2  # Headroom of a per-selector estimate, arguments may cost more
+
+# Finalized Transaction Cache
+TX_CACHE_MAX_ENTRIES = 10_000
+TX_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# Nonce Management
+NONCE_WARM_UP_ON_STARTUP = False
+NONCE_WARM_UP_CONCURRENCY = 10
+NONCE_REPAIR_INTERVAL_SECONDS = 60
+NONCE_MANAGER_BACKEND = "memory"  # "memory" or "database" (several workers)
+NONCE_LEASE_SIZE = 1
+NONCE_LEASE_TTL_SECONDS = 5
+NONCE_RESERVATION_TTL_SECONDS = 300  # A reservation older than this was abandoned, repair ignores it
+NONCE_CHECKPOINTS_ENABLED = True
+NONCE_CHECKPOINT_INTERVAL_SECONDS = 1
 
 # Address Generation Limits
-MAX_ADDRESSES_TO_GENERATE = 100
+MAX_ADDRESSES_TO_GENERATE = 100  # Per POST /addresses request, all of them are returned
+MAX_ADDRESSES_TO_PROVISION = 50_000  # Per operator run of src.provision_addresses
+ADDRESS_GENERATION_CHUNK_SIZE = 500  # Addresses generated per pool task
+ADDRESS_INSERT_CHUNK_SIZE = 1000  # Rows per executemany when storing new addresses
+ADDRESS_INDEX_REFRESH_INTERVAL_SECONDS = 30  # Picks up addresses stored by other processes
+ADDRESS_INDEX_PAGE_SIZE = 10_000  # Addresses read per query when loading the index
+ADDRESS_EXECUTOR_KIND = "process"  # Key generation is pure Python, threads would share the GIL
+ADDRESS_EXECUTOR_QUEUE_SIZE = 0  # Further chunks wait for a free worker
+
+# HD Wallet (BIP-32/BIP-44)
+HD_WALLET_ENABLED = False  # One encrypted seed instead of one encrypted key per address
+HD_WALLET_BASE_PATH = "m/44'/60'/0'/0"  # Address i is derived at {base}/i
+HD_KEY_CACHE_SIZE = 1024  # Derived private keys kept in memory
+
+# Pre-generated Address Pool
+ADDRESS_POOL_ENABLED = False
+ADDRESS_POOL_LOW_WATERMARK = 100  # Refilled when fewer unassigned addresses remain
+ADDRESS_POOL_HIGH_WATERMARK = 1000  # Refilled up to this many
+ADDRESS_POOL_CHECK_INTERVAL_SECONDS = 30
+ADDRESS_POOL_REFILL_LEASE_SECONDS = 600  # One worker refills at a time, taken over once expired
+
+# CPU-Bound Work (key decryption and signing)
+CPU_EXECUTOR_KIND = "thread"  # "thread" or "process"
+CPU_EXECUTOR_MAX_WORKERS = 4
+CPU_EXECUTOR_QUEUE_SIZE = 64
+
+# Batch Transfers
+MAX_TRANSFERS_PER_BATCH = 1000
 
 # Transaction Validation
 TRANSACTION_HASH_LENGTH = 66
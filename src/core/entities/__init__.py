@@ -2,8 +2,11 @@
 
 from .transaction import Transaction
 from .address import Address
+from .transfer import Transfer, TransferResult
 
 __all__ = [
     "Transaction",
     "Address",
+    "Transfer",
+    "TransferResult",
 ]
@@ -1,7 +1,12 @@
+from typing import Optional
 from pydantic import BaseModel, ConfigDict
+from ..enums import AddressStatus
 
 
 class Address(BaseModel):
     model_config = ConfigDict(from_attributes=True)
     public_address: str
     encrypted_private_key: str
+    status: AddressStatus = AddressStatus.ASSIGNED
+    # Set for addresses derived from the HD wallet seed, which store no key
+    derivation_index: Optional[int] = None
@@ -0,0 +1,21 @@
+from decimal import Decimal
+from typing import Optional
+from pydantic import BaseModel
+from .transaction import Transaction
+from ..enums import FeeTier
+
+
+class Transfer(BaseModel):
+    """A transfer to be signed and broadcast, as part of a batch."""
+    from_address: str
+    to_address: str
+    asset: str
+    value: Decimal
+    fee_tier: FeeTier = FeeTier.NORMAL
+
+
+class TransferResult(BaseModel):
+    """Outcome of one transfer of a batch: the pending transaction, or the error."""
+    transfer: Transfer
+    transaction: Optional[Transaction] = None
+    error: Optional[str] = None
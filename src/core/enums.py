@@ -7,3 +7,16 @@ class TransactionStatus(str, enum.Enum):
     CONFIRMED = "confirmed"
     FAILED = "failed"
     VALIDATED = "validated"
+
+
+class AddressStatus(str, enum.Enum):
+    """Pre-generated addresses wait in the pool as unassigned until handed out."""
+    UNASSIGNED = "unassigned"
+    ASSIGNED = "assigned"
+
+
+class FeeTier(str, enum.Enum):
+    """Inclusion speed requested for a transaction, mapped to a priority fee percentile."""
+    SLOW = "slow"
+    NORMAL = "normal"
+    FAST = "fast"
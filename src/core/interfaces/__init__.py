@@ -5,8 +5,17 @@ from .i_transaction_repository import ITransactionRepository
 from .i_encryption_service import IEncryptionService
 from .i_blockchain_service import IBlockchainService
 from .i_nonce_manager import INonceManager
+from .i_nonce_repository import INonceRepository
+from .i_nonce_checkpoint_repository import INonceCheckpointRepository
 from .i_transaction_service import ITransactionService
 from .i_address_service import IAddressService
+from .i_confirmation_scheduler import IConfirmationScheduler
+from .i_task_executor import ITaskExecutor
+from .i_fee_oracle import IFeeOracle
+from .i_gas_limit_resolver import IGasLimitResolver
+from .i_address_pool import IAddressPool
+from .i_hd_wallet import IHDWallet
+from .i_managed_address_index import IManagedAddressIndex
 
 __all__ = [
     "IAddressRepository",
@@ -14,6 +23,15 @@ __all__ = [
     "IEncryptionService",
     "IBlockchainService",
     "INonceManager",
+    "INonceRepository",
+    "INonceCheckpointRepository",
     "ITransactionService",
     "IAddressService",
+    "IConfirmationScheduler",
+    "ITaskExecutor",
+    "IFeeOracle",
+    "IGasLimitResolver",
+    "IAddressPool",
+    "IHDWallet",
+    "IManagedAddressIndex",
 ]
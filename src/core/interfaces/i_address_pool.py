@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+
+
+class IAddressPool(ABC):
+    """
+    Interface for the pool of pre-generated addresses, kept between a low and
+    a high watermark so new addresses can be handed out without generating keys.
+    """
+
+    @abstractmethod
+    def request_refill(self) -> None:
+        """Wakes the background task up to check the pool, e.g. after a handout."""
+        pass
+
+    @abstractmethod
+    async def refill(self) -> int:
+        """
+        Tops the pool up to the high watermark if it fell below the low one.
+        Returns the number of addresses added.
+        """
+        pass
+
+    @abstractmethod
+    def start(self) -> None:
+        pass
+
+    @abstractmethod
+    async def stop(self) -> None:
+        pass
@@ -1,18 +1,68 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from ..entities import Address
 
 
 class IAddressRepository(ABC):
     @abstractmethod
     async def create_many(self, addresses: List[Address]) -> None:
+        """
+        Stores new addresses in one transaction.
+        Raises ValueError if one of them already exists, listing the duplicates
+        of each chunk, and then stores none of them.
+        """
+        pass
+
+    @abstractmethod
+    async def list_public_addresses(self, after_id: int, limit: int) -> List[Tuple[int, str]]:
+        """
+        Returns up to `limit` (id, public address) pairs of the assigned rows
+        stored after `after_id`, in id order. Pooled addresses are left out.
+        """
         pass
 
     @abstractmethod
     async def get_all(self) -> List[Address]:
+        """Returns the addresses handed out, pooled addresses are left out."""
+        pass
+
+    @abstractmethod
+    async def count_unassigned(self) -> int:
+        """Counts the pre-generated addresses waiting in the pool."""
+        pass
+
+    @abstractmethod
+    async def oldest_unassigned_id(self) -> Optional[int]:
+        """Returns the lowest id still waiting in the pool, None if the pool is empty."""
+        pass
+
+    @abstractmethod
+    async def assign_unassigned(self, count: int) -> List[Address]:
+        """
+        Marks up to `count` pooled addresses as assigned and returns them.
+        Fewer are returned if the pool runs short.
+        """
+        pass
+
+    @abstractmethod
+    async def acquire_refill_lease(self, holder: str, ttl: float, now: float) -> bool:
+        """
+        Takes the pool refill lease for `ttl` seconds, shared by every worker on
+        the database. Returns False while another holder has it and it has not expired.
+        """
+        pass
+
+    @abstractmethod
+    async def release_refill_lease(self, holder: str) -> None:
+        """Gives the pool refill lease back, if `holder` still has it."""
+        pass
+
+    @abstractmethod
+    async def next_derivation_index(self) -> int:
+        """Returns the first HD wallet index not used by a stored address."""
         pass
 
     @abstractmethod
     async def find_by_public_address(self, public_address: str) -> Optional[Address]:
-        """Finds a single address by its public key."""
+        """Finds a single assigned address by its public key, pooled ones are left out."""
         pass
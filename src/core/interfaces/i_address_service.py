@@ -17,6 +17,14 @@ class IAddressService(ABC):
         """
         pass
 
+    @abstractmethod
+    async def provision_addresses(self, count: int) -> int:
+        """
+        Bulk variant for operators, allowing far larger counts. Only the number
+        of addresses created is returned.
+        """
+        pass
+
     @abstractmethod
     async def get_all_addresses(self) -> List[Address]:
         """
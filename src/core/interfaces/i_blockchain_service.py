@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 
 class IBlockchainService(ABC):
@@ -25,11 +25,42 @@ class IBlockchainService(ABC):
     async def get_latest_block_number(self) -> int:
         pass
 
+    @abstractmethod
+    async def batch_call(self, calls: List[Tuple[str, List[Any]]]) -> List[Any]:
+        """
+        Sends several JSON-RPC calls (method name and params) in a single request.
+        Returns the results in the same order, with None for null results.
+        """
+        pass
+
+    @abstractmethod
+    async def get_transaction_with_receipt(
+        self, tx_hash: str
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]], int]:
+        """
+        Fetches the transaction, its receipt and the latest block number
+        in a single round trip.
+        """
+        pass
+
     @abstractmethod
     async def get_base_fee(self) -> int:
         """Gets the base fee for the latest block in Wei format."""
         pass
 
+    @abstractmethod
+    async def get_fee_history(self, block_count: int, reward_percentiles: List[float]) -> Dict[str, Any]:
+        """
+        Gets the base fees and the priority fee percentiles of the latest blocks
+        (eth_feeHistory). The last base fee is the one of the next block.
+        """
+        pass
+
+    @abstractmethod
+    async def get_code(self, address: str) -> bytes:
+        """Gets the code deployed at an address, empty for externally owned accounts."""
+        pass
+
     @abstractmethod
     async def estimate_gas(self, transaction: Dict[str, Any]) -> int:
         pass
@@ -39,6 +70,14 @@ class IBlockchainService(ABC):
         """Broadcasts a signed transaction to the network."""
         pass
 
+    @abstractmethod
+    async def broadcast_transactions(self, signed_txs_hex: List[str]) -> List[Union[str, Exception]]:
+        """
+        Broadcasts several signed transactions in a single JSON-RPC batch.
+        Returns the hash of each transaction, or the error the node returned for it.
+        """
+        pass
+
     @abstractmethod
     async def get_eth_balance(self, address: str) -> int:
         """Gets the ETH balance of an address in Wei format."""
@@ -50,14 +89,15 @@ class IBlockchainService(ABC):
         pass
 
     @abstractmethod
-    async def get_transaction_count(self, address: str) -> int:
-        """Gets the transaction count (nonce) for a given address."""
+    def decode_transaction_input(self, tx_details: Dict[str, Any], contract_abi: List[Dict]) -> Optional[Dict[str, Any]]:
+        """Decodes the input data of an already fetched contract interaction."""
         pass
 
     @abstractmethod
-    async def wait_for_transaction_receipt(self, tx_hash: str, timeout: int) -> Optional[Dict[str, Any]]:
+    async def get_transaction_count(self, address: str, block_identifier: str = "latest") -> int:
         """
-        Waits for a transaction receipt to be available and returns it.
-        Returns None if the timeout is reached.
+        Gets the transaction count (nonce) for a given address.
+        With "pending", transactions waiting in the node's mempool are counted too.
         """
         pass
+
@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from typing import List
+from ..entities import Transaction
+
+
+class IConfirmationScheduler(ABC):
+    """
+    Interface for the single monitor of pending transactions, replacing one
+    background waiter per transaction.
+    """
+
+    @abstractmethod
+    def watch(self, transaction: Transaction) -> None:
+        """Adds a pending transaction to the set checked on every new block."""
+        pass
+
+    @abstractmethod
+    def watch_many(self, transactions: List[Transaction]) -> None:
+        """
+        Resumes monitoring of transactions left pending by a previous run.
+        They are checked on the next poll, without waiting for a new block.
+        """
+        pass
+
+    @abstractmethod
+    def start(self) -> None:
+        pass
+
+    @abstractmethod
+    async def stop(self) -> None:
+        pass
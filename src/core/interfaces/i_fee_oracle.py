@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import Dict
+from ..enums import FeeTier
+
+
+class IFeeOracle(ABC):
+    """
+    Interface for the source of EIP-1559 fees, by requested inclusion speed.
+    """
+
+    @abstractmethod
+    async def get_fees(self, tier: FeeTier = FeeTier.NORMAL) -> Dict[str, int]:
+        """
+        Returns the maxFeePerGas and maxPriorityFeePerGas, in Wei, for the tier.
+        """
+        pass
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+
+
+class IGasLimitResolver(ABC):
+    """
+    Interface for the source of the gas limit of outgoing transactions.
+    """
+
+    @abstractmethod
+    async def resolve(self, transaction: Dict[str, Any]) -> int:
+        """
+        Returns the gas limit for the transaction, without calling eth_estimateGas
+        when it is already known.
+        """
+        pass
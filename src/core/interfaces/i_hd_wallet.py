@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+
+class IHDWallet(ABC):
+    """
+    Interface for hierarchical deterministic (BIP-32/BIP-44) key derivation,
+    where every managed key is derived from one seed by its index.
+    It is synchronous because derivation is CPU-bound.
+    """
+
+    @abstractmethod
+    def derive_addresses(self, start: int, count: int) -> List[str]:
+        """Returns the addresses of indexes start to start + count - 1."""
+        pass
+
+    @abstractmethod
+    def derive_private_key(self, index: int) -> bytes:
+        """Returns the private key of an index."""
+        pass
@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+
+class IManagedAddressIndex(ABC):
+    """
+    Interface for the in-memory set of managed addresses, answering membership
+    checks without a database round trip.
+    """
+
+    @abstractmethod
+    def is_managed(self, address: str) -> bool:
+        """Returns whether the address, in any letter case, belongs to this service."""
+        pass
+
+    @abstractmethod
+    def add(self, addresses: Iterable[str]) -> None:
+        """Adds addresses stored by this process, without waiting for a refresh."""
+        pass
+
+    @abstractmethod
+    async def refresh(self) -> int:
+        """
+        Loads the addresses stored or assigned since the last refresh, e.g. by
+        other processes. Returns the number of addresses added.
+        """
+        pass
+
+    @abstractmethod
+    def start(self) -> None:
+        pass
+
+    @abstractmethod
+    async def stop(self) -> None:
+        pass
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from typing import Dict
+
+
+class INonceCheckpointRepository(ABC):
+    """
+    Checkpoints of the in-memory NonceManager, the next nonce per address as it
+    was last flushed. Kept apart from the shared counters of INonceRepository.
+    """
+
+    @abstractmethod
+    async def get_all(self) -> Dict[str, int]:
+        pass
+
+    @abstractmethod
+    async def save_many(self, nonces: Dict[str, int]) -> None:
+        """Stores the next nonce of several addresses in a single transaction."""
+        pass
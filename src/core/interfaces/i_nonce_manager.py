@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List
 
 
 class INonceManager(ABC):
@@ -10,9 +11,8 @@ class INonceManager(ABC):
     @abstractmethod
     async def initialize_nonces(self) -> None:
         """
-        Initializes the manager by fetching the current nonce for all
-        managed sending addresses from the blockchain.
-        Important when restart the API.
+        Optional warm-up that fetches the current nonce of every managed
+        address ahead of time. Nonces are otherwise fetched on first use.
         """
         pass
 
@@ -23,3 +23,42 @@ class INonceManager(ABC):
         the internal counter for the next call.
         """
         pass
+
+    @abstractmethod
+    async def reserve_nonce(self, address: str) -> int:
+        """
+        Reserves a nonce for a transaction about to be sent. Nonces released by
+        failed attempts are handed out first, so no gap is left behind.
+        """
+        pass
+
+    @abstractmethod
+    async def reserve_nonces(self, address: str, count: int) -> List[int]:
+        """Reserves several nonces at once, for a batch of transactions from one sender."""
+        pass
+
+    @abstractmethod
+    async def commit_nonce(self, address: str, nonce: int) -> None:
+        """Marks a reserved nonce as used, once the transaction was broadcast."""
+        pass
+
+    @abstractmethod
+    async def release_nonce(self, address: str, nonce: int) -> None:
+        """Returns a reserved nonce whose transaction was never broadcast."""
+        pass
+
+    @abstractmethod
+    async def repair_nonce(self, address: str) -> None:
+        """
+        Repairs a single address at once, e.g. after the node reported that a
+        nonce handed out was already used.
+        """
+        pass
+
+    @abstractmethod
+    async def repair_nonces(self) -> None:
+        """
+        Compares the local state with the node's pending transaction count and
+        fixes the nonces of addresses that drifted or were left with a gap.
+        """
+        pass
@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class INonceRepository(ABC):
+    """
+    Shared nonce counters, one per address, holding the next nonce not yet
+    handed out by any instance of the service.
+    """
+
+    @abstractmethod
+    async def get(self, address: str) -> Optional[int]:
+        pass
+
+    @abstractmethod
+    async def initialize(self, address: str, nonce: int) -> None:
+        """Creates the counter of an address, or moves an existing one up to `nonce`."""
+        pass
+
+    @abstractmethod
+    async def allocate(self, address: str, count: int = 1) -> int:
+        """
+        Atomically reserves `count` consecutive nonces and returns the first one.
+        Raises ValueError if the address has no counter.
+        """
+        pass
+
+    @abstractmethod
+    async def advance_to(self, address: str, nonce: int) -> None:
+        """Moves the counter up to `nonce`, it never goes back."""
+        pass
+
+    @abstractmethod
+    async def give_back(self, address: str, start: int, end: int) -> bool:
+        """
+        Returns the unused range [start, end) if nothing was allocated after it.
+        Returns whether the counter was moved back.
+        """
+        pass
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from typing import Any, Callable
+
+
+class ITaskExecutor(ABC):
+    """
+    Interface for running CPU-bound work (key decryption, signing) off the event loop.
+    """
+
+    @abstractmethod
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Runs `func(*args)` on a worker and returns its result."""
+        pass
+
+    @abstractmethod
+    def shutdown(self) -> None:
+        pass
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List
 from ..entities import Address, Transaction
+from ..enums import TransactionStatus
 
 
 class ITransactionRepository(ABC):
@@ -8,10 +9,20 @@ class ITransactionRepository(ABC):
     async def create(self, transaction) -> None:
         pass
 
+    @abstractmethod
+    async def create_many(self, transactions: List[Transaction]) -> None:
+        """Stores many transactions with one bulk insert."""
+        pass
+
     @abstractmethod
     async def update(self, transaction: Transaction) -> None:
         pass
 
+    @abstractmethod
+    async def update_many(self, transactions: List[Transaction]) -> None:
+        """Updates the status and effective cost of many transactions in one commit."""
+        pass
+
     @abstractmethod
     async def find_by_hash(self, tx_hash: str):
         pass
@@ -23,3 +34,7 @@ class ITransactionRepository(ABC):
     @abstractmethod
     async def get_all(self) -> List[Address]:
         pass
+
+    @abstractmethod
+    async def get_by_status(self, status: TransactionStatus) -> List[Transaction]:
+        pass
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import List, Optional
-from ..entities import Transaction
+from typing import Dict, List, Optional
+from ..entities import Transaction, Transfer, TransferResult
+from ..enums import FeeTier
 
 
 class ITransactionService(ABC):
@@ -23,33 +24,42 @@ class ITransactionService(ABC):
         from_address: str,
         to_address: str,
         asset: str,
-        value: Decimal
+        value: Decimal,
+        fee_tier: FeeTier = FeeTier.NORMAL
     ) -> Transaction:
         """
-        Creates, signs, and broadcasts a new transaction.
+        Creates, signs, and broadcasts a new transaction, with the fees of the tier.
         Returns the pending transaction entity.
         """
         pass
 
     @abstractmethod
-    # Changed method name
-    async def get_all_transaction_history(self) -> List[Transaction]:
+    def get_stage_timings(self) -> Dict[str, float]:
         """
-        Retrieves the full history of all managed transactions.
+        Returns the duration in seconds of each stage of the last transaction
+        created by this instance, e.g. {"lookup": 0.002, "fees": 0.041, ...}.
         """
         pass
 
     @abstractmethod
-    async def get_transaction_history_for_address(self, address: str) -> List[Transaction]:
+    async def create_onchain_transactions(self, transfers: List[Transfer]) -> List[TransferResult]:
         """
-        Retrierives the history of managed transactions filtered by a specific Ethereum address.
+        Creates, signs, and broadcasts a batch of transactions, grouped by sender.
+        Returns one result per transfer, in the same order.
         """
         pass
 
     @abstractmethod
-    async def wait_for_confirmation(self, tx_hash: str) -> None:
+    # Changed method name
+    async def get_all_transaction_history(self) -> List[Transaction]:
         """
-        Waits for a transaction to be confirmed on the blockchain and updates its
-        status and effective cost in the database.
+        Retrieves the full history of all managed transactions.
+        """
+        pass
+
+    @abstractmethod
+    async def get_transaction_history_for_address(self, address: str) -> List[Transaction]:
+        """
+        Retrierives the history of managed transactions filtered by a specific Ethereum address.
         """
         pass
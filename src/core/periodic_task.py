@@ -0,0 +1,62 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Optional
+
+
+class PeriodicTask:
+    """
+    Runs `step` in a background task every `interval` seconds, until stopped.
+
+    With `run_first` the first step runs as soon as the task starts, otherwise
+    after one interval. An error in a step is printed after `error_message` and
+    the next step still runs. `wake` runs the next step at once instead of at
+    the end of the interval.
+    """
+
+    def __init__(
+        self,
+        step: Callable[[], Awaitable[Any]],
+        interval: float,
+        error_message: str,
+        run_first: bool = True,
+    ):
+        self.step = step
+        self.interval = interval
+        self.error_message = error_message
+        self.run_first = run_first
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    async def _wait(self) -> None:
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=self.interval)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _run(self) -> None:
+        if not self.run_first:
+            await self._wait()
+        while True:
+            self._wake.clear()
+            try:
+                await self.step()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"{self.error_message}: {e}")
+            await self._wait()
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -2,8 +2,18 @@
 
 from .address_service import AddressService
 from .transaction_service import TransactionService
+from .confirmation_scheduler import ConfirmationScheduler
+from .fee_oracle import FeeOracle
+from .gas_limit_resolver import GasLimitResolver
+from .address_pool import AddressPool
+from .managed_address_index import ManagedAddressIndex
 
 __all__ = [
     "AddressService",
     "TransactionService",
+    "ConfirmationScheduler",
+    "FeeOracle",
+    "GasLimitResolver",
+    "AddressPool",
+    "ManagedAddressIndex",
 ]
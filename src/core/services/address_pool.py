@@ -0,0 +1,98 @@
+import time
+import uuid
+from typing import AsyncContextManager, Callable, Optional
+from ..entities import Address
+from ..enums import AddressStatus
+from ..interfaces import IAddressPool, IAddressRepository, IEncryptionService, ITaskExecutor
+from ..constants import (
+    ADDRESS_GENERATION_CHUNK_SIZE,
+    ADDRESS_POOL_LOW_WATERMARK,
+    ADDRESS_POOL_HIGH_WATERMARK,
+    ADDRESS_POOL_CHECK_INTERVAL_SECONDS,
+    ADDRESS_POOL_REFILL_LEASE_SECONDS,
+)
+from ..periodic_task import PeriodicTask
+from .address_service import generate_addresses
+
+
+class AddressPool(IAddressPool):
+    """
+    Keeps pre-generated, encrypted addresses in the addresses table as unassigned.
+
+    A background task checks the pool every `check_interval`, or as soon as
+    addresses are handed out, and once fewer than `low_watermark` remain it
+    generates enough to reach `high_watermark`, on the address executor. Handing
+    out an address is then a single UPDATE of pooled rows. Workers sharing the
+    database refill one at a time, under a lease held for at most `lease_ttl`.
+    """
+
+    def __init__(
+        self,
+        address_repo_factory: Callable[[], AsyncContextManager[IAddressRepository]],
+        encryption_service: IEncryptionService,
+        address_executor: Optional[ITaskExecutor] = None,
+        low_watermark: int = ADDRESS_POOL_LOW_WATERMARK,
+        high_watermark: int = ADDRESS_POOL_HIGH_WATERMARK,
+        chunk_size: int = ADDRESS_GENERATION_CHUNK_SIZE,
+        check_interval: float = ADDRESS_POOL_CHECK_INTERVAL_SECONDS,
+        lease_ttl: float = ADDRESS_POOL_REFILL_LEASE_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        if not 0 <= low_watermark <= high_watermark:
+            raise ValueError("Address pool watermarks must satisfy 0 <= low <= high.")
+        self.address_repo_factory = address_repo_factory
+        self.encryption_service = encryption_service
+        self.address_executor = address_executor
+        self.low_watermark = low_watermark
+        self.high_watermark = high_watermark
+        self.chunk_size = chunk_size
+        self.check_interval = check_interval
+        self.lease_ttl = lease_ttl
+        self.clock = clock
+        self._holder = uuid.uuid4().hex
+        self._task = PeriodicTask(
+            self._refill_and_report, check_interval, "ADDRESS POOL ERROR: Could not refill the pool")
+
+    def request_refill(self) -> None:
+        self._task.wake()
+
+    async def refill(self) -> int:
+        async with self.address_repo_factory() as address_repo:
+            available = await address_repo.count_unassigned()
+            if available >= self.low_watermark:
+                return 0
+            # Without the lease every worker would top the pool up on its own
+            if not await address_repo.acquire_refill_lease(self._holder, self.lease_ttl, self.clock()):
+                return 0
+
+        try:
+            async with self.address_repo_factory() as address_repo:
+                # Another worker may have refilled it just before the lease was taken
+                available = await address_repo.count_unassigned()
+            if available >= self.low_watermark:
+                return 0
+
+            generated = await generate_addresses(
+                self.encryption_service, self.high_watermark - available,
+                self.address_executor, self.chunk_size)
+            async with self.address_repo_factory() as address_repo:
+                await address_repo.create_many([
+                    Address(public_address=public_address, encrypted_private_key=encrypted_key,
+                            status=AddressStatus.UNASSIGNED)
+                    for public_address, encrypted_key in generated
+                ])
+            return len(generated)
+        finally:
+            async with self.address_repo_factory() as address_repo:
+                await address_repo.release_refill_lease(self._holder)
+
+    async def _refill_and_report(self) -> None:
+        added = await self.refill()
+        if added:
+            print(f"ADDRESS POOL: Added {added} pre-generated addresses.")
+
+    def start(self) -> None:
+        self._task.start()
+
+    async def stop(self) -> None:
+        await self._task.stop()
@@ -1,13 +1,59 @@
-from typing import List
+import asyncio
+from typing import List, Optional, Tuple
 from eth_account import Account
 from ..entities import Address
-from ..constants import MAX_ADDRESSES_TO_GENERATE
+from ..constants import (
+    MAX_ADDRESSES_TO_GENERATE,
+    MAX_ADDRESSES_TO_PROVISION,
+    ADDRESS_GENERATION_CHUNK_SIZE,
+)
 from ..interfaces import (
     IAddressRepository,
     IEncryptionService,
-    IAddressService
+    IAddressService,
+    ITaskExecutor,
+    IAddressPool,
+    IHDWallet
 )
 
+# Attempts to claim a range of HD indexes when other requests take it first
+HD_INDEX_ATTEMPTS = 3
+
+
+def generate_encrypted_addresses(encryption_service: IEncryptionService, count: int) -> List[Tuple[str, str]]:
+    """
+    Generates key pairs and encrypts their private keys, returning (address, encrypted key)
+    pairs. A module-level function so it can run in a process pool.
+    """
+    generated = []
+    for _ in range(count):
+        # Generate a new key pair in memory
+        new_account = Account.create()
+        # Encrypt the private key immediately, stored as string
+        encrypted_key = encryption_service.encrypt(new_account.key)
+        generated.append((new_account.address, encrypted_key.decode('utf-8')))
+    return generated
+
+
+async def generate_addresses(
+    encryption_service: IEncryptionService,
+    count: int,
+    executor: Optional[ITaskExecutor] = None,
+    chunk_size: int = ADDRESS_GENERATION_CHUNK_SIZE
+) -> List[Tuple[str, str]]:
+    """
+    Generates `count` encrypted addresses off the event loop, in chunks run in
+    parallel by the executor (a thread when there is none).
+    """
+    async def generate_chunk(size: int) -> List[Tuple[str, str]]:
+        if executor is None:
+            return await asyncio.to_thread(generate_encrypted_addresses, encryption_service, size)
+        return await executor.run(generate_encrypted_addresses, encryption_service, size)
+
+    chunks = [min(chunk_size, count - start) for start in range(0, count, chunk_size)]
+    generated = await asyncio.gather(*(generate_chunk(size) for size in chunks))
+    return [pair for chunk in generated for pair in chunk]
+
 
 class AddressService(IAddressService):
     """
@@ -17,35 +63,79 @@ class AddressService(IAddressService):
     def __init__(
         self,
         address_repo: IAddressRepository,
-        encryption_service: IEncryptionService
+        encryption_service: IEncryptionService,
+        address_executor: Optional[ITaskExecutor] = None,
+        chunk_size: int = ADDRESS_GENERATION_CHUNK_SIZE,
+        address_pool: Optional[IAddressPool] = None,
+        hd_wallet: Optional[IHDWallet] = None
     ):
         self.address_repo = address_repo
         self.encryption_service = encryption_service
+        self.address_executor = address_executor
+        self.chunk_size = chunk_size
+        self.address_pool = address_pool
+        self.hd_wallet = hd_wallet
 
-    def _create_and_encrypt_address(self) -> Address:
-        # Generate a new key pair in memory
-        new_account = Account.create()
-
-        # Encrypt the private key immediately
-        private_key_bytes = new_account.key
-        encrypted_key = self.encryption_service.encrypt(private_key_bytes)
+    async def _run_cpu_bound(self, func, *args):
+        if self.address_executor is None:
+            return await asyncio.to_thread(func, *args)
+        return await self.address_executor.run(func, *args)
 
-        # Create the address entity
-        return Address(
-            public_address=new_account.address,
-            encrypted_private_key=encrypted_key.decode(
-                'utf-8')  # Store as string
-        )
+    async def _create_derived_addresses(self, count: int) -> List[Address]:
+        for attempt in range(HD_INDEX_ATTEMPTS):
+            start = await self.address_repo.next_derivation_index()
+            chunks = range(start, start + count, self.chunk_size)
+            derived = await asyncio.gather(*(
+                self._run_cpu_bound(self.hd_wallet.derive_addresses, chunk_start,
+                                    min(self.chunk_size, start + count - chunk_start))
+                for chunk_start in chunks
+            ))
+            new_addresses = [
+                # Only the index is stored, the key is derived again when signing
+                Address(public_address=public_address, encrypted_private_key='',
+                        derivation_index=start + offset)
+                for offset, public_address in enumerate(
+                    address for chunk in derived for address in chunk)
+            ]
+            try:
+                await self.address_repo.create_many(new_addresses)
+                return new_addresses
+            except ValueError:
+                # The unique index rejected indexes claimed concurrently, read the next free one
+                if attempt == HD_INDEX_ATTEMPTS - 1:
+                    raise
 
     async def create_new_addresses(self, count: int) -> List[Address]:
-        if not 0 < count <= MAX_ADDRESSES_TO_GENERATE:  # Basic validation
+        return await self._create_addresses(count, MAX_ADDRESSES_TO_GENERATE)
+
+    async def provision_addresses(self, count: int) -> int:
+        return len(await self._create_addresses(count, MAX_ADDRESSES_TO_PROVISION))
+
+    async def _create_addresses(self, count: int, max_count: int) -> List[Address]:
+        if not 0 < count <= max_count:  # Basic validation
             raise ValueError(
-                f"Number of addresses to create must be between 1 and {MAX_ADDRESSES_TO_GENERATE}."
+                f"Number of addresses to create must be between 1 and {max_count}."
             )
 
-        new_addresses = [self._create_and_encrypt_address()
-                         for _ in range(count)]
-        await self.address_repo.create_many(new_addresses)
+        if self.hd_wallet is not None:
+            new_addresses = await self._create_derived_addresses(count)
+            return [Address(public_address=addr.public_address, encrypted_private_key='') for addr in new_addresses]
+
+        new_addresses: List[Address] = []
+        if self.address_pool is not None:
+            # Pre-generated addresses only need to be marked as assigned
+            new_addresses = await self.address_repo.assign_unassigned(count)
+            self.address_pool.request_refill()
+
+        missing = count - len(new_addresses)
+        if missing:
+            generated = [
+                Address(public_address=public_address, encrypted_private_key=encrypted_key)
+                for public_address, encrypted_key in await generate_addresses(
+                    self.encryption_service, missing, self.address_executor, self.chunk_size)
+            ]
+            await self.address_repo.create_many(generated)
+            new_addresses += generated
 
         # Return only the public parts of the addresses
         return [Address(public_address=addr.public_address, encrypted_private_key='') for addr in new_addresses]
@@ -0,0 +1,125 @@
+import asyncio
+import time
+from typing import AsyncContextManager, Callable, Dict, List, Optional, Tuple
+from ..entities import Transaction
+from ..enums import TransactionStatus
+from ..interfaces import IBlockchainService, IConfirmationScheduler, ITransactionRepository
+from ..constants import (
+    CONFIRMATION_POLL_INTERVAL_SECONDS,
+    CONFIRMATION_BATCH_SIZE,
+    CONFIRMATION_MAX_CONCURRENT_BATCHES,
+    TRANSACTION_CONFIRMATION_TIMEOUT_SECONDS,
+)
+from ..periodic_task import PeriodicTask
+from .transaction_service import apply_receipt
+
+
+class ConfirmationScheduler(IConfirmationScheduler):
+    """
+    Monitors every pending transaction from a single task.
+
+    Once per new block, the receipts of all pending transactions are fetched in
+    JSON-RPC batches and the resulting statuses are written with one bulk update,
+    so the RPC load follows the number of blocks, not of pending transactions.
+    """
+
+    def __init__(
+        self,
+        blockchain_service: IBlockchainService,
+        transaction_repo_factory: Callable[[], AsyncContextManager[ITransactionRepository]],
+        poll_interval: float = CONFIRMATION_POLL_INTERVAL_SECONDS,
+        batch_size: int = CONFIRMATION_BATCH_SIZE,
+        max_concurrent_batches: int = CONFIRMATION_MAX_CONCURRENT_BATCHES,
+        timeout: float = TRANSACTION_CONFIRMATION_TIMEOUT_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.blockchain_service = blockchain_service
+        self.transaction_repo_factory = transaction_repo_factory
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.max_concurrent_batches = max_concurrent_batches
+        self.timeout = timeout
+        self._clock = clock
+        # Pending transactions by hash, with the deadline to get a receipt
+        self._pending: Dict[str, Tuple[Transaction, float]] = {}
+        self._last_checked_block: Optional[int] = None
+        self._task = PeriodicTask(
+            self.poll_once, poll_interval,
+            "CONFIRMATION SCHEDULER ERROR: Could not check pending transactions")
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def watch(self, transaction: Transaction) -> None:
+        print(f"CONFIRMATION SCHEDULER: Started monitoring tx_hash: {transaction.tx_hash}")
+        self._pending[transaction.tx_hash] = (
+            transaction, self._clock() + self.timeout)
+
+    def watch_many(self, transactions: List[Transaction]) -> None:
+        deadline = self._clock() + self.timeout
+        for transaction in transactions:
+            self._pending[transaction.tx_hash] = (transaction, deadline)
+        # Checked on the next poll even if no new block was produced
+        self._last_checked_block = None
+
+    async def _fetch_receipts(self, tx_hashes: List[str]) -> List[Optional[dict]]:
+        # Bounded, so a large backlog does not flood the node
+        semaphore = asyncio.Semaphore(self.max_concurrent_batches)
+
+        async def fetch_batch(batch: List[str]) -> List[Optional[dict]]:
+            async with semaphore:
+                return await self.blockchain_service.batch_call([
+                    ("eth_getTransactionReceipt", [tx_hash]) for tx_hash in batch
+                ])
+
+        batches = await asyncio.gather(*(
+            fetch_batch(tx_hashes[i:i + self.batch_size])
+            for i in range(0, len(tx_hashes), self.batch_size)
+        ))
+        return [receipt for batch in batches for receipt in batch]
+
+    async def poll_once(self) -> List[Transaction]:
+        """
+        Checks the pending transactions if a new block was produced since the last check.
+        Returns the transactions that reached a final status.
+        """
+        if not self._pending:
+            return []
+
+        latest_block = await self.blockchain_service.get_latest_block_number()
+        if latest_block == self._last_checked_block:
+            return []
+
+        tx_hashes = list(self._pending)
+        receipts = await self._fetch_receipts(tx_hashes)
+        self._last_checked_block = latest_block
+
+        now = self._clock()
+        finished = []
+        for tx_hash, receipt in zip(tx_hashes, receipts):
+            transaction, deadline = self._pending[tx_hash]
+            if receipt:
+                finished.append(apply_receipt(transaction.model_copy(), receipt))
+            elif now >= deadline:
+                del self._pending[tx_hash]
+                print(
+                    f"CONFIRMATION SCHEDULER TIMEOUT: Transaction {tx_hash} was not confirmed within the timeout period.")
+
+        if finished:
+            async with self.transaction_repo_factory() as transaction_repo:
+                await transaction_repo.update_many(finished)
+
+            for transaction in finished:
+                del self._pending[transaction.tx_hash]
+
+            confirmed = sum(tx.status == TransactionStatus.CONFIRMED for tx in finished)
+            print(
+                f"CONFIRMATION SCHEDULER: Block {latest_block}, {confirmed} confirmed, {len(finished) - confirmed} failed, {len(self._pending)} still pending.")
+
+        return finished
+
+    def start(self) -> None:
+        self._task.start()
+
+    async def stop(self) -> None:
+        await self._task.stop()
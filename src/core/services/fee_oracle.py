@@ -0,0 +1,73 @@
+import asyncio
+import statistics
+from typing import Dict, Optional
+from ..enums import FeeTier
+from ..interfaces import IBlockchainService, IFeeOracle
+from ..constants import (
+    DEFAULT_PRIORITY_FEE_GWEI,
+    FEE_HISTORY_BLOCKS,
+    FEE_TIER_PERCENTILES,
+    FEE_BASE_FEE_MULTIPLIER,
+)
+
+
+class FeeOracle(IFeeOracle):
+    """
+    Fees derived from eth_feeHistory, fetched once per block.
+
+    The priority fee of a tier is the median, over the last `block_count` blocks,
+    of the reward percentile configured for it, so it follows what was actually
+    paid for inclusion instead of a fixed value. Empty blocks, with no reward,
+    are left out. maxFeePerGas adds `base_fee_multiplier` times the base fee of
+    the next block, which leaves room for it to rise while the transaction waits.
+    """
+
+    def __init__(
+        self,
+        blockchain_service: IBlockchainService,
+        block_count: int = FEE_HISTORY_BLOCKS,
+        tier_percentiles: Optional[Dict[str, float]] = None,
+        base_fee_multiplier: float = FEE_BASE_FEE_MULTIPLIER,
+        default_priority_fee: int = DEFAULT_PRIORITY_FEE_GWEI * 10**9,
+    ):
+        self.blockchain_service = blockchain_service
+        self.block_count = block_count
+        percentiles = tier_percentiles or FEE_TIER_PERCENTILES
+        # Slowest tier first, a faster tier never pays less than a slower one
+        self.tier_percentiles = {tier: float(percentiles[tier.value]) for tier in FeeTier}
+        self.base_fee_multiplier = base_fee_multiplier
+        self.default_priority_fee = default_priority_fee
+        self._block_number: Optional[int] = None
+        self._fees: Dict[FeeTier, Dict[str, int]] = {}
+        self._lock = asyncio.Lock()
+
+    async def get_fees(self, tier: FeeTier = FeeTier.NORMAL) -> Dict[str, int]:
+        # Served from memory while the head is fresh, so this is usually no RPC
+        block_number = await self.blockchain_service.get_latest_block_number()
+        if block_number != self._block_number:
+            async with self._lock:
+                # Concurrent callers share one refresh per block
+                if block_number != self._block_number:
+                    self._fees = await self._fetch_fees()
+                    self._block_number = block_number
+        return dict(self._fees[tier])
+
+    async def _fetch_fees(self) -> Dict[FeeTier, Dict[str, int]]:
+        history = await self.blockchain_service.get_fee_history(
+            self.block_count, list(self.tier_percentiles.values()))
+
+        base_fees = history.get("baseFeePerGas") or []
+        next_base_fee = base_fees[-1] if base_fees else await self.blockchain_service.get_base_fee()
+        rewards = history.get("reward") or []
+
+        fees = {}
+        priority_fee = 0
+        for index, tier in enumerate(self.tier_percentiles):
+            samples = [block_rewards[index] for block_rewards in rewards if block_rewards[index] > 0]
+            tier_fee = statistics.median_low(samples) if samples else self.default_priority_fee
+            priority_fee = max(priority_fee, tier_fee)
+            fees[tier] = {
+                "maxFeePerGas": int(self.base_fee_multiplier * next_base_fee) + priority_fee,
+                "maxPriorityFeePerGas": priority_fee,
+            }
+        return fees
@@ -0,0 +1,94 @@
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+from ..interfaces import IBlockchainService, IGasLimitResolver
+from ..constants import (
+    ETH_TRANSFER_GAS,
+    GAS_CACHE_MAX_ENTRIES,
+    GAS_NO_CODE_TTL_SECONDS,
+    GAS_ESTIMATE_TTL_SECONDS,
+    GAS_ESTIMATE_MARGIN,
+)
+
+
+def _selector(data: Any) -> str:
+    """First 4 bytes of the call data as hex, "0x" for a plain value transfer."""
+    if isinstance(data, (bytes, bytearray)):
+        data = "0x" + bytes(data).hex()
+    data = (data or "0x").lower()
+    return data[:10]
+
+
+class GasLimitResolver(IGasLimitResolver):
+    """
+    Gas limits without an eth_estimateGas round trip when the answer is known.
+
+    A value transfer to an account without code always costs ETH_TRANSFER_GAS.
+    The eth_getCode result is cached per address: code never goes away, while an
+    empty account is checked again after `no_code_ttl`, since a contract may be
+    deployed at a precomputed address. Other calls are estimated once per target
+    and function selector, and the estimate is reused for `estimate_ttl` with
+    `estimate_margin` of headroom, since other arguments may cost more gas.
+    """
+
+    def __init__(
+        self,
+        blockchain_service: IBlockchainService,
+        max_entries: int = GAS_CACHE_MAX_ENTRIES,
+        no_code_ttl: float = GAS_NO_CODE_TTL_SECONDS,
+        estimate_ttl: float = GAS_ESTIMATE_TTL_SECONDS,
+        estimate_margin: float = GAS_ESTIMATE_MARGIN,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.blockchain_service = blockchain_service
+        self.max_entries = max_entries
+        self.no_code_ttl = no_code_ttl
+        self.estimate_ttl = estimate_ttl
+        self.estimate_margin = estimate_margin
+        self._clock = clock
+        # Address -> (has code, checked at)
+        self._has_code: Dict[str, Tuple[bool, float]] = {}
+        # (target, selector) -> (gas limit, estimated at)
+        self._estimates: Dict[Tuple[str, str], Tuple[int, float]] = {}
+
+    def _store(self, cache: Dict, key: Any, value: Any) -> None:
+        cache.pop(key, None)
+        if len(cache) >= self.max_entries:
+            # Oldest entry first, dicts keep insertion order
+            del cache[next(iter(cache))]
+        cache[key] = (value, self._clock())
+
+    def _cached_estimate(self, key: Tuple[str, str]) -> Optional[int]:
+        entry = self._estimates.get(key)
+        if entry is None or self._clock() - entry[1] > self.estimate_ttl:
+            return None
+        return entry[0]
+
+    async def has_code(self, address: str) -> bool:
+        key = address.lower()
+        entry = self._has_code.get(key)
+        # Code cannot be removed, only an empty account is checked again
+        if entry is not None and (entry[0] or self._clock() - entry[1] <= self.no_code_ttl):
+            return entry[0]
+        has_code = bool(await self.blockchain_service.get_code(address))
+        self._store(self._has_code, key, has_code)
+        return has_code
+
+    async def resolve(self, transaction: Dict[str, Any]) -> int:
+        to_address = transaction.get("to")
+        if not to_address:
+            # Contract creation, nothing to reuse
+            return await self.blockchain_service.estimate_gas(transaction)
+
+        selector = _selector(transaction.get("data"))
+        if selector == "0x" and not await self.has_code(to_address):
+            return ETH_TRANSFER_GAS
+
+        key = (to_address.lower(), selector)
+        cached = self._cached_estimate(key)
+        if cached is not None:
+            return cached
+
+        # The first call gets the same headroom as the ones reusing it
+        limit = int(await self.blockchain_service.estimate_gas(transaction) * self.estimate_margin)
+        self._store(self._estimates, key, limit)
+        return limit
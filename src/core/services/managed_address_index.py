@@ -0,0 +1,83 @@
+import asyncio
+from typing import AsyncContextManager, Callable, Iterable, Optional, Set
+from ..interfaces import IAddressRepository, IManagedAddressIndex
+from ..constants import ADDRESS_INDEX_REFRESH_INTERVAL_SECONDS, ADDRESS_INDEX_PAGE_SIZE
+from ..periodic_task import PeriodicTask
+
+
+def normalize_address(address: str) -> Optional[bytes]:
+    """The 20 bytes of a hex address, whatever its letter case; None if it is not one."""
+    if not isinstance(address, str):
+        return None
+    hex_part = address[2:] if address[:2].lower() == "0x" else address
+    if len(hex_part) != 40:
+        return None
+    try:
+        return bytes.fromhex(hex_part)
+    except ValueError:
+        return None
+
+
+class ManagedAddressIndex(IManagedAddressIndex):
+    """
+    Process-wide set of the managed addresses, as normalized 20-byte values.
+    Only assigned addresses are managed; pooled ones join once handed out.
+
+    `refresh` reads the assigned rows after the last id it has settled, so
+    loading the index at startup reads the whole table in pages of `page_size`,
+    and the periodic refreshes every `refresh_interval` only read what other
+    processes stored or assigned since. Rows above the oldest pooled one may
+    still be assigned, so they are read again until the pool moves past them.
+    Addresses stored or assigned by this process are added right away by the
+    repository. Addresses are never deleted, so the set only grows.
+    """
+
+    def __init__(
+        self,
+        address_repo_factory: Callable[[], AsyncContextManager[IAddressRepository]],
+        refresh_interval: float = ADDRESS_INDEX_REFRESH_INTERVAL_SECONDS,
+        page_size: int = ADDRESS_INDEX_PAGE_SIZE,
+    ):
+        self.address_repo_factory = address_repo_factory
+        self.refresh_interval = refresh_interval
+        self.page_size = page_size
+        self._addresses: Set[bytes] = set()
+        self._last_id = 0
+        self._refresh_lock = asyncio.Lock()
+        self._task = PeriodicTask(
+            self.refresh, refresh_interval,
+            "ADDRESS INDEX ERROR: Could not refresh the managed addresses", run_first=False)
+
+    def __len__(self) -> int:
+        return len(self._addresses)
+
+    def is_managed(self, address: str) -> bool:
+        return normalize_address(address) in self._addresses
+
+    def add(self, addresses: Iterable[str]) -> None:
+        self._addresses.update(
+            normalized for normalized in map(normalize_address, addresses) if normalized is not None)
+
+    async def refresh(self) -> int:
+        async with self._refresh_lock:
+            before = len(self._addresses)
+            async with self.address_repo_factory() as address_repo:
+                # Read first, a row below it cannot be assigned after the pages are read
+                oldest_pooled = await address_repo.oldest_unassigned_id()
+                cursor = self._last_id
+                while True:
+                    rows = await address_repo.list_public_addresses(cursor, self.page_size)
+                    if not rows:
+                        break
+                    self.add(public_address for _, public_address in rows)
+                    cursor = rows[-1][0]
+                    if len(rows) < self.page_size:
+                        break
+            self._last_id = cursor if oldest_pooled is None else min(cursor, oldest_pooled - 1)
+            return len(self._addresses) - before
+
+    def start(self) -> None:
+        self._task.start()
+
+    async def stop(self) -> None:
+        await self._task.stop()
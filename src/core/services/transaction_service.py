@@ -1,12 +1,14 @@
 import asyncio
 import os
+import time
 from decimal import Decimal
-from typing import List, Optional
+from collections import defaultdict
+from typing import Awaitable, Dict, List, Optional, TypeVar, Union
 from eth_account import Account
 from web3 import Web3
-from web3.exceptions import TimeExhausted
-from ..entities import Transaction
-from ..enums import TransactionStatus
+from web3.exceptions import Web3RPCError
+from ..entities import Address, Transaction, Transfer, TransferResult
+from ..enums import FeeTier, TransactionStatus
 from ..interfaces import (
     ITransactionRepository,
     IAddressRepository,
@@ -14,9 +16,45 @@ from ..interfaces import (
     IEncryptionService,
     INonceManager,
     ITransactionService,
+    ITaskExecutor,
+    IFeeOracle,
+    IGasLimitResolver,
+    IHDWallet,
+    IManagedAddressIndex,
 )
 
 
+T = TypeVar("T")
+
+# Broadcast rejections meaning the nonce was used by another transaction already
+NONCE_USED_ERRORS = ("nonce too low", "already known", "known transaction",
+                     "replacement transaction underpriced")
+
+
+def nonce_was_used(error: Exception) -> bool:
+    message = str(error).lower()
+    return any(reason in message for reason in NONCE_USED_ERRORS)
+
+
+def apply_receipt(tx_entity: Transaction, receipt: Optional[dict]) -> Transaction:
+    """Sets the final status and effective cost of a transaction from its receipt."""
+    if receipt and receipt.get('status') == 1:
+        tx_entity.status = TransactionStatus.CONFIRMED
+        tx_entity.effective_cost = Web3.from_wei(
+            receipt.get('gasUsed', 0) *
+            receipt.get('effectiveGasPrice', 0), 'ether'
+        )
+    else:
+        tx_entity.status = TransactionStatus.FAILED
+    return tx_entity
+
+
+def sign_transaction(tx_dict: dict, private_key_bytes: bytes) -> str:
+    """Signs a transaction, a module-level function so it can run in a process pool."""
+    signed_tx = Account.sign_transaction(tx_dict, private_key_bytes)
+    return signed_tx.raw_transaction.hex()
+
+
 class TransactionService(ITransactionService):
     def __init__(
         self,
@@ -24,21 +62,30 @@ class TransactionService(ITransactionService):
         address_repo: IAddressRepository,
         blockchain_service: IBlockchainService,
         encryption_service: IEncryptionService,
-        nonce_manager: INonceManager
+        nonce_manager: INonceManager,
+        cpu_executor: Optional[ITaskExecutor] = None,
+        fee_oracle: Optional[IFeeOracle] = None,
+        gas_limit_resolver: Optional[IGasLimitResolver] = None,
+        hd_wallet: Optional[IHDWallet] = None,
+        address_index: Optional[IManagedAddressIndex] = None
     ):
         self.transaction_repo = transaction_repo
         self.address_repo = address_repo
         self.blockchain_service = blockchain_service
         self.encryption_service = encryption_service
         self.nonce_manager = nonce_manager
+        self.cpu_executor = cpu_executor
+        self.fee_oracle = fee_oracle
+        self.gas_limit_resolver = gas_limit_resolver
+        self.hd_wallet = hd_wallet
+        self.address_index = address_index
         self.min_confirmations = int(os.getenv("MIN_CONFIRMATIONS", "12"))
         self.chain_id = int(os.getenv("CHAIN_ID", "11155111"))
         self.priority_fee_gwei = int(
             os.getenv("DEFAULT_PRIORITY_FEE_GWEI", "2"))
-        self.TRANSACTION_CONFIRMATION_TIMEOUT_SECONDS = int(
-            os.getenv("TRANSACTION_CONFIRMATION_TIMEOUT_SECONDS", "300"))
+        self._stage_timings: Dict[str, float] = {}
 
-    async def _extract_transfer_details(self, tx_hash: str, tx_details: dict) -> Optional[dict]:
+    def _extract_transfer_details(self, tx_details: dict) -> Optional[dict]:
         # --- Logic to handle both ETH and ERC-20 Transfers ---
         asset = "ETH"
         value_in_wei = tx_details['value']
@@ -46,8 +93,9 @@ class TransactionService(ITransactionService):
 
         # Check if is a potential contract interaction
         if tx_details.get('input') and tx_details['input'] != '0x':
-            decoded_input = await self.blockchain_service.decode_contract_transaction(
-                tx_hash, self.blockchain_service.erc20_abi
+            # The input is decoded from the details I already have, no need to fetch the tx again
+            decoded_input = self.blockchain_service.decode_transaction_input(
+                tx_details, self.blockchain_service.erc20_abi
             )
             # Check if is a standard 'transfer' function call
             if decoded_input and decoded_input.get('function') == 'transfer':
@@ -69,28 +117,26 @@ class TransactionService(ITransactionService):
         }
 
     async def validate_onchain_transaction(self, tx_hash: str) -> Optional[Transaction]:
-        tx_details = await self.blockchain_service.get_transaction_details(tx_hash)
+        # Transaction, receipt and latest block come back in a single JSON-RPC batch
+        tx_details, receipt, latest_block = await self.blockchain_service.get_transaction_with_receipt(tx_hash)
         if not tx_details:
             return None
 
-        receipt = await self.blockchain_service.get_transaction_receipt(tx_hash)
         if not receipt or receipt.get('status') == 0:
             return None  # Transaction failed or was not confirmed
 
         # Check for security confirmations
-        latest_block = await self.blockchain_service.get_latest_block_number()
         confirmations = (
             latest_block - receipt.get('blockNumber', latest_block)) + 1
         if confirmations < self.min_confirmations:
             return None  # Not secure enough yet
 
-        transfer_info = await self._extract_transfer_details(tx_hash, tx_details)
+        transfer_info = self._extract_transfer_details(tx_details)
         if not transfer_info:
             return None
 
         # Check if the FINAL destination is one managed addresses
-        managed_address = await self.address_repo.find_by_public_address(transfer_info["to_address"])
-        if not managed_address:
+        if not await self._is_managed(transfer_info["to_address"]):
             return None  # Not a transaction for my API
 
         # --- Upsert Logic ---
@@ -116,7 +162,9 @@ class TransactionService(ITransactionService):
         )
         return await self.transaction_repo.create(tx_entity)
 
-    async def _calculate_fees(self) -> dict:
+    async def _calculate_fees(self, fee_tier: FeeTier = FeeTier.NORMAL) -> dict:
+        if self.fee_oracle is not None:
+            return await self.fee_oracle.get_fees(fee_tier)
         # Calculate fees (EIP-1559)
         base_fee = await self.blockchain_service.get_base_fee()
         priority_fee = Web3.to_wei(self.priority_fee_gwei, 'gwei')
@@ -126,12 +174,71 @@ class TransactionService(ITransactionService):
             "maxPriorityFeePerGas": priority_fee
         }
 
-    def _sign_transaction(self, tx_dict: dict, private_key_bytes: bytes) -> str:
+    async def _resolve_gas_limit(self, tx_dict: dict) -> int:
+        if self.gas_limit_resolver is not None:
+            return await self.gas_limit_resolver.resolve(tx_dict)
+        return await self.blockchain_service.estimate_gas(tx_dict)
+
+    def get_stage_timings(self) -> Dict[str, float]:
+        return dict(self._stage_timings)
+
+    async def _timed(self, stage: str, awaitable: Awaitable[T]) -> T:
+        started = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            self._stage_timings[stage] = time.perf_counter() - started
+
+    @staticmethod
+    def _raise_first_error(outcomes: list) -> list:
+        # Stages are gathered with return_exceptions, so none is left running on failure
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        return outcomes
+
+    async def _is_managed(self, address: str) -> bool:
+        if self.address_index is not None and self.address_index.is_managed(address):
+            # In memory, no database round trip
+            return True
+        # The index may not have the addresses other workers created since its last refresh
+        if await self.address_repo.find_by_public_address(address) is None:
+            return False
+        if self.address_index is not None:
+            self.address_index.add([address])
+        return True
+
+    async def _load_private_key(self, from_address: str) -> bytes:
+        sender_address_entity = await self._timed(
+            "lookup", self.address_repo.find_by_public_address(from_address))
+        if not sender_address_entity:
+            raise ValueError("Source address not managed by this service.")
+        return await self._timed("decrypt", self._decrypt_private_key(sender_address_entity))
+
+    async def _run_cpu_bound(self, func, *args):
+        # Off the event loop, so other requests are not stalled meanwhile
+        if self.cpu_executor is None:
+            return await asyncio.to_thread(func, *args)
+        return await self.cpu_executor.run(func, *args)
+
+    async def _decrypt_private_key(self, sender_address_entity: Address) -> bytes:
+        if sender_address_entity.derivation_index is not None:
+            if self.hd_wallet is None:
+                raise ValueError("Source address is derived from an HD wallet, which is not configured.")
+            # On a thread, so every call shares the wallet's cache of derived keys
+            return await asyncio.to_thread(
+                self.hd_wallet.derive_private_key, sender_address_entity.derivation_index)
+        return await self._run_cpu_bound(
+            self.encryption_service.decrypt,
+            sender_address_entity.encrypted_private_key.encode()
+        )
+
+    async def _sign_transaction(self, tx_dict: dict, private_key_bytes: bytes) -> str:
         # Sign the transaction
-        signed_tx = Account.sign_transaction(tx_dict, private_key_bytes)
+        signed_tx_hex = await self._run_cpu_bound(sign_transaction, tx_dict, private_key_bytes)
         # Clear the key from memory (good practice)
         del private_key_bytes
-        return signed_tx.raw_transaction.hex()
+        return signed_tx_hex
 
     async def _create_and_store_transaction(
         self, tx_hash: str, asset: str, from_address: str, to_address: str, value: Decimal
@@ -153,44 +260,233 @@ class TransactionService(ITransactionService):
         from_address: str,
         to_address: str,
         asset: str,
-        value: Decimal
+        value: Decimal,
+        fee_tier: FeeTier = FeeTier.NORMAL
     ) -> Transaction:
-        # Get the nonce from my secure manager
-        nonce = await self.nonce_manager.get_next_nonce(from_address)
+        self._stage_timings = {}
+        started = time.perf_counter()
+        nonce = None
+        nonce_task: Optional[asyncio.Future] = None
+        signed_tx_hex = None
 
-        # Get the private key
-        sender_address_entity = await self.address_repo.find_by_public_address(from_address)
-        if not sender_address_entity:
-            raise ValueError("Source address not managed by this service.")
+        try:
+            # Independent stages overlap: the sender lookup and key decryption
+            # run while the fees are fetched
+            private_key_bytes, fees = self._raise_first_error(await asyncio.gather(
+                self._load_private_key(from_address),
+                self._timed("fees", self._calculate_fees(fee_tier)),
+                return_exceptions=True
+            ))
+
+            tx_dict = {
+                "from": from_address,
+                "to": to_address,
+                "value": Web3.to_wei(value, 'ether'),
+                "maxFeePerGas": fees["maxFeePerGas"],
+                "maxPriorityFeePerGas": fees["maxPriorityFeePerGas"],
+                "chainId": self.chain_id,
+            }
+
+            # Gas estimation needs the fees; the nonce is reserved meanwhile,
+            # and released below if the transaction is never sent. The
+            # reservation is shielded so a cancellation cannot lose its result
+            nonce_task = asyncio.ensure_future(
+                self._timed("nonce", self.nonce_manager.reserve_nonce(from_address)))
+            outcomes = await asyncio.gather(
+                self._timed("gas", self._resolve_gas_limit(tx_dict)),
+                asyncio.shield(nonce_task),
+                return_exceptions=True
+            )
+            gas_estimate, nonce = outcomes
+            if isinstance(nonce, BaseException):
+                nonce = None
+            self._raise_first_error(outcomes)
+            tx_dict["gas"] = gas_estimate
+            tx_dict["nonce"] = nonce
+
+            signed_tx_hex = await self._timed("sign", self._sign_transaction(tx_dict, private_key_bytes))
+
+            # Broadcast to the network
+            tx_hash = await self._timed(
+                "broadcast", self.blockchain_service.broadcast_transaction(signed_tx_hex))
+        except BaseException as e:
+            # Cancellation included, so a reservation is never left behind
+            if nonce is None and nonce_task is not None:
+                nonce = await self._reserved_nonce(nonce_task)
+            if nonce is None:
+                raise
+            if signed_tx_hex is None:
+                await self.nonce_manager.release_nonce(from_address, nonce)
+            elif isinstance(e, Web3RPCError):
+                await self._settle_rejected_nonce(from_address, nonce, e)
+            else:
+                # The node may have accepted it before the connection failed,
+                # the periodic repair closes the gap if it did not
+                await self.nonce_manager.commit_nonce(from_address, nonce)
+            raise
+
+        await self.nonce_manager.commit_nonce(from_address, nonce)
+
+        tx_entity = await self._timed("store", self._create_and_store_transaction(
+            tx_hash, asset, from_address, to_address, value
+        ))
+        self._stage_timings["total"] = time.perf_counter() - started
+        return tx_entity
 
-        private_key_bytes = self.encryption_service.decrypt(
-            sender_address_entity.encrypted_private_key.encode()
-        )
+    @staticmethod
+    async def _reserved_nonce(nonce_task: asyncio.Future) -> Optional[int]:
+        # Waits for a reservation the failure interrupted, None if it failed too
+        try:
+            return await nonce_task
+        except BaseException:
+            return None
 
-        fees = await self._calculate_fees()
+    async def _settle_rejected_nonce(self, from_address: str, nonce: int, error: Web3RPCError) -> None:
+        if not nonce_was_used(error):
+            # Rejected by the node, the nonce was not used
+            await self.nonce_manager.release_nonce(from_address, nonce)
+            return
+        # Handing it out again would fail the same way, the repair moves past it
+        await self.nonce_manager.commit_nonce(from_address, nonce)
+        try:
+            await self.nonce_manager.repair_nonce(from_address)
+        except Exception as e:
+            print(f"NONCE REPAIR ERROR: Could not check nonce of {from_address}: {e}")
+
+    async def create_onchain_transactions(self, transfers: List[Transfer]) -> List[TransferResult]:
+        results = [TransferResult(transfer=transfer) for transfer in transfers]
+
+        by_sender: Dict[str, List[int]] = defaultdict(list)
+        for index, transfer in enumerate(transfers):
+            by_sender[transfer.from_address].append(index)
+
+        # One key lookup per sender, sequential since the repository shares one session
+        senders: Dict[str, Address] = {}
+        for from_address, indexes in by_sender.items():
+            sender_address_entity = await self.address_repo.find_by_public_address(from_address)
+            if sender_address_entity:
+                senders[from_address] = sender_address_entity
+            else:
+                for index in indexes:
+                    results[index].error = "Source address not managed by this service."
+
+        if senders:
+            # Same fees for every transfer of a tier
+            tiers = list({results[index].transfer.fee_tier
+                          for indexes in by_sender.values() for index in indexes})
+            fees = dict(zip(tiers, await asyncio.gather(*(self._calculate_fees(tier) for tier in tiers))))
+            await asyncio.gather(*(
+                self._send_batch_from(sender, [results[index] for index in by_sender[from_address]], fees)
+                for from_address, sender in senders.items()
+            ))
+
+        # All pending rows in one bulk insert
+        await self.transaction_repo.create_many(
+            [result.transaction for result in results if result.transaction])
+
+        return results
+
+    async def _estimate_gas_per_recipient(self, tx_dicts: List[dict]) -> List[Union[int, Exception]]:
+        # Transfers to the same recipient share one estimate
+        first_by_recipient = {}
+        for tx_dict in tx_dicts:
+            first_by_recipient.setdefault(tx_dict["to"], tx_dict)
+        estimates = await asyncio.gather(*(
+            self._resolve_gas_limit(tx_dict) for tx_dict in first_by_recipient.values()
+        ), return_exceptions=True)
+        by_recipient = dict(zip(first_by_recipient, estimates))
+        return [by_recipient[tx_dict["to"]] for tx_dict in tx_dicts]
+
+    async def _send_batch_from(
+        self, sender: Address, results: List[TransferResult], fees: Dict[FeeTier, dict]
+    ) -> None:
+        """
+        Signs and broadcasts the transfers of one sender. Nonces are only reserved for
+        transfers that passed gas estimation. Released nonces are handed out first, so
+        they may straddle a gap; the batch is still broadcast in ascending nonce order.
+        """
+        from_address = sender.public_address
+        try:
+            private_key_bytes = await self._decrypt_private_key(sender)
+        except Exception as e:
+            for result in results:
+                result.error = str(e)
+            return
 
-        tx_dict = {
-            "from": from_address,
-            "to": to_address,
-            "value": Web3.to_wei(value, 'ether'),
-            "nonce": nonce,
-            "maxFeePerGas": fees["maxFeePerGas"],
-            "maxPriorityFeePerGas": fees["maxPriorityFeePerGas"],
-            "chainId": self.chain_id,
-        }
+        tx_dicts = [
+            {
+                "from": from_address,
+                "to": result.transfer.to_address,
+                "value": Web3.to_wei(result.transfer.value, 'ether'),
+                "maxFeePerGas": fees[result.transfer.fee_tier]["maxFeePerGas"],
+                "maxPriorityFeePerGas": fees[result.transfer.fee_tier]["maxPriorityFeePerGas"],
+                "chainId": self.chain_id,
+            }
+            for result in results
+        ]
+
+        ready = []
+        for tx_dict, result, gas in zip(tx_dicts, results, await self._estimate_gas_per_recipient(tx_dicts)):
+            if isinstance(gas, Exception):
+                result.error = str(gas)
+            else:
+                tx_dict["gas"] = gas
+                ready.append((tx_dict, result))
+        if not ready:
+            return
 
-        # Estimate gas
-        gas_estimate = await self.blockchain_service.estimate_gas(tx_dict)
-        tx_dict["gas"] = gas_estimate
+        try:
+            nonces = sorted(await self.nonce_manager.reserve_nonces(from_address, len(ready)))
+        except Exception as e:
+            for _, result in ready:
+                result.error = str(e)
+            return
 
-        signed_tx_hex = self._sign_transaction(tx_dict, private_key_bytes)
+        for (tx_dict, _), nonce in zip(ready, nonces):
+            tx_dict["nonce"] = nonce
 
-        # Broadcast to the network
-        tx_hash = await self.blockchain_service.broadcast_transaction(signed_tx_hex)
+        try:
+            # Signed in parallel, off the event loop
+            signed_txs_hex = await asyncio.gather(*(
+                self._sign_transaction(tx_dict, private_key_bytes) for tx_dict, _ in ready
+            ))
+        except BaseException as e:
+            for (_, result), nonce in zip(ready, nonces):
+                await self.nonce_manager.release_nonce(from_address, nonce)
+                result.error = str(e)
+            if not isinstance(e, Exception):
+                raise
+            return
 
-        return await self._create_and_store_transaction(
-            tx_hash, asset, from_address, to_address, value
-        )
+        try:
+            outcomes = await self.blockchain_service.broadcast_transactions(list(signed_txs_hex))
+        except asyncio.CancelledError:
+            # The node may have received them, the periodic repair closes any gap
+            for nonce in nonces:
+                await self.nonce_manager.commit_nonce(from_address, nonce)
+            raise
+        except Exception as e:
+            outcomes = [e] * len(ready)
+
+        for (_, result), nonce, outcome in zip(ready, nonces, outcomes):
+            if isinstance(outcome, Web3RPCError):
+                await self._settle_rejected_nonce(from_address, nonce, outcome)
+                result.error = str(outcome)
+            elif isinstance(outcome, Exception):
+                # The node may have accepted it, the periodic repair closes the gap if not
+                await self.nonce_manager.commit_nonce(from_address, nonce)
+                result.error = str(outcome)
+            else:
+                await self.nonce_manager.commit_nonce(from_address, nonce)
+                result.transaction = Transaction(
+                    tx_hash=outcome,
+                    asset=result.transfer.asset,
+                    from_address=from_address,
+                    to_address=result.transfer.to_address,
+                    value=result.transfer.value,
+                    status=TransactionStatus.PENDING,
+                    effective_cost=Decimal(0)  # Will be updated after confirmation
+                )
 
     async def get_all_transaction_history(self) -> List[Transaction]:
         db_transactions = await self.transaction_repo.get_all()
@@ -199,49 +495,3 @@ class TransactionService(ITransactionService):
     async def get_transaction_history_for_address(self, address: str) -> List[Transaction]:
         db_transactions = await self.transaction_repo.get_history(address=address)
         return [Transaction.model_validate(tx) for tx in db_transactions]
-
-    async def _update_transaction_status(self, tx_hash: str, receipt: Optional[dict]):
-        # Find the original transaction record
-        tx_entity = await self.transaction_repo.find_by_hash(tx_hash)
-        if not tx_entity:
-            print(
-                f"BACKGROUND TASK ERROR: Could not find tx_hash {tx_hash} in DB to update.")
-            return
-
-        # Update status and cost based on the receipt
-        if receipt and receipt.get('status') == 1:
-            tx_entity.status = TransactionStatus.CONFIRMED
-            tx_entity.effective_cost = Web3.from_wei(
-                receipt.get('gasUsed', 0) *
-                receipt.get('effectiveGasPrice', 0), 'ether'
-            )
-            print(
-                f"BACKGROUND TASK: Transaction {tx_hash} confirmed successfully.")
-        else:
-            tx_entity.status = TransactionStatus.FAILED
-            print(
-                f"BACKGROUND TASK: Transaction {tx_hash} failed or receipt not found.")
-
-        # Save the final state to the database
-        await self.transaction_repo.update(tx_entity)
-
-    async def wait_for_confirmation(self, tx_hash: str):
-        """
-        This method is designed to be run as a background task.
-        It waits for the transaction receipt and updates the DB record.
-        """
-        print(f"BACKGROUND TASK: Started monitoring tx_hash: {tx_hash}")
-        try:
-            # Wait for the transaction receipt from the blockchain
-            receipt = await self.blockchain_service.wait_for_transaction_receipt(
-                tx_hash, timeout=self.TRANSACTION_CONFIRMATION_TIMEOUT_SECONDS
-            )
-            await self._update_transaction_status(tx_hash, receipt)
-
-        except (TimeExhausted, asyncio.TimeoutError):
-            print(
-                f"BACKGROUND TASK TIMEOUT: Transaction {tx_hash} was not confirmed within the timeout period.")
-            # Optionally, you could set the status to a special "timed_out" state here.
-        except Exception as e:
-            print(
-                f"BACKGROUND TASK ERROR: An unexpected error occurred while monitoring {tx_hash}: {e}")
@@ -0,0 +1,10 @@
+# Usage: ENCRYPTION_KEYS=<key> python -m src.generate_hd_seed
+from eth_account.hdaccount import generate_mnemonic
+from src.infra.security.encryption import EncryptionService
+
+# Generate a new BIP-39 mnemonic and encrypt it with the ENCRYPTION_KEYS
+mnemonic = generate_mnemonic(num_words=24, lang="english")
+encrypted_seed = EncryptionService().encrypt(mnemonic.encode())
+
+print("Your new encrypted HD wallet seed (HD_WALLET_ENCRYPTED_SEED) is:")
+print(encrypted_seed.decode())
@@ -0,0 +1,133 @@
+import time
+from typing import AsyncContextManager, Callable, Dict, List, Set, Tuple
+from src.core.interfaces import IAddressRepository, IBlockchainService, INonceRepository
+from src.core.constants import (
+    NONCE_WARM_UP_CONCURRENCY,
+    NONCE_REPAIR_INTERVAL_SECONDS,
+    NONCE_LEASE_SIZE,
+    NONCE_LEASE_TTL_SECONDS,
+    NONCE_RESERVATION_TTL_SECONDS,
+)
+from .nonce_manager import NonceManager
+
+
+class DatabaseNonceManager(NonceManager):
+    """
+    Nonce manager for deployments with several workers or instances.
+
+    Nonces are allocated from a counter per address in the shared database, with
+    a single atomic UPDATE, so two workers never hand out the same nonce. Each
+    worker leases `lease_size` consecutive nonces at a time and serves them from
+    memory; a lease not used within `lease_ttl` is given back when nothing was
+    allocated after it. Larger leases save database round trips, but a leased
+    nonce left unused holds back the transactions of other workers sent after it,
+    so they fit deployments where each sender is used by one worker at a time.
+
+    Reservations, released nonces and the periodic repair work as in NonceManager,
+    except that a gap is only refilled by the worker that allocated the nonce.
+    """
+
+    def __init__(
+        self,
+        address_repo_factory: Callable[[], AsyncContextManager[IAddressRepository]],
+        nonce_repo_factory: Callable[[], AsyncContextManager[INonceRepository]],
+        blockchain_service: IBlockchainService,
+        warm_up_concurrency: int = NONCE_WARM_UP_CONCURRENCY,
+        repair_interval: float = NONCE_REPAIR_INTERVAL_SECONDS,
+        lease_size: int = NONCE_LEASE_SIZE,
+        lease_ttl: float = NONCE_LEASE_TTL_SECONDS,
+        reservation_ttl: float = NONCE_RESERVATION_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__(address_repo_factory, blockchain_service,
+                         warm_up_concurrency, repair_interval,
+                         reservation_ttl=reservation_ttl, clock=clock)
+        if lease_size < 1:
+            raise ValueError("Nonce lease size must be at least 1.")
+        self._nonce_repo_factory = nonce_repo_factory
+        self.lease_size = lease_size
+        self.lease_ttl = lease_ttl
+        # The current lease of an address is [self._nonces[address], self._lease_ends[address])
+        self._lease_ends: Dict[str, int] = {}
+        self._leased_at: Dict[str, float] = {}
+        # Ranges allocated by this worker that may still need a repair
+        self._leases: Dict[str, List[Tuple[int, int]]] = {}
+
+    async def _load_nonce(self, address: str) -> None:
+        tx_count = await self._blockchain_service.get_transaction_count(address)
+        async with self._nonce_repo_factory() as nonce_repo:
+            await nonce_repo.initialize(address, tx_count)
+        # Starts with an empty lease, the first reservation leases from the database
+        self._nonces[address] = self._lease_ends[address] = tx_count
+        self._leases[address] = []
+        print(f"Initialized nonce counter for {address}: {tx_count}")
+
+    async def _allocate(self, address: str) -> int:
+        if self._nonces[address] < self._lease_ends[address] and self._lease_expired(address):
+            await self._give_back(address)
+
+        if self._nonces[address] >= self._lease_ends[address]:
+            async with self._nonce_repo_factory() as nonce_repo:
+                start = await nonce_repo.allocate(address, self.lease_size)
+            self._nonces[address] = start
+            self._lease_ends[address] = start + self.lease_size
+            self._leased_at[address] = self._clock()
+            self._leases[address].append((start, start + self.lease_size))
+
+        return await super()._allocate(address)
+
+    def _lease_expired(self, address: str) -> bool:
+        return self._clock() - self._leased_at.get(address, 0) > self.lease_ttl
+
+    async def _give_back(self, address: str) -> None:
+        start, end = self._nonces[address], self._lease_ends[address]
+        async with self._nonce_repo_factory() as nonce_repo:
+            if not await nonce_repo.give_back(address, start, end):
+                # Other workers allocated after it, the lease must still be used first
+                return
+        self._lease_ends[address] = start
+        self._leases[address] = [
+            (lease_start, min(lease_end, start))
+            for lease_start, lease_end in self._leases[address] if lease_start < start
+        ]
+
+    async def _advance_to(self, address: str, nonce: int) -> None:
+        if nonce < self._lease_ends[address]:
+            self._nonces[address] = nonce
+        else:
+            self._nonces[address] = self._lease_ends[address] = nonce
+        async with self._nonce_repo_factory() as nonce_repo:
+            await nonce_repo.advance_to(address, nonce)
+
+    def _owns_nonce(self, address: str, nonce: int) -> bool:
+        return any(start <= nonce < end for start, end in self._leases.get(address, []))
+
+    def _needs_repair(self, address: str, used: Set[str]) -> bool:
+        # A lease still held is given back by the repair once it expires
+        return (super()._needs_repair(address, used) or bool(self._leases.get(address))
+                or self._nonces[address] < self._lease_ends[address])
+
+    async def _repair_address(self, address: str) -> None:
+        async with self._lock_for(address):
+            if (self._nonces[address] < self._lease_ends[address]
+                    and not self._has_live_reservations(address) and self._lease_expired(address)):
+                # An idle worker does not keep holding nonces back
+                await self._give_back(address)
+
+        await super()._repair_address(address)
+
+    async def _apply_pending_count(self, address: str, chain_pending: int) -> None:
+        # Ranges fully used on the node cannot leave a gap anymore
+        self._leases[address] = [
+            (start, end) for start, end in self._leases[address] if end > chain_pending]
+        if self._nonces[address] == self._lease_ends[address] and chain_pending > self._nonces[address]:
+            # Sent by other workers, or from outside, while this one had no lease
+            await self._advance_to(address, chain_pending)
+        await super()._apply_pending_count(address, chain_pending)
+
+    async def stop(self) -> None:
+        await super().stop()
+        for address in list(self._lease_ends):
+            async with self._lock_for(address):
+                if self._nonces[address] < self._lease_ends[address]:
+                    await self._give_back(address)
@@ -0,0 +1,88 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from eth_abi import decode as abi_decode
+from eth_utils import function_abi_to_4byte_selector, to_checksum_address
+from hexbytes import HexBytes
+
+WORD_SIZE = 32
+SELECTOR_SIZE = 4
+
+
+def _decode_address_word(word: bytes) -> str:
+    # An ABI encoded address is left padded with 12 zero bytes
+    if any(word[:12]):
+        raise ValueError("Invalid address padding.")
+    return to_checksum_address(word[12:])
+
+
+def _decode_uint256_word(word: bytes) -> int:
+    return int.from_bytes(word, "big")
+
+
+def _decode_bool_word(word: bytes) -> bool:
+    value = int.from_bytes(word, "big")
+    if value > 1:
+        raise ValueError("Invalid boolean value.")
+    return value == 1
+
+
+# Static types that fit in a single 32-byte word and can be decoded by slicing
+WORD_DECODERS: Dict[str, Callable[[bytes], Any]] = {
+    "address": _decode_address_word,
+    "uint256": _decode_uint256_word,
+    "bool": _decode_bool_word,
+}
+
+
+class SelectorDecoder:
+    """
+    Decodes contract calldata through a table of 4-byte selectors, built once from an ABI.
+
+    Functions whose arguments are all fixed-width words (ERC-20 transfer, transferFrom
+    and approve) are decoded by slicing the calldata. Any other function uses a
+    pre-built eth_abi decoder for its argument types.
+    """
+
+    def __init__(self, contract_abi: List[Dict[str, Any]]):
+        self._functions: Dict[bytes, Tuple[str, List[str], List[str], Optional[List[Callable]]]] = {}
+
+        for entry in contract_abi:
+            if entry.get("type") != "function":
+                continue
+
+            names = [arg["name"] for arg in entry.get("inputs", [])]
+            types = [arg["type"] for arg in entry.get("inputs", [])]
+            word_decoders = (
+                [WORD_DECODERS[arg_type] for arg_type in types]
+                if all(arg_type in WORD_DECODERS for arg_type in types) else None
+            )
+            self._functions[function_abi_to_4byte_selector(entry)] = (
+                entry["name"], names, types, word_decoders
+            )
+
+    def __contains__(self, selector: bytes) -> bool:
+        return selector in self._functions
+
+    def decode(self, tx_input: Union[str, bytes]) -> Optional[Dict[str, Any]]:
+        """
+        Returns the function name and params, or None if the selector is unknown.
+        Raises ValueError if the calldata does not match the function arguments.
+        """
+        data = HexBytes(tx_input)
+        function = self._functions.get(bytes(data[:SELECTOR_SIZE]))
+        if function is None:
+            return None
+
+        fn_name, names, types, word_decoders = function
+        args_data = bytes(data[SELECTOR_SIZE:])
+
+        if word_decoders is None:
+            values = abi_decode(types, args_data)
+        else:
+            if len(args_data) < WORD_SIZE * len(word_decoders):
+                raise ValueError(f"Calldata too short for {fn_name}.")
+            values = [
+                decode_word(args_data[i * WORD_SIZE:(i + 1) * WORD_SIZE])
+                for i, decode_word in enumerate(word_decoders)
+            ]
+
+        return {"function": fn_name, "params": dict(zip(names, values))}
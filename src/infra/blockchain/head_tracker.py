@@ -0,0 +1,74 @@
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+from src.core.periodic_task import PeriodicTask
+
+
+@dataclass(frozen=True)
+class BlockHead:
+    number: int
+    base_fee: int
+    timestamp: int
+    observed_at: float
+
+
+class BlockHeadTracker:
+    """
+    Keeps the latest block number, base fee and timestamp in memory.
+
+    A background task polls the cheap eth_blockNumber and only fetches the full
+    block when a new one appears, so the head is refreshed once per block no matter
+    how many requests read it.
+    """
+
+    def __init__(
+        self,
+        fetch_block_number: Callable[[], Awaitable[int]],
+        fetch_latest_block: Callable[[], Awaitable[Dict[str, Any]]],
+        poll_interval: float,
+        max_staleness: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._fetch_block_number = fetch_block_number
+        self._fetch_latest_block = fetch_latest_block
+        self.poll_interval = poll_interval
+        self.max_staleness = max_staleness
+        self._clock = clock
+        self._head: Optional[BlockHead] = None
+        self._task = PeriodicTask(
+            self.poll_once, poll_interval, "HEAD TRACKER ERROR: Could not refresh the block head")
+
+    def get_fresh_head(self) -> Optional[BlockHead]:
+        """Returns the head if it was confirmed within the staleness bound, otherwise None."""
+        head = self._head
+        if head is None or self._clock() - head.observed_at > self.max_staleness:
+            return None
+        return head
+
+    def update_from_block(self, block: Dict[str, Any]) -> BlockHead:
+        """Stores a block fetched elsewhere, so callers on the RPC path also refresh the head."""
+        self._head = BlockHead(
+            number=block["number"],
+            base_fee=block.get("baseFeePerGas", 0),
+            timestamp=block.get("timestamp", 0),
+            observed_at=self._clock(),
+        )
+        return self._head
+
+    async def poll_once(self) -> BlockHead:
+        block_number = await self._fetch_block_number()
+        head = self._head
+
+        if head is not None and head.number == block_number:
+            # Still the same block, just mark it as confirmed now
+            self._head = BlockHead(
+                head.number, head.base_fee, head.timestamp, self._clock())
+            return self._head
+
+        return self.update_from_block(await self._fetch_latest_block())
+
+    def start(self) -> None:
+        self._task.start()
+
+    async def stop(self) -> None:
+        await self._task.stop()
@@ -1,50 +1,310 @@
 import asyncio
-from typing import Dict
-from src.core.interfaces import INonceManager, IAddressRepository, IBlockchainService
+import heapq
+import time
+from collections import defaultdict
+from typing import AsyncContextManager, Callable, Dict, List, Optional, Set
+from src.core.interfaces import INonceManager, IAddressRepository, IBlockchainService, INonceCheckpointRepository
+from src.core.constants import (
+    NONCE_WARM_UP_CONCURRENCY,
+    NONCE_REPAIR_INTERVAL_SECONDS,
+    NONCE_CHECKPOINT_INTERVAL_SECONDS,
+    NONCE_RESERVATION_TTL_SECONDS,
+)
+from src.core.periodic_task import PeriodicTask
+from .rate_limiter import RpcPriority, use_rpc_priority
 
 
 class NonceManager(INonceManager):
     """
     In-memory, async-safe implementation of the nonce manager.
 
+    The nonce of an address is fetched from the chain the first time it is used,
+    so addresses created after startup work too. `initialize_nonces` is an optional
+    warm-up that fetches them ahead of time with bounded concurrency.
+    Each address has its own lock, so senders never wait for each other.
+
+    Nonces are reserved before a transaction is sent, then committed once it was
+    broadcast or released if it never left the service. Released nonces are handed
+    out again first, and a periodic repair compares the local state with the node's
+    pending transaction count to close any gap left behind. Only addresses used
+    since the previous pass, or with work left over, are checked, so idle ones
+    cost no RPC call. A reservation neither
+    committed nor released within `reservation_ttl` was abandoned (e.g. its task
+    was cancelled) and no longer holds the repair back.
+
+    With a checkpoint repository, the next nonce of every address is stored in
+    batched writes, and loaded again on restart with a single query. A checkpoint
+    is checked against the node's pending count when the address is first used,
+    so transactions still pending from before the restart keep their nonces.
+
     NOTE: This implementation is suitable for a single-instance application.
-    In a distributed environment (e.g., multiple pods on K8S), this state would need
-    to be managed in a centralized datastore like Redis.
+    In a distributed environment (e.g., multiple pods on K8S, or several uvicorn
+    workers), use DatabaseNonceManager, which keeps the counters in the database.
     """
 
-    def __init__(self, address_repo: IAddressRepository, blockchain_service: IBlockchainService):
-        self._address_repo = address_repo
+    def __init__(
+        self,
+        address_repo_factory: Callable[[], AsyncContextManager[IAddressRepository]],
+        blockchain_service: IBlockchainService,
+        warm_up_concurrency: int = NONCE_WARM_UP_CONCURRENCY,
+        repair_interval: float = NONCE_REPAIR_INTERVAL_SECONDS,
+        checkpoint_repo_factory: Optional[Callable[[], AsyncContextManager[INonceCheckpointRepository]]] = None,
+        checkpoint_interval: float = NONCE_CHECKPOINT_INTERVAL_SECONDS,
+        reservation_ttl: float = NONCE_RESERVATION_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._address_repo_factory = address_repo_factory
         self._blockchain_service = blockchain_service
+        self.warm_up_concurrency = warm_up_concurrency
+        self.repair_interval = repair_interval
+        self._checkpoint_repo_factory = checkpoint_repo_factory
+        self.checkpoint_interval = checkpoint_interval
+        self.reservation_ttl = reservation_ttl
+        self._clock = clock
+        # Next never-used nonce per address
         self._nonces: Dict[str, int] = {}
-        self._lock = asyncio.Lock()
+        self._locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # Released nonces (min-heap), reused before a new one is allocated
+        self._released: Dict[str, List[int]] = defaultdict(list)
+        # Nonces handed out whose transaction was not committed or released yet,
+        # with the time they were reserved at
+        self._reserved: Dict[str, Dict[int, float]] = defaultdict(dict)
+        # Pending count below the local nonce seen on the last repair pass
+        self._suspected_gaps: Dict[str, int] = {}
+        # Addresses with a reserve, commit or release since the last repair pass
+        self._used_since_repair: Set[str] = set()
+        # Stored next nonces not verified yet, and the ones still to be written
+        self._checkpoints: Dict[str, int] = {}
+        self._dirty: Dict[str, int] = {}
+        self._repairs = PeriodicTask(
+            self.repair_nonces, repair_interval, "NONCE REPAIR ERROR: Repair pass failed", run_first=False)
+        self._checkpoint_flushes = PeriodicTask(
+            self.flush_checkpoints, checkpoint_interval,
+            "NONCE CHECKPOINT ERROR: Could not store nonces", run_first=False)
+
+    def _lock_for(self, address: str) -> asyncio.Lock:
+        return self._locks[address]
+
+    def _store_initial_nonce(self, address: str, tx_count: int) -> None:
+        self._nonces[address] = tx_count
+        # Added for logging
+        print(f"Initialized nonce for {address}: {tx_count}")
 
     async def initialize_nonces(self) -> None:
-        addresses_to_manage = await self._address_repo.get_all()
+        async with self._address_repo_factory() as address_repo:
+            addresses_to_manage = await address_repo.get_all()
+
+        semaphore = asyncio.Semaphore(self.warm_up_concurrency)
+
+        async def warm_up(address: str) -> None:
+            async with semaphore, self._lock_for(address):
+                # It may have been initialized (and used) on first use in the meantime
+                if address in self._nonces:
+                    return
+                with use_rpc_priority(RpcPriority.BACKGROUND):
+                    await self._load_nonce(address)
+
+        await asyncio.gather(*(
+            warm_up(address_entity.public_address) for address_entity in addresses_to_manage
+        ))
+
+    async def _initialize_nonce(self, address: str) -> None:
+        async with self._address_repo_factory() as address_repo:
+            if await address_repo.find_by_public_address(address) is None:
+                raise ValueError(
+                    f"Nonce for address {address} is not managed by this service.")
+
+        await self._load_nonce(address)
+
+    async def _load_nonce(self, address: str) -> None:
+        checkpoint = self._checkpoints.pop(address, None)
+        if checkpoint is None:
+            # Fetch the current transaction count from the blockchain
+            tx_count = await self._blockchain_service.get_transaction_count(address)
+        else:
+            # Also sent from elsewhere, or confirmed, since the checkpoint was written
+            tx_count = max(checkpoint, await self._blockchain_service.get_transaction_count(
+                address, "pending"))
+        self._store_initial_nonce(address, tx_count)
+
+    async def load_checkpoints(self) -> int:
+        """Loads the stored nonces, they are checked against the chain on first use."""
+        if self._checkpoint_repo_factory is None:
+            return 0
+        async with self._checkpoint_repo_factory() as checkpoint_repo:
+            checkpoints = await checkpoint_repo.get_all()
+        for address, nonce in checkpoints.items():
+            if address not in self._nonces:
+                self._checkpoints[address] = nonce
+        return len(checkpoints)
+
+    def _mark_dirty(self, address: str) -> None:
+        if self._checkpoint_repo_factory is not None:
+            self._dirty[address] = self._nonces[address]
+
+    async def flush_checkpoints(self) -> None:
+        """Writes the nonces changed since the last flush in one transaction."""
+        if not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, {}
+        try:
+            async with self._checkpoint_repo_factory() as checkpoint_repo:
+                await checkpoint_repo.save_many(dirty)
+        except Exception:
+            # Retried on the next flush, unless a newer value is waiting already
+            self._dirty = {**dirty, **self._dirty}
+            raise
+
+    async def _allocate(self, address: str) -> int:
+        nonce = self._nonces[address]
+        self._nonces[address] = nonce + 1
+        return nonce
+
+    async def _advance_to(self, address: str, nonce: int) -> None:
+        self._nonces[address] = nonce
+
+    def _owns_nonce(self, address: str, nonce: int) -> bool:
+        return True
+
+    async def reserve_nonce(self, address: str) -> int:
+        return (await self.reserve_nonces(address, 1))[0]
+
+    async def reserve_nonces(self, address: str, count: int) -> List[int]:
+        async with self._lock_for(address):
+            if address not in self._nonces:
+                # Only callers of this address wait for the RPC call
+                await self._initialize_nonce(address)
 
-        async with self._lock:
-            for address_entity in addresses_to_manage:
-                address = address_entity.public_address
-                # Fetch the current transaction count from the blockchain
-                tx_count = await self._blockchain_service.get_transaction_count(address)
-                self._nonces[address] = tx_count
-                # Added for logging
-                print(f"Initialized nonce for {address}: {tx_count}")
+            nonces = []
+            released = self._released[address]
+            for _ in range(count):
+                if released:
+                    nonces.append(heapq.heappop(released))
+                else:
+                    nonces.append(await self._allocate(address))
+            self._mark_dirty(address)
+
+            reserved_at = self._clock()
+            self._reserved[address].update((nonce, reserved_at) for nonce in nonces)
+            self._used_since_repair.add(address)
+            return nonces
+
+    async def commit_nonce(self, address: str, nonce: int) -> None:
+        async with self._lock_for(address):
+            self._reserved[address].pop(nonce, None)
+            self._used_since_repair.add(address)
+
+    async def release_nonce(self, address: str, nonce: int) -> None:
+        async with self._lock_for(address):
+            reserved = self._reserved[address]
+            if nonce not in reserved:
+                return
+            del reserved[nonce]
+            self._used_since_repair.add(address)
+            heapq.heappush(self._released[address], nonce)
+            self._trim_released(address)
+            self._mark_dirty(address)
+
+    def _trim_released(self, address: str) -> None:
+        # Released nonces at the top of the range are simply given back
+        released = self._released[address]
+        while released and max(released) == self._nonces[address] - 1:
+            released.remove(self._nonces[address] - 1)
+            self._nonces[address] -= 1
+        heapq.heapify(released)
 
     async def get_next_nonce(self, address: str) -> int:
         """
         Atomically gets the current nonce for an address and increments it for the next use.
         """
-        async with self._lock:
-            current_nonce = self._nonces.get(address)
+        nonce = await self.reserve_nonce(address)
+        await self.commit_nonce(address, nonce)
+        return nonce
 
-            if current_nonce is None:
-                # This could happen if a new address was added after startup.
-                # A robust implementation might re-sync here.
-                # For now, I will raise an error.
-                raise ValueError(
-                    f"Nonce for address {address} is not managed. Please restart the API.")
+    def _has_live_reservations(self, address: str) -> bool:
+        reserved = self._reserved[address]
+        oldest_allowed = self._clock() - self.reservation_ttl
+        for nonce, reserved_at in list(reserved.items()):
+            if reserved_at < oldest_allowed:
+                print(f"NONCE REPAIR: Reservation of nonce {nonce} for {address} was abandoned.")
+                del reserved[nonce]
+        return bool(reserved)
+
+    async def _repair_address(self, address: str) -> None:
+        with use_rpc_priority(RpcPriority.BACKGROUND):
+            chain_pending = await self._blockchain_service.get_transaction_count(
+                address, "pending")
+
+        async with self._lock_for(address):
+            await self._apply_pending_count(address, chain_pending)
+            self._mark_dirty(address)
+
+    async def _apply_pending_count(self, address: str, chain_pending: int) -> None:
+        # Nonces below the pending count were used by a transaction already
+        released = [n for n in self._released[address] if n >= chain_pending]
+        heapq.heapify(released)
+        self._released[address] = released
+
+        if chain_pending > self._nonces[address]:
+            # Sent from outside this service
+            print(
+                f"NONCE REPAIR: {address} advanced from {self._nonces[address]} to {chain_pending} on the node.")
+            await self._advance_to(address, chain_pending)
+            self._suspected_gaps.pop(address, None)
+            return
+
+        if (chain_pending == self._nonces[address] or self._has_live_reservations(address)
+                or chain_pending in released or not self._owns_nonce(address, chain_pending)):
+            self._suspected_gaps.pop(address, None)
+            return
+
+        # A committed transaction never reached the mempool. Checked on two passes,
+        # so a transaction still propagating is not mistaken for a gap.
+        if self._suspected_gaps.get(address) != chain_pending:
+            self._suspected_gaps[address] = chain_pending
+            return
+
+        del self._suspected_gaps[address]
+        print(
+            f"NONCE REPAIR: Gap at nonce {chain_pending} for {address}, it will be reused.")
+        heapq.heappush(released, chain_pending)
+        self._trim_released(address)
+
+    async def repair_nonce(self, address: str) -> None:
+        if address in self._nonces:
+            await self._repair_address(address)
+
+    def _needs_repair(self, address: str, used: Set[str]) -> bool:
+        return (address in used or bool(self._reserved.get(address)) or bool(self._released.get(address))
+                or address in self._suspected_gaps)
+
+    async def repair_nonces(self) -> None:
+        """
+        Checks the addresses that can have drifted from the node: the ones used
+        since the last pass, or still holding reservations, released nonces or a
+        suspected gap. Idle addresses cost no RPC call.
+        """
+        used, self._used_since_repair = self._used_since_repair, set()
+        addresses = [address for address in list(self._nonces) if self._needs_repair(address, used)]
+        semaphore = asyncio.Semaphore(self.warm_up_concurrency)
+
+        async def repair(address: str) -> None:
+            async with semaphore:
+                try:
+                    await self._repair_address(address)
+                except Exception as e:
+                    print(f"NONCE REPAIR ERROR: Could not check nonce of {address}: {e}")
+
+        await asyncio.gather(*(repair(address) for address in addresses))
 
-            # Increment the nonce for the next request
-            self._nonces[address] = current_nonce + 1
+    def start(self) -> None:
+        self._repairs.start()
+        if self._checkpoint_repo_factory is not None:
+            self._checkpoint_flushes.start()
 
-            return current_nonce
+    async def stop(self) -> None:
+        await self._repairs.stop()
+        await self._checkpoint_flushes.stop()
+        if self._checkpoint_repo_factory is not None:
+            # Last nonces handed out before shutdown
+            await self.flush_checkpoints()
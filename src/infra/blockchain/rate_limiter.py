@@ -0,0 +1,146 @@
+import asyncio
+import enum
+import time
+from collections import deque
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+
+class RpcPriority(enum.IntEnum):
+    """Priority classes of RPC calls, lower values are served first."""
+    BROADCAST = 0
+    USER_READ = 1
+    BACKGROUND = 2
+
+
+# Priority of the RPC calls made by the current task. Tasks inherit it when created.
+rpc_priority: ContextVar[RpcPriority] = ContextVar(
+    "rpc_priority", default=RpcPriority.USER_READ)
+
+
+@contextmanager
+def use_rpc_priority(priority: RpcPriority) -> Iterator[None]:
+    token = rpc_priority.set(priority)
+    try:
+        yield
+    finally:
+        rpc_priority.reset(token)
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float, clock: Callable[[], float] = time.monotonic):
+        if rate <= 0 or burst < 1:
+            raise ValueError("Token bucket rate must be positive and burst at least 1.")
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated_at = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens +
+                           (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def available(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def take(self, cost: float) -> None:
+        """Takes the full cost, leaving the bucket in debt if it is larger than the balance."""
+        self._refill()
+        self._tokens -= cost
+
+    def wait_time(self, cost: float) -> float:
+        """
+        Seconds until a call of `cost` may go. A cost above the burst only waits
+        for a full bucket, and the debt it leaves is paid back by later callers.
+        """
+        return max(0.0, (min(cost, self.burst) - self.available()) / self.rate)
+
+
+class PriorityRateLimiter:
+    """
+    Client-side token bucket in front of the provider's request budget.
+
+    Every call takes tokens from the shared provider bucket and from the bucket of
+    its priority class. When the shared budget is short, waiting broadcasts go first,
+    then user-facing reads, then background polling. A class that exhausted its own
+    budget does not hold back the classes below it.
+
+    Waiters do not poll: each acquire queues a future, and a single timer wakes the
+    dispatcher when the next queue head can go.
+    """
+
+    def __init__(
+        self,
+        total: Tuple[float, float],
+        budgets: Dict[RpcPriority, Tuple[float, float]],
+        clock: Callable[[], float] = time.monotonic,
+        min_wait: float = 0.005,
+    ):
+        self._shared = TokenBucket(*total, clock=clock)
+        self._buckets = {
+            priority: TokenBucket(*budgets[priority], clock=clock) for priority in RpcPriority
+        }
+        self._queues: Dict[RpcPriority, deque] = {
+            priority: deque() for priority in RpcPriority}
+        self.min_wait = min_wait
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def queue_depth(self, priority: RpcPriority) -> int:
+        return len(self._queues[priority])
+
+    def _dispatch(self) -> None:
+        """Grants every queue head that can go, then schedules the next wake-up."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        next_wake: Optional[float] = None
+        for priority in RpcPriority:
+            queue = self._queues[priority]
+            bucket = self._buckets[priority]
+            held_by_shared_budget = False
+            while queue:
+                future, cost = queue[0]
+                if future.done():
+                    # Cancelled while queued
+                    queue.popleft()
+                    continue
+                own_wait = bucket.wait_time(cost)
+                shared_wait = self._shared.wait_time(cost)
+                if own_wait == 0 and shared_wait == 0:
+                    self._shared.take(cost)
+                    bucket.take(cost)
+                    queue.popleft()
+                    future.set_result(None)
+                    continue
+                delay = max(own_wait, shared_wait)
+                next_wake = delay if next_wake is None else min(next_wake, delay)
+                held_by_shared_budget = own_wait == 0
+                break
+            if held_by_shared_budget:
+                # The next shared tokens go to this class, lower classes wait behind it
+                break
+
+        if next_wake is not None:
+            self._timer = asyncio.get_running_loop().call_later(
+                max(next_wake, self.min_wait), self._dispatch)
+
+    async def acquire(self, priority: RpcPriority, cost: float = 1) -> None:
+        future = asyncio.get_running_loop().create_future()
+        queue = self._queues[priority]
+        queue.append((future, cost))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.cancelled():
+                # Still queued: drop it, the next waiter may now be at the head
+                with suppress(ValueError):
+                    queue.remove((future, cost))
+                self._dispatch()
+            raise
@@ -0,0 +1,204 @@
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+from aiohttp import ClientError
+from web3 import AsyncWeb3
+from src.core.constants import (
+    RPC_EWMA_ALPHA,
+    RPC_LATENCY_WINDOW,
+    RPC_ERROR_RATE_THRESHOLD,
+    RPC_UNHEALTHY_COOLDOWN_SECONDS,
+    RPC_HEDGE_DELAY_SECONDS,
+)
+
+# Errors that mean the endpoint itself failed. RPC errors (e.g. a reverted estimate)
+# are valid answers from a healthy node and are returned to the caller as they are.
+TRANSPORT_ERRORS = (ClientError, asyncio.TimeoutError, OSError)
+
+RpcCall = Callable[[AsyncWeb3], Awaitable[Any]]
+# Awaited before every request sent to an endpoint, e.g. to take rate-limit tokens
+RpcCharge = Optional[Callable[[], Awaitable[None]]]
+
+
+class RpcEndpoint:
+    """Latency and error statistics of a single JSON-RPC endpoint."""
+
+    def __init__(
+        self,
+        url: str,
+        web3: AsyncWeb3,
+        ewma_alpha: float = RPC_EWMA_ALPHA,
+        latency_window: int = RPC_LATENCY_WINDOW,
+    ):
+        self.url = url
+        self.web3 = web3
+        self.ewma_alpha = ewma_alpha
+        self.latency_ewma: Optional[float] = None
+        self.error_rate = 0.0
+        self.last_failure_at: Optional[float] = None
+        self._latencies: deque = deque(maxlen=latency_window)
+
+    def record_latency(self, latency: float) -> None:
+        self._latencies.append(latency)
+        if self.latency_ewma is None:
+            self.latency_ewma = latency
+        else:
+            self.latency_ewma += self.ewma_alpha * \
+                (latency - self.latency_ewma)
+
+    def record_success(self, latency: float) -> None:
+        self.record_latency(latency)
+        self.error_rate *= 1 - self.ewma_alpha
+
+    def record_failure(self, now: float) -> None:
+        self.error_rate += self.ewma_alpha * (1 - self.error_rate)
+        self.last_failure_at = now
+
+    def p95_latency(self) -> Optional[float]:
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[math.ceil(0.95 * len(ordered)) - 1]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "latency_ewma": self.latency_ewma,
+            "latency_p95": self.p95_latency(),
+            "error_rate": self.error_rate,
+        }
+
+
+class RpcPool:
+    """
+    Routes JSON-RPC calls across several endpoints serving the same chain.
+
+    Reads go to the healthy endpoint with the lowest latency EWMA and fail over to
+    the next one on transport errors. With hedging enabled, a read that takes longer
+    than the endpoint's p95 latency is duplicated on the runner-up and the first
+    answer wins. Writes are pinned to the primary (first) endpoint and never retried
+    elsewhere, so a signed transaction is broadcast through a single node.
+
+    The optional `charge` of a call is awaited before each request it sends, so
+    hedged duplicates and failover retries are charged like the first attempt.
+    """
+
+    def __init__(
+        self,
+        endpoints: Sequence[RpcEndpoint],
+        hedge_reads: bool = False,
+        hedge_delay: float = RPC_HEDGE_DELAY_SECONDS,
+        error_rate_threshold: float = RPC_ERROR_RATE_THRESHOLD,
+        unhealthy_cooldown: float = RPC_UNHEALTHY_COOLDOWN_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not endpoints:
+            raise ValueError("RPC pool requires at least one endpoint.")
+
+        self.endpoints = list(endpoints)
+        self.hedge_reads = hedge_reads
+        self.hedge_delay = hedge_delay
+        self.error_rate_threshold = error_rate_threshold
+        self.unhealthy_cooldown = unhealthy_cooldown
+        self._clock = clock
+        self.hedged_reads = 0
+
+    @property
+    def primary(self) -> RpcEndpoint:
+        return self.endpoints[0]
+
+    def is_healthy(self, endpoint: RpcEndpoint) -> bool:
+        if endpoint.error_rate < self.error_rate_threshold:
+            return True
+        # After the cooldown the endpoint gets traffic again, acting as a probe
+        return self._clock() - endpoint.last_failure_at >= self.unhealthy_cooldown
+
+    def ranked(self) -> List[RpcEndpoint]:
+        """Healthy endpoints first, fastest first. Unmeasured endpoints are tried early."""
+        return sorted(
+            self.endpoints,
+            key=lambda e: (not self.is_healthy(e), e.latency_ewma or 0.0),
+        )
+
+    async def _timed(self, endpoint: RpcEndpoint, call: RpcCall, charge: RpcCharge = None) -> Any:
+        if charge is not None:
+            await charge()
+        started = self._clock()
+        try:
+            result = await call(endpoint.web3)
+        except TRANSPORT_ERRORS:
+            endpoint.record_failure(self._clock())
+            raise
+        except asyncio.CancelledError:
+            # Lost a hedge race, the elapsed time is a lower bound of its latency
+            endpoint.record_latency(self._clock() - started)
+            raise
+        except Exception:
+            endpoint.record_success(self._clock() - started)
+            raise
+        endpoint.record_success(self._clock() - started)
+        return result
+
+    async def _hedged(
+        self, endpoint: RpcEndpoint, backup: RpcEndpoint, call: RpcCall, charge: RpcCharge = None
+    ) -> Any:
+        # Charged before the hedge delay starts, so waiting for tokens never triggers a hedge
+        if charge is not None:
+            await charge()
+        first_task = asyncio.ensure_future(self._timed(endpoint, call))
+        delay = endpoint.p95_latency()
+        done, _ = await asyncio.wait(
+            {first_task}, timeout=self.hedge_delay if delay is None else delay)
+        if done:
+            if isinstance(first_task.exception(), TRANSPORT_ERRORS):
+                # Failed fast, nothing to hedge against, just fail over
+                return await self._timed(backup, call, charge)
+            return first_task.result()
+
+        self.hedged_reads += 1
+        pending = {first_task, asyncio.ensure_future(self._timed(backup, call, charge))}
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+                    if not isinstance(error, TRANSPORT_ERRORS):
+                        raise error
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def read(self, call: RpcCall, charge: RpcCharge = None) -> Any:
+        """Runs an idempotent call on the best endpoint, failing over on transport errors."""
+        candidates = self.ranked()
+        last_error: Optional[BaseException] = None
+        i = 0
+        while i < len(candidates):
+            endpoint = candidates[i]
+            try:
+                if self.hedge_reads and i + 1 < len(candidates):
+                    backup = candidates[i + 1]
+                    i += 2
+                    return await self._hedged(endpoint, backup, call, charge)
+                i += 1
+                return await self._timed(endpoint, call, charge)
+            except TRANSPORT_ERRORS as e:
+                last_error = e
+        raise last_error
+
+    async def write(self, call: RpcCall, charge: RpcCharge = None) -> Any:
+        """Runs a non-idempotent call on the primary endpoint only."""
+        return await self._timed(self.primary, call, charge)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        return [
+            {**endpoint.stats(), "healthy": self.is_healthy(endpoint)}
+            for endpoint in self.endpoints
+        ]
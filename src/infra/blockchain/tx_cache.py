@@ -0,0 +1,92 @@
+import sys
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+CachedTransaction = Tuple[Dict[str, Any], Dict[str, Any], int]
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate memory footprint in bytes of a decoded RPC result."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(k) + estimate_size(v)
+                    for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(estimate_size(item) for item in value)
+    return size
+
+
+class FinalizedTransactionCache:
+    """
+    Bounded LRU cache of transactions and receipts keyed by tx hash.
+
+    Only transactions buried under at least `min_confirmations` blocks are admitted,
+    since they no longer change. Entries are evicted in LRU order when either the
+    entry count or the memory budget is exceeded.
+    """
+
+    def __init__(self, min_confirmations: int, max_entries: int, max_bytes: int):
+        self.min_confirmations = min_confirmations
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[CachedTransaction, int]]" = OrderedDict()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(tx_hash: str) -> str:
+        return tx_hash.lower()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, tx_hash: str) -> Optional[CachedTransaction]:
+        """
+        Returns (tx, receipt, block number seen at admission) or None.
+        The block number is a lower bound of the current head.
+        """
+        key = self._key(tx_hash)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, tx_hash: str, tx: Optional[Dict[str, Any]], receipt: Optional[Dict[str, Any]], latest_block: int) -> bool:
+        """Admits the entry only if it is final. Returns whether it was cached."""
+        if not tx or not receipt or receipt.get("blockNumber") is None:
+            return False
+
+        confirmations = latest_block - receipt["blockNumber"] + 1
+        if confirmations < self.min_confirmations:
+            return False
+
+        entry_size = estimate_size(tx) + estimate_size(receipt)
+        if entry_size > self.max_bytes:
+            return False
+
+        key = self._key(tx_hash)
+        if key in self._entries:
+            self.size_bytes -= self._entries.pop(key)[1]
+
+        self._entries[key] = ((tx, receipt, latest_block), entry_size)
+        self.size_bytes += entry_size
+        self._evict()
+        return True
+
+    def _evict(self) -> None:
+        while self._entries and (len(self._entries) > self.max_entries or self.size_bytes > self.max_bytes):
+            _, (_, entry_size) = self._entries.popitem(last=False)
+            self.size_bytes -= entry_size
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self.size_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
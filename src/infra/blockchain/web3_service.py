@@ -1,8 +1,55 @@
+import asyncio
 import json
-from typing import List, Dict, Any, Optional
+from functools import lru_cache, partial
+from typing import List, Dict, Any, Iterable, Optional, Sequence, Tuple, Union
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 from web3 import AsyncWeb3, AsyncHTTPProvider, Web3
-from web3.exceptions import TransactionNotFound, TimeExhausted
+from web3.exceptions import TransactionNotFound, Web3RPCError
+from eth_abi.exceptions import DecodingError
 from src.core.interfaces import IBlockchainService
+from .erc20_decoder import SelectorDecoder
+from .head_tracker import BlockHeadTracker
+from .tx_cache import FinalizedTransactionCache
+from .rpc_pool import RpcCall, RpcEndpoint, RpcPool
+from .singleflight import SingleFlight
+from .rate_limiter import PriorityRateLimiter, RpcPriority, rpc_priority, use_rpc_priority
+from src.core.constants import (
+    MIN_CONFIRMATIONS,
+    RPC_POOL_SIZE,
+    RPC_KEEPALIVE_TIMEOUT_SECONDS,
+    RPC_CONNECT_TIMEOUT_SECONDS,
+    RPC_REQUEST_TIMEOUT_SECONDS,
+    HEAD_POLL_INTERVAL_SECONDS,
+    HEAD_MAX_STALENESS_SECONDS,
+    TX_CACHE_MAX_ENTRIES,
+    TX_CACHE_MAX_BYTES,
+    RPC_HEDGE_READS,
+    RPC_HEDGE_DELAY_SECONDS,
+    RPC_COALESCED_METHODS,
+)
+
+# JSON-RPC methods accepted by batch_call and their web3.py counterparts
+RPC_METHODS = {
+    "eth_getTransactionByHash": "get_transaction",
+    "eth_getTransactionReceipt": "get_transaction_receipt",
+    "eth_blockNumber": "get_block_number",
+    "eth_getBlockByNumber": "get_block",
+    "eth_getTransactionCount": "get_transaction_count",
+    "eth_getBalance": "get_balance",
+    "eth_getCode": "get_code",
+    "eth_feeHistory": "fee_history",
+    "eth_sendRawTransaction": "send_raw_transaction",
+}
+
+# Calls that change node state, never shared between callers
+NON_IDEMPOTENT_METHODS = frozenset({"eth_sendRawTransaction", "eth_sendTransaction"})
+
+
+@lru_cache(maxsize=1)
+def load_erc20_abi() -> Tuple[Dict[str, Any], ...]:
+    # Read from disk once per process instead of once per service instance
+    with open("src/infra/blockchain/erc20_abi.json") as f:
+        return tuple(json.load(f))
 
 
 class Web3BlockchainService(IBlockchainService):
@@ -10,62 +57,375 @@ class Web3BlockchainService(IBlockchainService):
     Concrete implementation of IBlockchainService using the web3.py library.
     """
 
-    def __init__(self, rpc_url: str):
-        if not rpc_url:
+    def __init__(
+        self,
+        rpc_url: Union[str, Sequence[str]],
+        pool_size: int = RPC_POOL_SIZE,
+        keepalive_timeout: float = RPC_KEEPALIVE_TIMEOUT_SECONDS,
+        connect_timeout: float = RPC_CONNECT_TIMEOUT_SECONDS,
+        request_timeout: float = RPC_REQUEST_TIMEOUT_SECONDS,
+        head_poll_interval: float = HEAD_POLL_INTERVAL_SECONDS,
+        head_max_staleness: float = HEAD_MAX_STALENESS_SECONDS,
+        min_confirmations: int = MIN_CONFIRMATIONS,
+        tx_cache_max_entries: int = TX_CACHE_MAX_ENTRIES,
+        tx_cache_max_bytes: int = TX_CACHE_MAX_BYTES,
+        hedge_reads: bool = RPC_HEDGE_READS,
+        hedge_delay: float = RPC_HEDGE_DELAY_SECONDS,
+        coalesced_methods: Iterable[str] = RPC_COALESCED_METHODS,
+        rate_limiter: Optional[PriorityRateLimiter] = None,
+    ):
+        rpc_urls = [rpc_url] if isinstance(rpc_url, str) else list(rpc_url)
+        rpc_urls = [url.strip() for url in rpc_urls if url and url.strip()]
+        if not rpc_urls:
             raise ValueError("RPC URL cannot be empty.")
 
-        self.web3 = AsyncWeb3(AsyncHTTPProvider(rpc_url))
+        self.pool_size = pool_size
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = ClientTimeout(
+            total=request_timeout, connect=connect_timeout)
+        self._session: Optional[ClientSession] = None
+        self.hedge_reads = hedge_reads
+        self.hedge_delay = hedge_delay
+
+        # The first endpoint is the primary, every broadcast goes through it
+        self.rpc_pool = RpcPool(
+            [
+                RpcEndpoint(url, AsyncWeb3(AsyncHTTPProvider(
+                    url, request_kwargs={"timeout": self.timeout})))
+                for url in rpc_urls
+            ],
+            hedge_reads=hedge_reads,
+            hedge_delay=hedge_delay,
+        )
+
+        # Concurrent identical reads share one in-flight call
+        self.singleflight = SingleFlight()
+        self.coalesced_methods = frozenset(coalesced_methods) - NON_IDEMPOTENT_METHODS
+
+        # Keeps every caller within the provider's request budget, by priority class
+        self.rate_limiter = rate_limiter
 
         # More robust way, like use local cache database and block explorer or Postgres with JSON field
-        with open("src/infra/blockchain/erc20_abi.json") as f:
-            self.erc20_abi = json.load(f)
+        self.erc20_abi = list(load_erc20_abi())
+        self.erc20_decoder = SelectorDecoder(self.erc20_abi)
+
+        # Serves the latest block number and base fee from memory while it is fresh
+        self.head_tracker = BlockHeadTracker(
+            fetch_block_number=self._fetch_block_number,
+            fetch_latest_block=self._fetch_latest_block,
+            poll_interval=head_poll_interval,
+            max_staleness=head_max_staleness,
+        )
+
+        # Final transactions never change, so retried validations cost no RPC
+        self.tx_cache = FinalizedTransactionCache(
+            min_confirmations=min_confirmations,
+            max_entries=tx_cache_max_entries,
+            max_bytes=tx_cache_max_bytes,
+        )
+
+    @property
+    def web3(self) -> AsyncWeb3:
+        """Web3 instance of the primary endpoint."""
+        return self.rpc_pool.primary.web3
+
+    @web3.setter
+    def web3(self, web3: AsyncWeb3) -> None:
+        # Replaces the pool with a single endpoint (e.g. an in-memory test chain)
+        self.rpc_pool = RpcPool(
+            [RpcEndpoint(str(web3.provider), web3)],
+            hedge_reads=self.hedge_reads,
+            hedge_delay=self.hedge_delay,
+        )
+
+    def _http_providers(self) -> List[AsyncHTTPProvider]:
+        return [
+            endpoint.web3.provider for endpoint in self.rpc_pool.endpoints
+            if isinstance(endpoint.web3.provider, AsyncHTTPProvider)
+        ]
+
+    async def connect(self) -> None:
+        """
+        Opens the shared HTTP session with a bounded keep-alive connection pool.
+        Without it, web3.py opens a session that closes the connection after every call.
+        """
+        if self._session and not self._session.closed:
+            return
+
+        self._session = ClientSession(
+            raise_for_status=True,
+            timeout=self.timeout,
+            connector=TCPConnector(
+                limit=self.pool_size * len(self.rpc_pool.endpoints),
+                limit_per_host=self.pool_size,
+                keepalive_timeout=self.keepalive_timeout,
+            ),
+        )
+        for provider in self._http_providers():
+            await provider.cache_async_session(self._session)
+        # The polling task inherits the priority of the context it is created in
+        with use_rpc_priority(RpcPriority.BACKGROUND):
+            self.head_tracker.start()
+
+    async def close(self) -> None:
+        """Closes the pooled connections. Called on API shutdown."""
+        await self.head_tracker.stop()
+        for provider in self._http_providers():
+            await provider.disconnect()
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _rpc(
+        self,
+        call: RpcCall,
+        cost: int = 1,
+        pinned: bool = False,
+        priority: Optional[RpcPriority] = None,
+    ) -> Any:
+        charge = None
+        if self.rate_limiter is not None:
+            priority = rpc_priority.get() if priority is None else priority
+
+            async def charge() -> None:
+                # Every request the pool sends is charged, hedges and retries included
+                await self.rate_limiter.acquire(priority, cost)
+        if pinned:
+            return await self.rpc_pool.write(call, charge)
+        return await self.rpc_pool.read(call, charge)
+
+    async def _read(self, method: str, params: Any, call: RpcCall) -> Any:
+        if method in self.coalesced_methods:
+            return await self._coalesce(method, params, call)
+        return await self._rpc(call)
+
+    async def _coalesce(self, method: str, params: Any, call: RpcCall, cost: int = 1) -> Any:
+        # Per priority class, so a user read never waits behind a background call's tokens
+        key = (method, json.dumps(params, sort_keys=True, default=str), rpc_priority.get())
+        return await self.singleflight.do(key, lambda: self._rpc(call, cost))
 
     async def is_connected(self) -> bool:
-        return await self.web3.is_connected()
+        return await self._rpc(lambda w3: w3.is_connected())
 
     async def get_transaction_details(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        cached = self.tx_cache.get(tx_hash)
+        if cached:
+            return cached[0]
         try:
-            tx = await self.web3.eth.get_transaction(tx_hash)
+            tx = await self._read(
+                "eth_getTransactionByHash", [tx_hash],
+                lambda w3: w3.eth.get_transaction(tx_hash))
             return dict(tx) if tx else None
         except TransactionNotFound:
             return None
 
     async def get_transaction_receipt(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        cached = self.tx_cache.get(tx_hash)
+        if cached:
+            return cached[1]
         try:
-            receipt = await self.web3.eth.get_transaction_receipt(tx_hash)
+            receipt = await self._read(
+                "eth_getTransactionReceipt", [tx_hash],
+                lambda w3: w3.eth.get_transaction_receipt(tx_hash))
             return dict(receipt) if receipt else None
         except TransactionNotFound:
             return None
 
+    async def _fetch_block_number(self) -> int:
+        return await self._read("eth_blockNumber", [], lambda w3: w3.eth.block_number)
+
+    async def _fetch_latest_block(self) -> Dict[str, Any]:
+        return await self._read(
+            "eth_getBlockByNumber", ["latest"], lambda w3: w3.eth.get_block('latest'))
+
     async def get_latest_block_number(self) -> int:
-        return await self.web3.eth.block_number
+        head = self.head_tracker.get_fresh_head()
+        if head:
+            return head.number
+        return await self._fetch_block_number()
+
+    @staticmethod
+    def _get_rpc_method(w3: AsyncWeb3, method: str):
+        # web3.py decides between executing and batching when the method is looked up
+        return getattr(w3.eth, RPC_METHODS[method])
+
+    @staticmethod
+    def _to_plain_result(result: Any) -> Any:
+        # web3.py wraps objects in AttributeDict, the rest of the API works with dicts
+        return dict(result) if hasattr(result, "keys") else result
+
+    async def _call_or_none(self, rpc_method, params: List[Any]) -> Any:
+        try:
+            return self._to_plain_result(await rpc_method(*params))
+        except TransactionNotFound:
+            return None
+
+    async def batch_call(self, calls: List[Tuple[str, List[Any]]]) -> List[Any]:
+        if not calls:
+            return []
+
+        unsupported = [method for method, _ in calls if method not in RPC_METHODS]
+        if unsupported:
+            raise ValueError(
+                f"JSON-RPC method {unsupported[0]} is not supported in batches.")
+
+        # A batch carrying a broadcast must not be duplicated across endpoints
+        if any(method == "eth_sendRawTransaction" for method, _ in calls):
+            return await self._rpc(
+                partial(self._batch_call_on, calls=calls),
+                cost=len(calls), pinned=True, priority=RpcPriority.BROADCAST)
+        call = partial(self._batch_call_on, calls=calls)
+        if all(method in self.coalesced_methods for method, _ in calls):
+            return await self._coalesce("batch", calls, call, cost=len(calls))
+        return await self._rpc(call, cost=len(calls))
+
+    async def _batch_call_on(self, w3: AsyncWeb3, calls: List[Tuple[str, List[Any]]]) -> List[Any]:
+        if not isinstance(w3.provider, AsyncHTTPProvider):
+            # Providers without JSON-RPC batch support (e.g. eth_tester) run the calls concurrently
+            return list(await asyncio.gather(*(
+                self._call_or_none(self._get_rpc_method(w3, method), params)
+                for method, params in calls
+            )))
+
+        # In batching mode web3.py only builds the request and its formatters
+        async with w3.batch_requests():
+            requests_info = await asyncio.gather(*(
+                self._get_rpc_method(w3, method)(*params) for method, params in calls
+            ))
+
+        make_batch_request = await w3.provider.batch_request_func(
+            w3, w3.middleware_onion)
+        responses = await make_batch_request([info[0] for info in requests_info])
+
+        if not isinstance(responses, list):
+            # The node rejected the whole batch with a single error object
+            raise Web3RPCError(
+                f"Batch request failed: {responses.get('error')}", rpc_response=responses)
+
+        results = []
+        for info, response in zip(requests_info, responses):
+            if "error" not in response and response.get("result") is None:
+                # Null results (e.g. unknown tx hash) must not fail the whole batch
+                results.append(None)
+                continue
+            formatted = w3.manager._format_batched_response(info, response)
+            results.append(self._to_plain_result(formatted))
+        return results
+
+    async def get_transaction_with_receipt(
+        self, tx_hash: str
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]], int]:
+        head = self.head_tracker.get_fresh_head()
+
+        cached = self.tx_cache.get(tx_hash)
+        if cached:
+            tx, receipt, admitted_at_block = cached
+            # The head can only move forward, so the admission block is a safe fallback
+            return tx, receipt, max(head.number, admitted_at_block) if head else admitted_at_block
+
+        if head:
+            tx, receipt = await self.batch_call([
+                ("eth_getTransactionByHash", [tx_hash]),
+                ("eth_getTransactionReceipt", [tx_hash]),
+            ])
+            latest_block = head.number
+        else:
+            tx, receipt, latest_block = await self.batch_call([
+                ("eth_getTransactionByHash", [tx_hash]),
+                ("eth_getTransactionReceipt", [tx_hash]),
+                ("eth_blockNumber", []),
+            ])
+
+        self.tx_cache.put(tx_hash, tx, receipt, latest_block)
+        return tx, receipt, latest_block
 
     async def get_base_fee(self) -> int:
-        latest_block = await self.web3.eth.get_block('latest')
-        return latest_block.get('baseFeePerGas', 0)
+        head = self.head_tracker.get_fresh_head()
+        if head:
+            return head.base_fee
+        latest_block = await self._fetch_latest_block()
+        return self.head_tracker.update_from_block(latest_block).base_fee
+
+    async def get_fee_history(self, block_count: int, reward_percentiles: List[float]) -> Dict[str, Any]:
+        history = await self._read(
+            "eth_feeHistory", [block_count, "latest", reward_percentiles],
+            lambda w3: w3.eth.fee_history(block_count, "latest", reward_percentiles))
+        return dict(history)
+
+    async def get_code(self, address: str) -> bytes:
+        code = await self._read(
+            "eth_getCode", [address, "latest"], lambda w3: w3.eth.get_code(address))
+        return bytes(code)
 
     async def estimate_gas(self, transaction: Dict[str, Any]) -> int:
-        return await self.web3.eth.estimate_gas(transaction)
+        return await self._read(
+            "eth_estimateGas", [transaction], lambda w3: w3.eth.estimate_gas(transaction))
 
     async def broadcast_transaction(self, signed_tx_hex: str) -> str:
-        tx_hash_bytes = await self.web3.eth.send_raw_transaction(signed_tx_hex)
+        tx_hash_bytes = await self._rpc(
+            lambda w3: w3.eth.send_raw_transaction(signed_tx_hex),
+            pinned=True, priority=RpcPriority.BROADCAST)
         return Web3.to_hex(tx_hash_bytes)
 
+    async def broadcast_transactions(self, signed_txs_hex: List[str]) -> List[Union[str, Exception]]:
+        if not signed_txs_hex:
+            return []
+        return await self._rpc(
+            partial(self._broadcast_batch_on, signed_txs_hex=signed_txs_hex),
+            cost=len(signed_txs_hex), pinned=True, priority=RpcPriority.BROADCAST)
+
+    async def _broadcast_batch_on(self, w3: AsyncWeb3, signed_txs_hex: List[str]) -> List[Union[str, Exception]]:
+        if not isinstance(w3.provider, AsyncHTTPProvider):
+            results = await asyncio.gather(*(
+                w3.eth.send_raw_transaction(signed_tx_hex) for signed_tx_hex in signed_txs_hex
+            ), return_exceptions=True)
+            return [
+                result if isinstance(result, Exception) else Web3.to_hex(result)
+                for result in results
+            ]
+
+        # web3.py refuses eth_sendRawTransaction in batches, so the raw batch is sent directly
+        responses = await w3.provider.make_batch_request([
+            ("eth_sendRawTransaction", [signed_tx_hex]) for signed_tx_hex in signed_txs_hex
+        ])
+        if not isinstance(responses, list):
+            raise Web3RPCError(
+                f"Batch request failed: {responses.get('error')}", rpc_response=responses)
+
+        # A rejected transaction does not fail the others
+        return [
+            Web3RPCError(str(response["error"]), rpc_response=response) if "error" in response
+            else response["result"]
+            for response in responses
+        ]
+
     async def get_eth_balance(self, address: str) -> int:
         if not self.web3.is_address(address):
             raise ValueError("Invalid Ethereum address provided.")
         checksum_address = self.web3.to_checksum_address(address)
         # This is an async method with the async provider
-        return await self.web3.eth.get_balance(checksum_address)
+        return await self._read(
+            "eth_getBalance", [checksum_address],
+            lambda w3: w3.eth.get_balance(checksum_address))
 
     def _decode_function_input(self, tx_input: str, contract_abi: List[Dict[str, Any]], to_address: str) -> Optional[Dict[str, Any]]:
+        # Fast path: selector lookup plus slicing, precompiled once for the ERC-20 ABI
+        decoder = self.erc20_decoder if contract_abi is self.erc20_abi else SelectorDecoder(
+            contract_abi)
+        try:
+            return decoder.decode(tx_input)
+        except (ValueError, DecodingError):
+            # Malformed calldata for a known selector, let the generic decoder decide
+            return self._decode_function_input_generic(tx_input, contract_abi, to_address)
+
+    def _decode_function_input_generic(self, tx_input: str, contract_abi: List[Dict[str, Any]], to_address: str) -> Optional[Dict[str, Any]]:
         try:
             # For contract interactions, web3.py handles sync/async internally
             contract = self.web3.eth.contract(
                 address=to_address, abi=contract_abi)
             func_obj, func_params = contract.decode_function_input(tx_input)
             return {"function": func_obj.fn_name, "params": func_params}
-        except ValueError:
+        except (ValueError, DecodingError):
             # Could not decode input data, likely not a call to a known function
             return None
 
@@ -73,26 +433,26 @@ class Web3BlockchainService(IBlockchainService):
         self, tx_hash: str, contract_abi: List[Dict[str, Any]]
     ) -> Optional[Dict[str, Any]]:
         tx = await self.get_transaction_details(tx_hash)
-        if not tx or not tx.get("to") or not tx.get("input"):
+        if not tx:
+            return None
+
+        return self.decode_transaction_input(tx, contract_abi)
+
+    def decode_transaction_input(
+        self, tx_details: Dict[str, Any], contract_abi: List[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        if not tx_details.get("to") or not tx_details.get("input"):
             return None
 
-        return self._decode_function_input(tx["input"], contract_abi, tx["to"])
+        return self._decode_function_input(tx_details["input"], contract_abi, tx_details["to"])
 
-    async def get_transaction_count(self, address: str) -> int:
+    async def get_transaction_count(self, address: str, block_identifier: str = "latest") -> int:
         if not self.web3.is_address(address):
             raise ValueError("Invalid Ethereum address provided.")
 
         checksum_address = self.web3.to_checksum_address(address)
 
-        return await self.web3.eth.get_transaction_count(checksum_address)
+        return await self._read(
+            "eth_getTransactionCount", [checksum_address, block_identifier],
+            lambda w3: w3.eth.get_transaction_count(checksum_address, block_identifier))
 
-    async def wait_for_transaction_receipt(
-            self, tx_hash: str, timeout: int) -> Optional[Dict[str, Any]]:
-        """
-        Waits for a transaction receipt to be available and returns it.
-        """
-        try:
-            receipt = await self.web3.eth.wait_for_transaction_receipt(tx_hash, timeout)
-            return dict(receipt) if receipt else None
-        except (TransactionNotFound, TimeExhausted):
-            return None
@@ -0,0 +1,7 @@
+# src/infra/concurrency/__init__.py
+
+from .bounded_executor import BoundedExecutor
+
+__all__ = [
+    "BoundedExecutor",
+]
@@ -0,0 +1,64 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable
+from src.core.interfaces import ITaskExecutor
+from src.core.constants import (
+    CPU_EXECUTOR_KIND,
+    CPU_EXECUTOR_MAX_WORKERS,
+    CPU_EXECUTOR_QUEUE_SIZE,
+)
+
+
+class BoundedExecutor(ITaskExecutor):
+    """
+    Runs CPU-bound calls on a thread or process pool, so the event loop keeps
+    serving other requests meanwhile.
+
+    At most `max_workers + queue_size` calls are handed to the pool; further callers
+    wait on the event loop, so a payout burst cannot pile up unbounded work (and
+    decrypted keys) in the pool's queue. A process pool needs picklable functions
+    and arguments, but is not limited by the GIL. Its workers are spawned, not
+    forked, since forking the threaded API process can deadlock the child.
+    """
+
+    def __init__(
+        self,
+        kind: str = CPU_EXECUTOR_KIND,
+        max_workers: int = CPU_EXECUTOR_MAX_WORKERS,
+        queue_size: int = CPU_EXECUTOR_QUEUE_SIZE,
+    ):
+        if max_workers < 1 or queue_size < 0:
+            raise ValueError("Executor needs at least one worker and a non-negative queue size.")
+        if kind == "thread":
+            self._pool: Executor = ThreadPoolExecutor(max_workers, thread_name_prefix="cpu-worker")
+        elif kind == "process":
+            self._pool = ProcessPoolExecutor(
+                max_workers, mp_context=multiprocessing.get_context("spawn"))
+        else:
+            raise ValueError(f"Unknown executor kind '{kind}', expected 'thread' or 'process'.")
+        self.kind = kind
+        self.max_workers = max_workers
+        self.queue_size = queue_size
+        self._slots = asyncio.Semaphore(max_workers + queue_size)
+        self._waiting = 0
+
+    @property
+    def waiting(self) -> int:
+        """Calls waiting for room in the pool."""
+        return self._waiting
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        self._waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self._waiting -= 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._pool, partial(func, *args))
+        finally:
+            self._slots.release()
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
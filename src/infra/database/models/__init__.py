@@ -2,8 +2,14 @@
 
 from .transaction_db import TransactionDB
 from .address_db import AddressDB
+from .nonce_db import NonceDB
+from .nonce_checkpoint_db import NonceCheckpointDB
+from .lease_db import LeaseDB
 
 __all__ = [
     "TransactionDB",
     "AddressDB",
+    "NonceDB",
+    "NonceCheckpointDB",
+    "LeaseDB",
 ]
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Index, Integer, String
+from src.core.enums import AddressStatus
 from ..config import Base
 
 
@@ -8,3 +9,13 @@ class AddressDB(Base):
     id = Column(Integer, primary_key=True, index=True)
     public_address = Column(String, unique=True, index=True, nullable=False)
     encrypted_private_key = Column(String, nullable=False)
+    # Unique through ix_addresses_derivation_index, which the schema upgrade also creates
+    derivation_index = Column(Integer, nullable=True)
+    status = Column(String, nullable=False, default=AddressStatus.ASSIGNED.value,
+                    server_default=AddressStatus.ASSIGNED.value)
+
+    # Handing out from the pool reads the oldest unassigned rows
+    __table_args__ = (
+        Index("ix_addresses_status_id", "status", "id"),
+        Index("ix_addresses_derivation_index", "derivation_index", unique=True),
+    )
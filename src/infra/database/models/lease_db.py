@@ -0,0 +1,10 @@
+from sqlalchemy import Column, Float, String
+from ..config import Base
+
+
+class LeaseDB(Base):
+    __tablename__ = "leases"
+
+    name = Column(String, primary_key=True, index=True)
+    holder = Column(String, nullable=False)
+    expires_at = Column(Float, nullable=False)  # Unix time
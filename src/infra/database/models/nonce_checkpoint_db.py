@@ -0,0 +1,9 @@
+from sqlalchemy import Column, Integer, String
+from ..config import Base
+
+
+class NonceCheckpointDB(Base):
+    __tablename__ = "nonce_checkpoints"
+
+    address = Column(String, primary_key=True, index=True)
+    next_nonce = Column(Integer, nullable=False)
@@ -0,0 +1,9 @@
+from sqlalchemy import Column, Integer, String
+from ..config import Base
+
+
+class NonceDB(Base):
+    __tablename__ = "nonces"
+
+    address = Column(String, primary_key=True, index=True)
+    next_nonce = Column(Integer, nullable=False)
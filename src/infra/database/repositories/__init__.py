@@ -2,8 +2,12 @@
 
 from .address_repository import AddressRepository
 from .transaction_repository import TransactionRepository
+from .nonce_repository import NonceRepository
+from .nonce_checkpoint_repository import NonceCheckpointRepository
 
 __all__ = [
     "AddressRepository",
     "TransactionRepository",
+    "NonceRepository",
+    "NonceCheckpointRepository",
 ]
@@ -1,26 +1,96 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from src.core.interfaces import IAddressRepository
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import func, insert, or_, select, update
+from src.core.interfaces import IAddressRepository, IManagedAddressIndex
 from src.core.entities.address import Address
+from src.core.enums import AddressStatus
+from src.core.constants import ADDRESS_INSERT_CHUNK_SIZE
 from .. import models
 
+# Duplicates listed per chunk in the create_many error
+REPORTED_DUPLICATES_PER_CHUNK = 10
+# Row of the leases table held by the worker refilling the address pool
+POOL_REFILL_LEASE = "address_pool_refill"
+
 
 class AddressRepository(IAddressRepository):
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        insert_chunk_size: int = ADDRESS_INSERT_CHUNK_SIZE,
+        address_index: Optional[IManagedAddressIndex] = None
+    ):
         self.db = db
+        self.insert_chunk_size = insert_chunk_size
+        self.address_index = address_index
 
     async def create_many(self, addresses: List[Address]) -> None:
-        db_addresses = [
-            models.AddressDB(**address.model_dump()) for address in addresses
-        ]
+        if not addresses:
+            return
 
-        self.db.add_all(db_addresses)
+        # Core insert, one executemany per chunk instead of one ORM object per row
+        rows = [address.model_dump(mode="json") for address in addresses]
+        chunks = [rows[start:start + self.insert_chunk_size]
+                  for start in range(0, len(rows), self.insert_chunk_size)]
 
-        await self.db.commit()
+        try:
+            for chunk in chunks:
+                await self.db.execute(insert(models.AddressDB.__table__), chunk)
+            await self.db.commit()
+        except IntegrityError as e:
+            # Nothing is stored, the whole batch is one transaction
+            await self.db.rollback()
+            raise ValueError(await self._duplicates_report(chunks, e)) from e
+
+        if self.address_index is not None:
+            # Visible to this process at once, others pick it up on their next refresh.
+            # Pooled rows only become managed once they are handed out
+            self.address_index.add(row["public_address"] for row in rows
+                                   if row["status"] == AddressStatus.ASSIGNED.value)
+
+    async def _duplicates_report(self, chunks: List[List[Dict]], error: IntegrityError) -> str:
+        """Lists, per chunk, the addresses already stored or repeated in the batch."""
+        seen: Set[str] = set()
+        lines = []
+        for number, chunk in enumerate(chunks, start=1):
+            addresses = [row["public_address"] for row in chunk]
+            result = await self.db.execute(
+                select(models.AddressDB.public_address).where(
+                    models.AddressDB.public_address.in_(addresses)))
+            stored = set(result.scalars().all())
+
+            duplicates = []
+            for address in addresses:
+                if address in stored or address in seen:
+                    duplicates.append(address)
+                seen.add(address)
+            if duplicates:
+                first_row = (number - 1) * self.insert_chunk_size
+                listed = ", ".join(duplicates[:REPORTED_DUPLICATES_PER_CHUNK])
+                if len(duplicates) > REPORTED_DUPLICATES_PER_CHUNK:
+                    listed += ", ..."
+                lines.append(f"  chunk {number} (rows {first_row}-{first_row + len(chunk) - 1}): "
+                             f"{len(duplicates)} duplicate(s), {listed}")
+
+        if not lines:
+            # Another unique column, e.g. a derivation index taken concurrently
+            return f"One of the addresses already exists: {error.orig}"
+        return "One of the addresses already exists, no address was stored:\n" + "\n".join(lines)
+
+    async def list_public_addresses(self, after_id: int, limit: int) -> List[Tuple[int, str]]:
+        query = select(models.AddressDB.id, models.AddressDB.public_address).where(
+            models.AddressDB.id > after_id,
+            models.AddressDB.status == AddressStatus.ASSIGNED.value,
+        ).order_by(models.AddressDB.id).limit(limit)
+
+        result = await self.db.execute(query)
+
+        return [(row_id, public_address) for row_id, public_address in result.all()]
 
     async def get_all(self) -> List[Address]:
-        query = select(models.AddressDB)
+        query = select(models.AddressDB).where(
+            models.AddressDB.status == AddressStatus.ASSIGNED.value)
 
         result = await self.db.execute(query)
 
@@ -28,9 +98,98 @@ class AddressRepository(IAddressRepository):
 
         return [Address.model_validate(addr) for addr in db_addresses]
 
+    async def count_unassigned(self) -> int:
+        query = select(func.count()).select_from(models.AddressDB).where(
+            models.AddressDB.status == AddressStatus.UNASSIGNED.value)
+
+        result = await self.db.execute(query)
+
+        return result.scalar_one()
+
+    async def oldest_unassigned_id(self) -> Optional[int]:
+        query = select(func.min(models.AddressDB.id)).where(
+            models.AddressDB.status == AddressStatus.UNASSIGNED.value)
+
+        result = await self.db.execute(query)
+
+        return result.scalar_one_or_none()
+
+    async def assign_unassigned(self, count: int) -> List[Address]:
+        # Oldest pooled rows first; concurrent requests skip rows locked by another (PostgreSQL)
+        pooled = select(models.AddressDB.id).where(
+            models.AddressDB.status == AddressStatus.UNASSIGNED.value
+        ).order_by(models.AddressDB.id).limit(count).with_for_update(skip_locked=True)
+
+        query = update(models.AddressDB).where(
+            models.AddressDB.id.in_(pooled.scalar_subquery()),
+            models.AddressDB.status == AddressStatus.UNASSIGNED.value,
+        ).values(status=AddressStatus.ASSIGNED.value).execution_options(synchronize_session=False)
+
+        if self.db.get_bind().dialect.update_returning:
+            # SQLite 3.35+, PostgreSQL, MariaDB: one round trip
+            result = await self.db.execute(query.returning(
+                models.AddressDB.public_address, models.AddressDB.encrypted_private_key))
+            rows = result.all()
+        else:
+            ids = (await self.db.execute(pooled)).scalars().all()
+            await self.db.execute(query.where(models.AddressDB.id.in_(ids)))
+            rows = (await self.db.execute(
+                select(models.AddressDB.public_address, models.AddressDB.encrypted_private_key)
+                .where(models.AddressDB.id.in_(ids))
+            )).all()
+
+        await self.db.commit()
+
+        if self.address_index is not None:
+            self.address_index.add(public_address for public_address, _ in rows)
+
+        return [
+            Address(public_address=public_address, encrypted_private_key=encrypted_key)
+            for public_address, encrypted_key in rows
+        ]
+
+    async def acquire_refill_lease(self, holder: str, ttl: float, now: float) -> bool:
+        # Taken over once expired, so a crashed worker does not block the refills for good
+        query = update(models.LeaseDB).where(
+            models.LeaseDB.name == POOL_REFILL_LEASE,
+            or_(models.LeaseDB.holder == holder, models.LeaseDB.expires_at <= now),
+        ).values(holder=holder, expires_at=now + ttl).execution_options(synchronize_session=False)
+
+        result = await self.db.execute(query)
+        await self.db.commit()
+        if result.rowcount == 1:
+            return True
+
+        self.db.add(models.LeaseDB(name=POOL_REFILL_LEASE, holder=holder, expires_at=now + ttl))
+        try:
+            await self.db.commit()
+            return True
+        except IntegrityError:
+            # Held by another worker
+            await self.db.rollback()
+            return False
+
+    async def release_refill_lease(self, holder: str) -> None:
+        query = update(models.LeaseDB).where(
+            models.LeaseDB.name == POOL_REFILL_LEASE,
+            models.LeaseDB.holder == holder,
+        ).values(expires_at=0).execution_options(synchronize_session=False)
+
+        await self.db.execute(query)
+        await self.db.commit()
+
+    async def next_derivation_index(self) -> int:
+        query = select(func.max(models.AddressDB.derivation_index))
+
+        result = await self.db.execute(query)
+
+        last_index = result.scalar_one_or_none()
+        return 0 if last_index is None else last_index + 1
+
     async def find_by_public_address(self, public_address: str) -> Optional[Address]:
         query = select(models.AddressDB).where(
-            models.AddressDB.public_address == public_address)
+            models.AddressDB.public_address == public_address,
+            models.AddressDB.status == AddressStatus.ASSIGNED.value)
 
         result = await self.db.execute(query)
 
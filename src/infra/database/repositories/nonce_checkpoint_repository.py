@@ -0,0 +1,43 @@
+from typing import Dict
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert, select, update
+from src.core.interfaces import INonceCheckpointRepository
+from .. import models
+
+
+class NonceCheckpointRepository(INonceCheckpointRepository):
+    """
+    Checkpoints of the in-memory NonceManager. They have their own table, so the
+    counters of DatabaseNonceManager never start from a checkpoint, nor the
+    other way around.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_all(self) -> Dict[str, int]:
+        query = select(models.NonceCheckpointDB.address, models.NonceCheckpointDB.next_nonce)
+
+        result = await self.db.execute(query)
+
+        return {address: next_nonce for address, next_nonce in result.all()}
+
+    async def save_many(self, nonces: Dict[str, int]) -> None:
+        if not nonces:
+            return
+
+        query = select(models.NonceCheckpointDB.address).where(
+            models.NonceCheckpointDB.address.in_(list(nonces)))
+        existing = set((await self.db.execute(query)).scalars().all())
+
+        rows = [{"address": address, "next_nonce": nonce} for address, nonce in nonces.items()]
+        updated = [row for row in rows if row["address"] in existing]
+        created = [row for row in rows if row["address"] not in existing]
+
+        # Bulk statements, executed with executemany
+        if updated:
+            await self.db.execute(update(models.NonceCheckpointDB), updated)
+        if created:
+            await self.db.execute(insert(models.NonceCheckpointDB), created)
+
+        await self.db.commit()
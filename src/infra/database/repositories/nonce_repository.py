@@ -0,0 +1,79 @@
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import insert, select, update
+from src.core.interfaces import INonceRepository
+from .. import models
+
+
+class NonceRepository(INonceRepository):
+    """
+    Nonce counters updated with single atomic UPDATE statements, so instances
+    sharing the database never hand out the same nonce.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get(self, address: str) -> Optional[int]:
+        query = select(models.NonceDB.next_nonce).where(
+            models.NonceDB.address == address)
+
+        result = await self.db.execute(query)
+
+        return result.scalar_one_or_none()
+
+    async def initialize(self, address: str, nonce: int) -> None:
+        if await self.get(address) is None:
+            self.db.add(models.NonceDB(address=address, next_nonce=nonce))
+            try:
+                await self.db.commit()
+                return
+            except IntegrityError:
+                # Created by another instance in the meantime
+                await self.db.rollback()
+
+        await self.advance_to(address, nonce)
+
+    async def allocate(self, address: str, count: int = 1) -> int:
+        query = update(models.NonceDB).where(
+            models.NonceDB.address == address
+        ).values(
+            next_nonce=models.NonceDB.next_nonce + count
+        ).execution_options(synchronize_session=False)
+
+        if self.db.get_bind().dialect.update_returning:
+            # SQLite 3.35+, PostgreSQL, MariaDB: one round trip
+            result = await self.db.execute(query.returning(models.NonceDB.next_nonce))
+            next_nonce = result.scalar_one_or_none()
+        else:
+            # The row stays locked by the UPDATE until the commit, so the read is consistent
+            result = await self.db.execute(query)
+            next_nonce = await self.get(address) if result.rowcount else None
+
+        await self.db.commit()
+
+        if next_nonce is None:
+            raise ValueError(f"Nonce counter for address {address} does not exist.")
+
+        return next_nonce - count
+
+    async def advance_to(self, address: str, nonce: int) -> None:
+        query = update(models.NonceDB).where(
+            models.NonceDB.address == address,
+            models.NonceDB.next_nonce < nonce,
+        ).values(next_nonce=nonce).execution_options(synchronize_session=False)
+
+        await self.db.execute(query)
+        await self.db.commit()
+
+    async def give_back(self, address: str, start: int, end: int) -> bool:
+        query = update(models.NonceDB).where(
+            models.NonceDB.address == address,
+            models.NonceDB.next_nonce == end,
+        ).values(next_nonce=start).execution_options(synchronize_session=False)
+
+        result = await self.db.execute(query)
+        await self.db.commit()
+
+        return result.rowcount == 1
@@ -1,8 +1,9 @@
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from src.core.interfaces import ITransactionRepository
 from src.core.entities.transaction import Transaction
+from src.core.enums import TransactionStatus
 from .. import models
 
 
@@ -21,6 +22,17 @@ class TransactionRepository(ITransactionRepository):
 
         return Transaction.model_validate(db_transaction)
 
+    async def create_many(self, transactions: List[Transaction]) -> None:
+        if not transactions:
+            return
+
+        await self.db.execute(
+            insert(models.TransactionDB),
+            [transaction.model_dump() for transaction in transactions]
+        )
+
+        await self.db.commit()
+
     async def update(self, transaction_entity: Transaction) -> Optional[Transaction]:
         """
         Finds a transaction by its hash and updates its status and effective cost.
@@ -42,6 +54,27 @@ class TransactionRepository(ITransactionRepository):
 
         return None
 
+    async def update_many(self, transactions: List[Transaction]) -> None:
+        """
+        Updates status and effective cost of many transactions, matched by hash,
+        in a single executemany statement and commit.
+        """
+        if not transactions:
+            return
+
+        await self.db.execute(
+            update(models.TransactionDB),
+            [
+                {
+                    "tx_hash": tx.tx_hash,
+                    "status": tx.status.value,
+                    "effective_cost": tx.effective_cost,
+                }
+                for tx in transactions
+            ],
+        )
+        await self.db.commit()
+
     async def find_by_hash(self, tx_hash: str) -> Optional[Transaction]:
         query = select(models.TransactionDB).where(
             models.TransactionDB.tx_hash == tx_hash)
@@ -72,3 +105,13 @@ class TransactionRepository(ITransactionRepository):
         db_transactions = result.scalars().all()
 
         return [Transaction.model_validate(tx) for tx in db_transactions]
+
+    async def get_by_status(self, status: TransactionStatus) -> List[Transaction]:
+        query = select(models.TransactionDB).where(
+            models.TransactionDB.status == status.value)
+
+        result = await self.db.execute(query)
+
+        db_transactions = result.scalars().all()
+
+        return [Transaction.model_validate(tx) for tx in db_transactions]
@@ -0,0 +1,37 @@
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+from src.core.enums import AddressStatus
+from .config import Base
+
+
+def _upgrade_addresses(connection: Connection) -> None:
+    columns = {column["name"] for column in inspect(connection).get_columns("addresses")}
+
+    if "status" not in columns:
+        # Every address stored before the pool existed was handed out
+        connection.execute(text(
+            "ALTER TABLE addresses ADD COLUMN status VARCHAR NOT NULL "
+            f"DEFAULT '{AddressStatus.ASSIGNED.value}'"))
+        connection.execute(text(
+            "UPDATE addresses SET status = :assigned WHERE status IS NULL"
+        ), {"assigned": AddressStatus.ASSIGNED.value})
+    connection.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_addresses_status_id ON addresses (status, id)"))
+
+    if "derivation_index" not in columns:
+        # NULL for the addresses holding their own encrypted key
+        connection.execute(text("ALTER TABLE addresses ADD COLUMN derivation_index INTEGER"))
+    # Claims each HD wallet index once, see AddressService
+    connection.execute(text(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_addresses_derivation_index "
+        "ON addresses (derivation_index)"))
+
+
+def create_schema(connection: Connection) -> None:
+    """
+    Creates the missing tables, then adds the columns and indexes introduced
+    since the first release to tables that already exist, which `create_all`
+    never alters. Safe to run on every startup.
+    """
+    Base.metadata.create_all(connection)
+    _upgrade_addresses(connection)
@@ -0,0 +1,88 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import List
+from eth_account import Account
+from eth_account.hdaccount import seed_from_mnemonic
+from eth_account.hdaccount.deterministic import (
+    HardNode,
+    Node,
+    SoftNode,
+    SECP256K1_N,
+    derive_child_key,
+    ec_point,
+    hmac_sha512,
+    to_int,
+)
+from src.core.interfaces import IEncryptionService, IHDWallet
+from src.core.constants import HD_WALLET_BASE_PATH, HD_KEY_CACHE_SIZE
+
+
+class HDWallet(IHDWallet):
+    """
+    BIP-32/BIP-44 key derivation from one encrypted BIP-39 mnemonic.
+
+    The extended key of the base path (m/44'/60'/0'/0 by default) is derived
+    once, so each address costs a single child derivation, and its public point
+    is kept so the child step needs no extra EC multiplication. The last
+    `cache_size` derived private keys stay in memory, so repeated signing from
+    the same address costs no derivation. The seed stays decrypted in memory for
+    the lifetime of the process.
+    """
+
+    def __init__(
+        self,
+        encrypted_mnemonic: bytes,
+        encryption_service: IEncryptionService,
+        base_path: str = HD_WALLET_BASE_PATH,
+        cache_size: int = HD_KEY_CACHE_SIZE,
+    ):
+        mnemonic = encryption_service.decrypt(encrypted_mnemonic).decode()
+        seed = seed_from_mnemonic(mnemonic, "")
+
+        main_node = hmac_sha512(b"Bitcoin seed", seed)
+        key, chain_code = main_node[:32], main_node[32:]
+        for node in base_path.split("/")[1:]:
+            key, chain_code = derive_child_key(key, chain_code, Node.decode(node))
+
+        self.base_path = base_path
+        self.cache_size = cache_size
+        self._parent = (key, ec_point(key), chain_code)
+        self._keys: "OrderedDict[int, bytes]" = OrderedDict()
+        self._lock = Lock()
+
+    def __getstate__(self) -> dict:
+        # Sent to a process pool without the cached keys
+        return {"base_path": self.base_path, "cache_size": self.cache_size, "_parent": self._parent}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._keys = OrderedDict()
+        self._lock = Lock()
+
+    def _derive(self, index: int) -> bytes:
+        if index < 0 or index >= HardNode.OFFSET:
+            raise ValueError(f"Derivation index must be between 0 and {HardNode.OFFSET - 1}.")
+        parent_key, parent_point, chain_code = self._parent
+        child = hmac_sha512(chain_code, parent_point + SoftNode(index).serialize())
+        child_key = (to_int(child[:32]) + to_int(parent_key)) % SECP256K1_N
+        if to_int(child[:32]) >= SECP256K1_N or child_key == 0:
+            # Invalid child (probability below 2**-127), resolved as in BIP-32
+            return derive_child_key(parent_key, chain_code, SoftNode(index))[0]
+        return child_key.to_bytes(32, byteorder="big")
+
+    def derive_addresses(self, start: int, count: int) -> List[str]:
+        return [Account.from_key(self._derive(index)).address for index in range(start, start + count)]
+
+    def derive_private_key(self, index: int) -> bytes:
+        with self._lock:
+            if index in self._keys:
+                self._keys.move_to_end(index)
+                return self._keys[index]
+
+        private_key = self._derive(index)
+
+        with self._lock:
+            self._keys[index] = private_key
+            if len(self._keys) > self.cache_size:
+                self._keys.popitem(last=False)
+        return private_key
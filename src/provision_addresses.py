@@ -0,0 +1,45 @@
+# Usage: python -m src.provision_addresses <count>
+# Operator path for bulk provisioning, POST /addresses is capped at MAX_ADDRESSES_TO_GENERATE.
+import argparse
+import asyncio
+import os
+from dotenv import load_dotenv
+from src.core.constants import MAX_ADDRESSES_TO_PROVISION, ADDRESS_GENERATION_CHUNK_SIZE
+from src.core.services import AddressService
+from src.infra.database.config import engine
+from src.infra.database.schema import create_schema
+from src.api.dependencies import (
+    address_repository_scope,
+    get_encryption_service,
+    get_address_executor,
+    get_hd_wallet,
+    stop_address_executor,
+)
+
+
+async def provision(count: int) -> int:
+    async with engine.begin() as conn:
+        await conn.run_sync(create_schema)
+
+    try:
+        async with address_repository_scope() as address_repo:
+            service = AddressService(
+                address_repo=address_repo,
+                encryption_service=get_encryption_service(),
+                address_executor=get_address_executor(),
+                chunk_size=int(os.getenv("ADDRESS_GENERATION_CHUNK_SIZE", ADDRESS_GENERATION_CHUNK_SIZE)),
+                hd_wallet=get_hd_wallet(),
+            )
+            return await service.provision_addresses(count)
+    finally:
+        stop_address_executor()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Creates managed addresses in bulk.")
+    parser.add_argument("count", type=int, help=f"Addresses to create (1-{MAX_ADDRESSES_TO_PROVISION})")
+    args = parser.parse_args()
+    created = asyncio.run(provision(args.count))
+    print(f"Successfully provisioned {created} new addresses.")
@@ -1,5 +1,13 @@
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from unittest.mock import AsyncMock
 from fastapi.testclient import TestClient
+from src.api import dependencies
 from src.api.main import app
+from src.core.entities import Transaction
+from src.core.enums import TransactionStatus
+from src.core.interfaces import ITransactionRepository
+from tests.constants import TEST_RPC_URL
 
 client = TestClient(app)
 
@@ -19,3 +27,57 @@ def test_health_checks():
     assert response.status_code == 200
     assert response.json() == {
         'healthy': True}
+
+
+def test_lifespan_shares_one_blockchain_client(monkeypatch):
+    """
+    Tests that the lifespan opens a single pooled blockchain client,
+    reused by every request, and closes it on shutdown.
+    """
+    # Arrange
+    monkeypatch.setenv("ETHEREUM_RPC_URL", TEST_RPC_URL)
+
+    # Act
+    with TestClient(app):
+        first = dependencies.get_blockchain_service()
+        second = dependencies.get_blockchain_service()
+
+        # Assert
+        assert first is second
+        assert first._session is not None
+        assert not first._session.closed
+
+    assert dependencies._blockchain_service_singleton is None
+    assert first._session is None
+
+
+def test_lifespan_resumes_pending_transactions(monkeypatch):
+    """
+    Tests that PENDING rows left by a previous run are handed to the
+    confirmation scheduler on startup.
+    """
+    # Arrange
+    monkeypatch.setenv("ETHEREUM_RPC_URL", TEST_RPC_URL)
+    pending = [
+        Transaction(
+            tx_hash=f"0x_recovered_{i}", asset="ETH", from_address="0xFrom", to_address="0xTo",
+            value=Decimal("1"), status=TransactionStatus.PENDING, effective_cost=Decimal("0")
+        )
+        for i in range(3)
+    ]
+    mock_repo = AsyncMock(spec=ITransactionRepository)
+    mock_repo.get_by_status.return_value = pending
+
+    @asynccontextmanager
+    async def repo_scope():
+        yield mock_repo
+
+    monkeypatch.setattr(dependencies, "transaction_repository_scope", repo_scope)
+
+    # Act
+    with TestClient(app):
+        scheduler = dependencies.get_confirmation_scheduler()
+
+        # Assert
+        mock_repo.get_by_status.assert_awaited_once_with(TransactionStatus.PENDING)
+        assert len(scheduler) == 3
@@ -1,13 +1,14 @@
 import pytest
 from decimal import Decimal
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 from fastapi import status
 from fastapi.testclient import TestClient
 from src.api.main import app
-from src.api.dependencies import get_transaction_service
+from src.api.dependencies import get_transaction_service, get_confirmation_scheduler
 from src.core.entities.transaction import Transaction as TransactionEntity
-from src.core.enums import TransactionStatus
-from src.core.interfaces import ITransactionService
+from src.core.entities.transfer import Transfer, TransferResult
+from src.core.enums import FeeTier, TransactionStatus
+from src.core.interfaces import ITransactionService, IConfirmationScheduler
 from tests.constants import MOCK_TX_HASH, DEFAULT_ASSET, DEFAULT_VALUE_DECIMAL, DEFAULT_EFFECTIVE_COST_DECIMAL
 
 
@@ -146,7 +147,10 @@ class TestCreateTransactionEndpoint(BaseEndpointTest):
         )
         mock_service = AsyncMock(spec=ITransactionService)
         mock_service.create_onchain_transaction.return_value = mock_pending_tx
+        mock_service.get_stage_timings.return_value = {"fees": 0.0412, "total": 0.12}
+        mock_scheduler = MagicMock(spec=IConfirmationScheduler)
         app.dependency_overrides[get_transaction_service] = lambda: mock_service
+        app.dependency_overrides[get_confirmation_scheduler] = lambda: mock_scheduler
 
         # Act
         response = test_client.post(
@@ -159,8 +163,36 @@ class TestCreateTransactionEndpoint(BaseEndpointTest):
 
         assert response_data["status"] == "pending"
         assert response_data["tx_hash"] == "0x_new_tx_hash"
+        assert response.headers["Server-Timing"] == "fees;dur=41.2, total;dur=120.0"
 
         mock_service.create_onchain_transaction.assert_awaited_once()
+        # Monitoring is handed to the shared scheduler instead of a per-request task
+        mock_scheduler.watch.assert_called_once_with(mock_pending_tx)
+
+    async def test_create_transaction_passes_the_fee_tier(self, test_client: TestClient, base_url: str):
+        """Scenario: The requested fee tier reaches the service, 'normal' when omitted."""
+        # Arrange
+        request_body = {"from_address": "0xFrom", "to_address": "0xTo", "asset": "ETH", "value": 1}
+        mock_service = AsyncMock(spec=ITransactionService)
+        mock_service.create_onchain_transaction.return_value = TransactionEntity(
+            tx_hash="0x_new_tx_hash", asset="ETH", from_address="0xFrom", to_address="0xTo",
+            value=Decimal("1"), status=TransactionStatus.PENDING, effective_cost=Decimal("0"))
+        mock_service.get_stage_timings.return_value = {}
+        app.dependency_overrides[get_transaction_service] = lambda: mock_service
+        app.dependency_overrides[get_confirmation_scheduler] = lambda: MagicMock(spec=IConfirmationScheduler)
+
+        # Act
+        default_response = test_client.post(f"{base_url}/transactions/create", json=request_body)
+        fast_response = test_client.post(
+            f"{base_url}/transactions/create", json={**request_body, "fee_tier": "fast"})
+        invalid_response = test_client.post(
+            f"{base_url}/transactions/create", json={**request_body, "fee_tier": "urgent"})
+
+        # Assert
+        assert default_response.status_code == fast_response.status_code == status.HTTP_202_ACCEPTED
+        assert invalid_response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        tiers = [call.kwargs["fee_tier"] for call in mock_service.create_onchain_transaction.await_args_list]
+        assert tiers == [FeeTier.NORMAL, FeeTier.FAST]
 
     async def test_create_transaction_service_error(self, test_client: TestClient, base_url: str):
         """Scenario: Tests a 400 Bad Request error if the service raises a ValueError."""
@@ -197,3 +229,58 @@ class TestCreateTransactionEndpoint(BaseEndpointTest):
 
         # Assert
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.asyncio
+class TestCreateTransactionBatchEndpoint(BaseEndpointTest):
+    """Test suite for the POST /create-batch endpoint."""
+
+    async def test_create_batch_returns_per_item_results(self, test_client: TestClient, base_url: str):
+        """Scenario: Tests that each transfer gets its own result and pending ones are monitored."""
+        # Arrange
+        transfers = [
+            {"from_address": "0x" + "a" * 40, "to_address": "0x" + "b" * 40, "asset": "ETH", "value": 1},
+            {"from_address": "0x" + "c" * 40, "to_address": "0x" + "b" * 40, "asset": "ETH", "value": 2},
+        ]
+        pending_tx = TransactionEntity(
+            tx_hash="0x_batch_tx_hash", asset="ETH", from_address=transfers[0]["from_address"],
+            to_address=transfers[0]["to_address"], value=Decimal("1"),
+            status=TransactionStatus.PENDING, effective_cost=Decimal("0")
+        )
+        mock_service = AsyncMock(spec=ITransactionService)
+        mock_service.create_onchain_transactions.return_value = [
+            TransferResult(transfer=Transfer(**transfers[0]), transaction=pending_tx),
+            TransferResult(transfer=Transfer(**transfers[1]),
+                           error="Source address not managed by this service."),
+        ]
+        mock_scheduler = MagicMock(spec=IConfirmationScheduler)
+        app.dependency_overrides[get_transaction_service] = lambda: mock_service
+        app.dependency_overrides[get_confirmation_scheduler] = lambda: mock_scheduler
+
+        # Act
+        response = test_client.post(
+            f"{base_url}/transactions/create-batch", json={"transfers": transfers})
+
+        # Assert
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        response_data = response.json()
+        assert response_data["broadcast"] == 1
+        assert response_data["failed"] == 1
+        assert response_data["results"] == [
+            {"index": 0, "status": "pending", "tx_hash": "0x_batch_tx_hash", "error": None},
+            {"index": 1, "status": "failed", "tx_hash": None,
+             "error": "Source address not managed by this service."},
+        ]
+        mock_scheduler.watch_many.assert_called_once_with([pending_tx])
+
+    async def test_create_batch_rejects_an_empty_list(self, test_client: TestClient, base_url: str):
+        """Scenario: Tests a 422 Unprocessable Entity for a batch without transfers."""
+        # Arrange
+        app.dependency_overrides[get_transaction_service] = lambda: AsyncMock(spec=ITransactionService)
+
+        # Act
+        response = test_client.post(
+            f"{base_url}/transactions/create-batch", json={"transfers": []})
+
+        # Assert
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -1,8 +1,16 @@
 import pytest
+import asyncio
 import json
-from web3 import AsyncWeb3
+from unittest.mock import AsyncMock
+from aiohttp import ClientConnectionError
+from web3 import AsyncWeb3, AsyncHTTPProvider, Web3
+from web3.exceptions import Web3RPCError
+from web3.providers.eth_tester import AsyncEthereumTesterProvider
 from eth_account import Account
 from src.infra.blockchain.web3_service import Web3BlockchainService
+from src.infra.blockchain.rpc_pool import RpcEndpoint, RpcPool
+from src.infra.blockchain.rate_limiter import PriorityRateLimiter, RpcPriority, use_rpc_priority
+from tests.constants import TEST_RPC_URL
 
 with open("src/infra/blockchain/erc20_abi.json") as f:
     ERC20_ABI = json.load(f)
@@ -134,3 +142,528 @@ class TestWeb3BlockchainService:
 
         # Assert:
         assert new_nonce == 1
+
+    async def test_batch_call_returns_results_in_order(self, blockchain_service: Web3BlockchainService, web3_instance: AsyncWeb3):
+        """
+        Tests that a batch returns every result in the order of the calls,
+        with None for a transaction that does not exist.
+        """
+        # Arrange
+        accounts = await web3_instance.eth.accounts
+        tx_hash = await web3_instance.eth.send_transaction({
+            "from": accounts[0],
+            "to": accounts[4],
+            "value": web3_instance.to_wei(0.1, "ether")
+        })
+        tx_hash_hex = tx_hash.to_0x_hex()
+        fake_hash = "0x" + "0" * 64
+
+        # Act
+        tx, receipt, missing_tx, block_number = await blockchain_service.batch_call([
+            ("eth_getTransactionByHash", [tx_hash_hex]),
+            ("eth_getTransactionReceipt", [tx_hash_hex]),
+            ("eth_getTransactionByHash", [fake_hash]),
+            ("eth_blockNumber", []),
+        ])
+
+        # Assert
+        assert tx['to'] == accounts[4]
+        assert receipt['status'] == 1
+        assert missing_tx is None
+        assert block_number >= receipt['blockNumber']
+
+    async def test_batch_call_rejects_unsupported_method(self, blockchain_service: Web3BlockchainService):
+        """Tests that an unknown JSON-RPC method raises ValueError."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="is not supported in batches"):
+            await blockchain_service.batch_call([("eth_unknownMethod", [])])
+
+    async def test_get_transaction_with_receipt(self, blockchain_service: Web3BlockchainService, web3_instance: AsyncWeb3):
+        """Tests fetching a transaction, its receipt and the head together."""
+        # Arrange
+        accounts = await web3_instance.eth.accounts
+        tx_hash = await web3_instance.eth.send_transaction({
+            "from": accounts[0],
+            "to": accounts[5],
+            "value": web3_instance.to_wei(0.1, "ether")
+        })
+
+        # Act
+        tx, receipt, latest_block = await blockchain_service.get_transaction_with_receipt(tx_hash.to_0x_hex())
+
+        # Assert
+        assert tx['from'] == accounts[0]
+        assert receipt['blockNumber'] <= latest_block
+
+
+class BatchRecordingProvider(AsyncHTTPProvider):
+    """
+    HTTP provider stand-in that answers batches with canned node responses
+    and records how many HTTP requests were made.
+    """
+
+    def __init__(self, errors=None):
+        super().__init__("http://test-rpc")
+        self.batches = []
+        # Error returned by the node for some positions of the batch
+        self.errors = errors or {}
+
+    async def make_batch_request(self, batch_requests):
+        self.batches.append(batch_requests)
+        responses = {
+            "eth_getTransactionByHash": {
+                "hash": "0x" + "a" * 64, "from": "0x" + "1" * 40, "to": "0x" + "2" * 40,
+                "value": "0x5", "input": "0x", "nonce": "0x1", "gas": "0x5208", "blockNumber": "0x3"
+            },
+            "eth_getTransactionReceipt": None,
+            "eth_blockNumber": "0x10",
+            "eth_sendRawTransaction": "0x" + "b" * 64,
+        }
+        return [
+            {"jsonrpc": "2.0", "id": i, "error": self.errors[i]} if i in self.errors
+            else {"jsonrpc": "2.0", "id": i, "result": responses[method]}
+            for i, (method, _) in enumerate(batch_requests)
+        ]
+
+
+@pytest.mark.asyncio
+class TestWeb3BlockchainServiceHttpBatch:
+    """
+    Test suite for the JSON-RPC batch path used with HTTP providers.
+    """
+
+    async def test_batch_call_uses_a_single_http_request(self, blockchain_service: Web3BlockchainService):
+        """Tests that all calls go out in one batch and results are formatted."""
+        # Arrange
+        provider = BatchRecordingProvider()
+        blockchain_service.web3 = AsyncWeb3(provider)
+
+        # Act
+        tx, receipt, latest_block = await blockchain_service.get_transaction_with_receipt("0x" + "a" * 64)
+
+        # Assert
+        assert len(provider.batches) == 1
+        assert [method for method, _ in provider.batches[0]] == [
+            "eth_getTransactionByHash", "eth_getTransactionReceipt", "eth_blockNumber"]
+        assert tx['value'] == 5
+        assert receipt is None
+        assert latest_block == 16
+
+    async def test_broadcast_batch_reports_errors_per_transaction(self, blockchain_service: Web3BlockchainService):
+        """Tests that one rejected transaction does not fail the others sent in the same batch."""
+        # Arrange
+        provider = BatchRecordingProvider(errors={1: {"code": -32000, "message": "nonce too low"}})
+        blockchain_service.web3 = AsyncWeb3(provider)
+
+        # Act
+        results = await blockchain_service.broadcast_transactions(["0x01", "0x02", "0x03"])
+
+        # Assert
+        assert len(provider.batches) == 1
+        assert results[0] == results[2] == "0x" + "b" * 64
+        assert isinstance(results[1], Web3RPCError)
+        assert "nonce too low" in str(results[1])
+
+
+@pytest.mark.asyncio
+class TestWeb3BlockchainServiceConnectionPool:
+    """
+    Test suite for the pooled HTTP session owned by the service.
+    """
+
+    async def test_connect_caches_a_bounded_keepalive_session(self):
+        """Tests that connect() registers a keep-alive session with the configured pool size."""
+        # Arrange
+        service = Web3BlockchainService(
+            rpc_url=TEST_RPC_URL, pool_size=7, keepalive_timeout=15)
+
+        # Act
+        await service.connect()
+        cached_session = await service.web3.provider.cache_async_session(service._session)
+
+        # Assert
+        assert cached_session is service._session
+        assert cached_session.connector.limit == 7
+        assert cached_session.connector.force_close is False
+
+        # Act
+        await service.close()
+
+        # Assert
+        assert cached_session.closed
+
+    async def test_erc20_abi_is_read_once(self):
+        """Tests that new service instances reuse the ABI loaded from disk."""
+        # Act
+        first = Web3BlockchainService(rpc_url=TEST_RPC_URL)
+        second = Web3BlockchainService(rpc_url=TEST_RPC_URL)
+
+        # Assert
+        assert first.erc20_abi == ERC20_ABI
+        assert first.erc20_abi[0] is second.erc20_abi[0]
+
+
+@pytest.mark.asyncio
+class TestWeb3BlockchainServiceDecoding:
+    """
+    Test suite for decoding ERC-20 calldata with the selector table.
+    """
+
+    async def test_fast_decoder_matches_generic_decoder(self, blockchain_service: Web3BlockchainService):
+        """Tests that the selector fast path returns the same result as web3.py's decoder."""
+        # Arrange
+        token_address = Account.create().address
+        recipient = Account.create().address
+        contract = blockchain_service.web3.eth.contract(
+            address=token_address, abi=ERC20_ABI)
+        calldata = contract.encode_abi("transfer", args=[recipient, 123])
+        tx_details = {"to": token_address, "input": calldata}
+
+        # Act
+        fast = blockchain_service.decode_transaction_input(
+            tx_details, blockchain_service.erc20_abi)
+        generic = blockchain_service._decode_function_input_generic(
+            calldata, blockchain_service.erc20_abi, token_address)
+
+        # Assert
+        assert fast == generic
+        assert fast["params"]["_to"] == recipient
+
+    async def test_malformed_calldata_falls_back_to_generic_decoder(self, blockchain_service: Web3BlockchainService):
+        """Tests that truncated calldata for a known selector is handed to the generic path."""
+        # Arrange
+        tx_details = {"to": Account.create().address,
+                      "input": "0xa9059cbb" + "00" * 10}
+
+        # Act
+        decoded = blockchain_service.decode_transaction_input(
+            tx_details, blockchain_service.erc20_abi)
+
+        # Assert
+        assert decoded is None
+
+
+@pytest.mark.asyncio
+class TestWeb3BlockchainServiceHeadTracking:
+    """
+    Test suite for serving the block head from memory.
+    """
+
+    async def test_head_is_refreshed_from_the_node(self, blockchain_service: Web3BlockchainService, web3_instance: AsyncWeb3):
+        """Tests that a poll stores the node's latest block number and base fee."""
+        # Act
+        head = await blockchain_service.head_tracker.poll_once()
+
+        # Assert
+        latest_block = await web3_instance.eth.get_block('latest')
+        assert head.number == latest_block['number']
+        assert head.base_fee == latest_block['baseFeePerGas']
+
+    async def test_get_fee_history(self, blockchain_service: Web3BlockchainService):
+        """Tests that the fee history comes back as a plain dict with the eth_feeHistory fields."""
+        # Act
+        history = await blockchain_service.get_fee_history(4, [10, 50, 90])
+
+        # Assert
+        assert isinstance(history, dict)
+        assert {"oldestBlock", "baseFeePerGas", "reward"} <= set(history)
+
+    async def test_get_code_is_empty_for_accounts(self, blockchain_service: Web3BlockchainService, web3_instance: AsyncWeb3):
+        """Tests that an externally owned account has no code."""
+        # Arrange
+        test_address = (await web3_instance.eth.accounts)[0]
+
+        # Act
+        code = await blockchain_service.get_code(test_address)
+
+        # Assert
+        assert code == b""
+
+    async def test_fresh_head_is_served_without_rpc(self, blockchain_service: Web3BlockchainService):
+        """Tests that block number and base fee come from memory while the head is fresh."""
+        # Arrange
+        blockchain_service.head_tracker.update_from_block(
+            {"number": 4242, "baseFeePerGas": 99, "timestamp": 0})
+        blockchain_service.web3 = AsyncWeb3(BatchRecordingProvider())
+
+        # Act
+        block_number = await blockchain_service.get_latest_block_number()
+        base_fee = await blockchain_service.get_base_fee()
+        _, _, latest_block = await blockchain_service.get_transaction_with_receipt("0x" + "a" * 64)
+
+        # Assert
+        assert block_number == 4242
+        assert base_fee == 99
+        assert latest_block == 4242
+        assert [method for method, _ in blockchain_service.web3.provider.batches[0]] == [
+            "eth_getTransactionByHash", "eth_getTransactionReceipt"]
+
+
+@pytest.mark.asyncio
+class TestWeb3BlockchainServiceTransactionCache:
+    """
+    Test suite for serving final transactions from the cache.
+    """
+
+    async def test_final_transaction_is_served_from_cache(self, blockchain_service: Web3BlockchainService, web3_instance: AsyncWeb3):
+        """Tests that re-validating a final transaction makes no RPC call."""
+        # Arrange
+        accounts = await web3_instance.eth.accounts
+        tx_hash = (await web3_instance.eth.send_transaction({
+            "from": accounts[0],
+            "to": accounts[6],
+            "value": web3_instance.to_wei(0.1, "ether")
+        })).to_0x_hex()
+        web3_instance.provider.ethereum_tester.mine_blocks(
+            blockchain_service.tx_cache.min_confirmations)
+
+        first = await blockchain_service.get_transaction_with_receipt(tx_hash)
+
+        # Any further RPC would hit this stand-in and fail the comparison below
+        blockchain_service.web3 = AsyncWeb3(BatchRecordingProvider())
+
+        # Act
+        second = await blockchain_service.get_transaction_with_receipt(tx_hash)
+        receipt = await blockchain_service.get_transaction_receipt(tx_hash)
+
+        # Assert
+        assert second == first
+        assert receipt == first[1]
+        assert blockchain_service.web3.provider.batches == []
+        assert blockchain_service.tx_cache.hits == 2
+
+    async def test_recent_transaction_is_not_cached(self, blockchain_service: Web3BlockchainService, web3_instance: AsyncWeb3):
+        """Tests that a transaction below the confirmation threshold is fetched every time."""
+        # Arrange
+        accounts = await web3_instance.eth.accounts
+        tx_hash = (await web3_instance.eth.send_transaction({
+            "from": accounts[0],
+            "to": accounts[7],
+            "value": web3_instance.to_wei(0.1, "ether")
+        })).to_0x_hex()
+
+        # Act
+        await blockchain_service.get_transaction_with_receipt(tx_hash)
+
+        # Assert
+        assert len(blockchain_service.tx_cache) == 0
+
+
+class ReplicaProvider(AsyncEthereumTesterProvider):
+    """
+    Stand-in for one RPC endpoint. Every replica serves the same in-memory chain,
+    answering after a delay or failing like an unreachable node.
+    """
+
+    def __init__(self, ethereum_tester, delay: float = 0, fail: bool = False):
+        super().__init__()
+        self.ethereum_tester = ethereum_tester
+        self.delay = delay
+        self.fail = fail
+        self.methods = []
+
+    async def make_request(self, method, params):
+        self.methods.append(method)
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ClientConnectionError("endpoint unreachable")
+        return await super().make_request(method, params)
+
+
+@pytest.mark.asyncio
+class TestWeb3BlockchainServiceRpcPool:
+    """
+    Integration tests for routing across several endpoints of the same chain.
+    """
+
+    @staticmethod
+    def _use_replicas(service: Web3BlockchainService, *providers: ReplicaProvider, hedge_reads: bool = False) -> None:
+        service.rpc_pool = RpcPool(
+            [RpcEndpoint(f"replica-{i}", AsyncWeb3(p)) for i, p in enumerate(providers)],
+            hedge_reads=hedge_reads,
+            hedge_delay=0.05,
+        )
+
+    async def test_accepts_a_list_of_endpoints(self):
+        """Tests that every URL becomes an endpoint and the first one is the primary."""
+        # Act
+        service = Web3BlockchainService(rpc_url=[TEST_RPC_URL, "http://backup-rpc", " "])
+
+        # Assert
+        assert [e.url for e in service.rpc_pool.endpoints] == [TEST_RPC_URL, "http://backup-rpc"]
+        assert service.web3 is service.rpc_pool.primary.web3
+
+    async def test_reads_use_the_fastest_endpoint(self, blockchain_service: Web3BlockchainService, web3_instance: AsyncWeb3):
+        """Tests that once latencies are known, reads stick to the fastest replica."""
+        # Arrange
+        tester = web3_instance.provider.ethereum_tester
+        slow, fast = ReplicaProvider(tester, delay=0.05), ReplicaProvider(tester)
+        self._use_replicas(blockchain_service, slow, fast)
+        address = (await web3_instance.eth.accounts)[0]
+
+        # Act
+        balances = [await blockchain_service.get_eth_balance(address) for _ in range(5)]
+
+        # Assert
+        assert len(set(balances)) == 1 and balances[0] > 0
+        assert len(slow.methods) == 1
+        assert len(fast.methods) == 4
+
+    async def test_failing_endpoint_is_skipped(self, blockchain_service: Web3BlockchainService, web3_instance: AsyncWeb3):
+        """Tests that an unreachable endpoint fails over and is then avoided."""
+        # Arrange
+        tester = web3_instance.provider.ethereum_tester
+        down, up = ReplicaProvider(tester, fail=True), ReplicaProvider(tester)
+        self._use_replicas(blockchain_service, down, up)
+
+        # Act
+        nonces = [await blockchain_service.get_transaction_count(
+            (await web3_instance.eth.accounts)[0]) for _ in range(4)]
+
+        # Assert
+        assert nonces == [nonces[0]] * 4
+        assert len(down.methods) == 2
+        assert blockchain_service.rpc_pool.is_healthy(blockchain_service.rpc_pool.endpoints[0]) is False
+
+    async def test_slow_read_is_hedged(self, blockchain_service: Web3BlockchainService, web3_instance: AsyncWeb3):
+        """Tests that a stalled endpoint is raced by a duplicate read on another replica."""
+        # Arrange
+        tester = web3_instance.provider.ethereum_tester
+        stalled, healthy = ReplicaProvider(tester, delay=5), ReplicaProvider(tester)
+        self._use_replicas(blockchain_service, stalled, healthy, hedge_reads=True)
+
+        # Act
+        block_number = await asyncio.wait_for(blockchain_service.get_latest_block_number(), timeout=1)
+
+        # Assert
+        assert block_number == await web3_instance.eth.block_number
+        assert blockchain_service.rpc_pool.hedged_reads == 1
+
+    async def test_broadcast_is_pinned_to_the_primary(self, blockchain_service: Web3BlockchainService, web3_instance: AsyncWeb3):
+        """Tests that a transaction is sent through the primary only, even when a replica is faster."""
+        # Arrange
+        tester = web3_instance.provider.ethereum_tester
+        primary, replica = ReplicaProvider(tester, delay=0.02), ReplicaProvider(tester)
+        self._use_replicas(blockchain_service, primary, replica, hedge_reads=True)
+        blockchain_service.rpc_pool.endpoints[1].record_success(0.001)
+
+        accounts = await web3_instance.eth.accounts
+        sender = Account.create()
+        await web3_instance.eth.send_transaction(
+            {"from": accounts[0], "to": sender.address, "value": 10**18})
+        signed = sender.sign_transaction({
+            "to": accounts[1], "value": 1, "gas": 21000, "gasPrice": 10**10,
+            "nonce": 0, "chainId": await web3_instance.eth.chain_id,
+        })
+
+        # Act
+        tx_hash = await blockchain_service.broadcast_transaction(signed.raw_transaction)
+
+        # Assert
+        assert "eth_sendRawTransaction" in primary.methods
+        assert "eth_sendRawTransaction" not in replica.methods
+        assert (await web3_instance.eth.get_transaction(tx_hash))["from"] == sender.address
+
+
+@pytest.mark.asyncio
+class TestWeb3BlockchainServiceCoalescing:
+    """
+    Integration tests for sharing concurrent identical RPC calls.
+    """
+
+    async def test_concurrent_block_number_reads_share_one_call(self, blockchain_service: Web3BlockchainService, web3_instance: AsyncWeb3):
+        """Tests that a burst of head reads results in a single eth_blockNumber."""
+        # Arrange
+        replica = ReplicaProvider(web3_instance.provider.ethereum_tester, delay=0.01)
+        blockchain_service.web3 = AsyncWeb3(replica)
+
+        # Act
+        numbers = await asyncio.gather(*(blockchain_service.get_latest_block_number() for _ in range(20)))
+
+        # Assert
+        assert len(set(numbers)) == 1
+        assert replica.methods.count("eth_blockNumber") == 1
+
+    async def test_concurrent_validations_share_one_batch(self, blockchain_service: Web3BlockchainService, web3_instance: AsyncWeb3):
+        """Tests that identical concurrent lookups of a tx hash are fetched once."""
+        # Arrange
+        replica = ReplicaProvider(web3_instance.provider.ethereum_tester, delay=0.01)
+        blockchain_service.web3 = AsyncWeb3(replica)
+        tx_hash = "0x" + "ab" * 32
+
+        # Act
+        results = await asyncio.gather(*(blockchain_service.get_transaction_with_receipt(tx_hash) for _ in range(10)))
+
+        # Assert
+        assert all(tx is None and receipt is None for tx, receipt, _ in results)
+        assert replica.methods.count("eth_getTransactionByHash") == 1
+        assert replica.methods.count("eth_getTransactionReceipt") == 1
+
+    async def test_calls_are_only_shared_within_a_priority_class(self, blockchain_service: Web3BlockchainService, web3_instance: AsyncWeb3):
+        """Tests that a user read does not join a background call queued at a lower priority."""
+        # Arrange
+        replica = ReplicaProvider(web3_instance.provider.ethereum_tester, delay=0.01)
+        blockchain_service.web3 = AsyncWeb3(replica)
+
+        # Act
+        with use_rpc_priority(RpcPriority.BACKGROUND):
+            # Tasks keep the priority they were created with
+            background = [asyncio.ensure_future(blockchain_service.get_latest_block_number())
+                          for _ in range(2)]
+        await asyncio.gather(*background, blockchain_service.get_latest_block_number())
+
+        # Assert
+        assert replica.methods.count("eth_blockNumber") == 2
+
+    async def test_methods_can_be_excluded(self, web3_instance: AsyncWeb3):
+        """Tests that coalescing is configured per method."""
+        # Arrange
+        service = Web3BlockchainService(rpc_url=TEST_RPC_URL, coalesced_methods=["eth_getBalance"])
+        replica = ReplicaProvider(web3_instance.provider.ethereum_tester, delay=0.01)
+        service.web3 = AsyncWeb3(replica)
+
+        # Act
+        await asyncio.gather(*(service.get_latest_block_number() for _ in range(3)))
+
+        # Assert
+        assert replica.methods.count("eth_blockNumber") == 3
+
+    async def test_broadcasts_are_never_coalesced(self):
+        """Tests that non-idempotent methods are dropped from the configuration."""
+        # Act
+        service = Web3BlockchainService(
+            rpc_url=TEST_RPC_URL, coalesced_methods=["eth_sendRawTransaction", "eth_blockNumber"])
+
+        # Assert
+        assert service.coalesced_methods == {"eth_blockNumber"}
+
+
+@pytest.mark.asyncio
+class TestWeb3BlockchainServiceRateLimiting:
+    """
+    Integration tests for the priority classes assigned to RPC calls.
+    """
+
+    async def test_calls_are_tagged_with_their_priority(self, blockchain_service: Web3BlockchainService, web3_instance: AsyncWeb3):
+        """Tests that broadcasts, user reads and background polls use their own class."""
+        # Arrange
+        limiter = AsyncMock(spec=PriorityRateLimiter)
+        blockchain_service.rate_limiter = limiter
+        accounts = await web3_instance.eth.accounts
+        sender = Account.create()
+        tx_hash = await web3_instance.eth.send_transaction(
+            {"from": accounts[0], "to": sender.address, "value": 10**18})
+        signed = sender.sign_transaction({
+            "to": accounts[1], "value": 1, "gas": 21000, "gasPrice": 10**10,
+            "nonce": 0, "chainId": await web3_instance.eth.chain_id,
+        })
+
+        # Act
+        await blockchain_service.get_eth_balance(accounts[0])
+        with use_rpc_priority(RpcPriority.BACKGROUND):
+            await blockchain_service.get_transaction_receipt(Web3.to_hex(tx_hash))
+        await blockchain_service.broadcast_transaction(signed.raw_transaction)
+
+        # Assert
+        priorities = [c.args[0] for c in limiter.acquire.await_args_list]
+        assert priorities == [RpcPriority.USER_READ, RpcPriority.BACKGROUND, RpcPriority.BROADCAST]
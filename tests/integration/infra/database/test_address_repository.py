@@ -3,7 +3,9 @@ import pytest_asyncio
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from src.infra.database.config import Base
 from src.core.entities.address import Address
+from src.core.enums import AddressStatus
 from src.infra.database.repositories import AddressRepository
+from src.core.services import ManagedAddressIndex
 
 
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -96,3 +98,193 @@ class TestAddressRepository:
 
         # Assert
         assert found_address is None
+
+    async def test_assign_unassigned_hands_out_pooled_addresses(self, address_repo: AddressRepository):
+        """
+        Tests that the oldest pooled addresses are marked as assigned, and only then listed.
+        """
+        # Arrange
+        await address_repo.create_many([
+            Address(public_address=f"0xPooled{i}", encrypted_private_key=f"key{i}",
+                    status=AddressStatus.UNASSIGNED)
+            for i in range(3)
+        ])
+
+        # Act
+        listed_before = await address_repo.get_all()
+        assigned = await address_repo.assign_unassigned(2)
+        remaining = await address_repo.count_unassigned()
+        listed_after = await address_repo.get_all()
+
+        # Assert
+        assert listed_before == []
+        assert [address.public_address for address in assigned] == ["0xPooled0", "0xPooled1"]
+        assert assigned[0].encrypted_private_key == "key0"
+        assert remaining == 1
+        assert {address.public_address for address in listed_after} == {"0xPooled0", "0xPooled1"}
+
+    async def test_assign_unassigned_returns_fewer_when_pool_runs_short(self, address_repo: AddressRepository):
+        """
+        Tests that a short pool hands out what it has.
+        """
+        # Arrange
+        await address_repo.create_many([
+            Address(public_address="0xPooled", encrypted_private_key="key",
+                    status=AddressStatus.UNASSIGNED)
+        ])
+
+        # Act
+        assigned = await address_repo.assign_unassigned(5)
+
+        # Assert
+        assert len(assigned) == 1
+        assert await address_repo.count_unassigned() == 0
+
+    async def test_next_derivation_index_follows_the_highest_stored_index(self, address_repo: AddressRepository):
+        """
+        Tests that derivation starts at 0 and continues after the highest stored index.
+        """
+        # Arrange
+        first_index = await address_repo.next_derivation_index()
+        await address_repo.create_many([
+            Address(public_address="0xDerived0", encrypted_private_key="", derivation_index=0),
+            Address(public_address="0xDerived1", encrypted_private_key="", derivation_index=1),
+            Address(public_address="0xRandom", encrypted_private_key="key"),
+        ])
+
+        # Act
+        next_index = await address_repo.next_derivation_index()
+
+        # Assert
+        assert first_index == 0
+        assert next_index == 2
+        found = await address_repo.find_by_public_address("0xDerived1")
+        assert found.derivation_index == 1
+
+    async def test_create_many_rejects_a_taken_derivation_index(self, address_repo: AddressRepository):
+        """
+        Tests that storing an index twice raises a ValueError and stores nothing.
+        """
+        # Arrange
+        await address_repo.create_many([
+            Address(public_address="0xDerived0", encrypted_private_key="", derivation_index=0)
+        ])
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="already exists"):
+            await address_repo.create_many([
+                Address(public_address="0xOther1", encrypted_private_key="", derivation_index=1),
+                Address(public_address="0xOther0", encrypted_private_key="", derivation_index=0),
+            ])
+        assert await address_repo.find_by_public_address("0xOther1") is None
+
+    async def test_create_many_reports_duplicates_per_chunk(self, db_session: AsyncSession):
+        """
+        Tests that a batch with duplicates stores nothing and names the duplicates of each chunk.
+        """
+        # Arrange
+        address_repo = AddressRepository(db_session, insert_chunk_size=2)
+        await address_repo.create_many([Address(public_address="0xStored", encrypted_private_key="key")])
+
+        # Act & Assert
+        with pytest.raises(ValueError) as error:
+            await address_repo.create_many([
+                Address(public_address=f"0x{name}", encrypted_private_key="key")
+                for name in ("New0", "New1", "New2", "Stored", "New4", "New0")
+            ])
+        assert "chunk 1" not in str(error.value)
+        assert "chunk 2 (rows 2-3): 1 duplicate(s), 0xStored" in str(error.value)
+        assert "chunk 3 (rows 4-5): 1 duplicate(s), 0xNew0" in str(error.value)
+        assert await address_repo.find_by_public_address("0xNew0") is None
+
+    async def test_list_public_addresses_pages_by_id(self, address_repo: AddressRepository):
+        """
+        Tests that assigned addresses are listed in id order after the given id,
+        and pooled ones are left out.
+        """
+        # Arrange
+        await address_repo.create_many([
+            Address(public_address="0xFirst", encrypted_private_key="key"),
+            Address(public_address="0xPooled", encrypted_private_key="key", status=AddressStatus.UNASSIGNED),
+            Address(public_address="0xSecond", encrypted_private_key="key"),
+            Address(public_address="0xThird", encrypted_private_key="key"),
+        ])
+
+        # Act
+        first_page = await address_repo.list_public_addresses(0, 2)
+        next_page = await address_repo.list_public_addresses(first_page[-1][0], 2)
+        oldest_pooled = await address_repo.oldest_unassigned_id()
+
+        # Assert
+        assert [address for _, address in first_page] == ["0xFirst", "0xSecond"]
+        assert [address for _, address in next_page] == ["0xThird"]
+        assert oldest_pooled == first_page[0][0] + 1
+
+    async def test_pooled_addresses_are_only_found_once_assigned(self, address_repo: AddressRepository):
+        """
+        Tests that lookups by public address apply the same rule as get_all.
+        """
+        # Arrange
+        await address_repo.create_many([
+            Address(public_address="0xPooled", encrypted_private_key="key", status=AddressStatus.UNASSIGNED)
+        ])
+
+        # Act
+        found_while_pooled = await address_repo.find_by_public_address("0xPooled")
+        await address_repo.assign_unassigned(1)
+        found_once_assigned = await address_repo.find_by_public_address("0xPooled")
+
+        # Assert
+        assert found_while_pooled is None
+        assert found_once_assigned.public_address == "0xPooled"
+
+    async def test_refill_lease_is_held_by_one_worker_until_released_or_expired(self, address_repo: AddressRepository):
+        """
+        Tests that a second holder is refused while the lease is live, and gets
+        it once the first one releases it or lets it expire.
+        """
+        # Act
+        first = await address_repo.acquire_refill_lease("worker-1", ttl=60, now=1000)
+        second_while_held = await address_repo.acquire_refill_lease("worker-2", ttl=60, now=1010)
+        renewed = await address_repo.acquire_refill_lease("worker-1", ttl=60, now=1020)
+        second_after_expiry = await address_repo.acquire_refill_lease("worker-2", ttl=60, now=1081)
+        await address_repo.release_refill_lease("worker-1")  # No longer the holder, no effect
+        first_while_taken_over = await address_repo.acquire_refill_lease("worker-1", ttl=60, now=1090)
+        await address_repo.release_refill_lease("worker-2")
+        first_after_release = await address_repo.acquire_refill_lease("worker-1", ttl=60, now=1100)
+
+        # Assert
+        assert first and renewed and second_after_expiry and first_after_release
+        assert not second_while_held
+        assert not first_while_taken_over
+
+    async def test_create_many_updates_the_address_index(self, db_session: AsyncSession):
+        """
+        Tests that stored addresses are managed at once, rejected ones are not,
+        and pooled ones only once they are assigned.
+        """
+        # Arrange
+        address_index = ManagedAddressIndex(address_repo_factory=None)
+        address_repo = AddressRepository(db_session, address_index=address_index)
+        stored = "0x" + "a" * 40
+        rejected = "0x" + "b" * 40
+        pooled = "0x" + "c" * 40
+
+        # Act
+        await address_repo.create_many([
+            Address(public_address=stored, encrypted_private_key="key"),
+            Address(public_address=pooled, encrypted_private_key="key", status=AddressStatus.UNASSIGNED),
+        ])
+        with pytest.raises(ValueError):
+            await address_repo.create_many([
+                Address(public_address=rejected, encrypted_private_key="key"),
+                Address(public_address=stored, encrypted_private_key="key"),
+            ])
+        managed_while_pooled = address_index.is_managed(pooled)
+        await address_repo.assign_unassigned(1)
+
+        # Assert
+        assert address_index.is_managed(stored)
+        assert not address_index.is_managed(rejected)
+        assert not managed_while_pooled
+        assert address_index.is_managed(pooled)
@@ -0,0 +1,69 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from src.infra.database.config import Base
+from src.infra.database.repositories import NonceCheckpointRepository, NonceRepository
+
+
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+test_engine = create_async_engine(TEST_DATABASE_URL)
+TestSessionLocal = async_sessionmaker(
+    autocommit=False, autoflush=False, bind=test_engine)
+
+
+@pytest_asyncio.fixture(scope="function")
+async def db_session() -> AsyncSession:  # type: ignore
+    """
+    Pytest fixture that provides a clean database session for each test function.
+    """
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with TestSessionLocal() as session:
+        yield session
+
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+
+
+@pytest_asyncio.fixture(scope="function")
+async def checkpoint_repo(db_session: AsyncSession) -> NonceCheckpointRepository:
+    return NonceCheckpointRepository(db_session)
+
+
+@pytest.mark.asyncio
+class TestNonceCheckpointRepository:
+    """
+    Integration test suite for the NonceCheckpointRepository.
+    """
+
+    async def test_save_many_creates_and_updates_in_one_call(self, checkpoint_repo: NonceCheckpointRepository):
+        """
+        Tests that checkpoints of known and new addresses are stored together.
+        """
+        # Arrange
+        await checkpoint_repo.save_many({"0xAddr1": 10})
+
+        # Act
+        await checkpoint_repo.save_many({"0xAddr1": 4, "0xAddr2": 7})
+
+        # Assert
+        assert await checkpoint_repo.get_all() == {"0xAddr1": 4, "0xAddr2": 7}
+
+    async def test_checkpoints_and_counters_never_share_rows(self, db_session: AsyncSession, checkpoint_repo: NonceCheckpointRepository):
+        """
+        Tests that switching between the in-memory and the database nonce managers
+        never starts one from the other's stored nonces.
+        """
+        # Arrange
+        nonce_repo = NonceRepository(db_session)
+        await nonce_repo.initialize("0xShared", 20)
+
+        # Act
+        await checkpoint_repo.save_many({"0xShared": 5, "0xCheckpointed": 3})
+
+        # Assert
+        assert await checkpoint_repo.get_all() == {"0xShared": 5, "0xCheckpointed": 3}
+        assert await nonce_repo.get("0xShared") == 20
+        assert await nonce_repo.get("0xCheckpointed") is None
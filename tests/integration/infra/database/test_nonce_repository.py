@@ -0,0 +1,129 @@
+import asyncio
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from src.infra.database.config import Base
+from src.infra.database.repositories import NonceRepository
+
+
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+test_engine = create_async_engine(TEST_DATABASE_URL)
+TestSessionLocal = async_sessionmaker(
+    autocommit=False, autoflush=False, bind=test_engine)
+
+
+@pytest_asyncio.fixture(scope="function")
+async def db_session() -> AsyncSession:  # type: ignore
+    """
+    Pytest fixture that provides a clean database session for each test function.
+    """
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with TestSessionLocal() as session:
+        yield session
+
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+
+
+@pytest_asyncio.fixture(scope="function")
+async def nonce_repo(db_session: AsyncSession) -> NonceRepository:
+    return NonceRepository(db_session)
+
+
+@pytest.mark.asyncio
+class TestNonceRepository:
+    """
+    Integration test suite for the NonceRepository.
+    """
+
+    async def test_allocate_returns_consecutive_ranges(self, nonce_repo: NonceRepository):
+        """
+        Tests that each allocation starts where the previous one ended.
+        """
+        # Arrange
+        await nonce_repo.initialize("0xAddr1", 7)
+
+        # Act
+        first = await nonce_repo.allocate("0xAddr1")
+        lease = await nonce_repo.allocate("0xAddr1", 5)
+
+        # Assert
+        assert first == 7
+        assert lease == 8
+        assert await nonce_repo.get("0xAddr1") == 13
+
+    async def test_allocate_raises_error_without_counter(self, nonce_repo: NonceRepository):
+        """
+        Tests that no nonce is allocated for an address without a counter.
+        """
+        # Act & Assert
+        with pytest.raises(ValueError, match="Nonce counter for address 0xUnknown does not exist."):
+            await nonce_repo.allocate("0xUnknown")
+
+    async def test_counter_only_moves_forward(self, nonce_repo: NonceRepository):
+        """
+        Tests that initializing again or advancing to a lower value never moves the counter back.
+        """
+        # Arrange
+        await nonce_repo.initialize("0xAddr1", 10)
+
+        # Act
+        await nonce_repo.initialize("0xAddr1", 3)
+        await nonce_repo.advance_to("0xAddr1", 5)
+        after_lower = await nonce_repo.get("0xAddr1")
+        await nonce_repo.advance_to("0xAddr1", 12)
+
+        # Assert
+        assert after_lower == 10
+        assert await nonce_repo.get("0xAddr1") == 12
+
+    async def test_give_back_only_the_latest_range(self, nonce_repo: NonceRepository):
+        """
+        Tests that an unused range is only returned if nothing was allocated after it.
+        """
+        # Arrange
+        await nonce_repo.initialize("0xAddr1", 0)
+        first = await nonce_repo.allocate("0xAddr1", 5)
+        second = await nonce_repo.allocate("0xAddr1", 5)
+
+        # Act
+        first_returned = await nonce_repo.give_back("0xAddr1", first + 2, first + 5)
+        second_returned = await nonce_repo.give_back("0xAddr1", second + 1, second + 5)
+
+        # Assert
+        assert not first_returned
+        assert second_returned
+        assert await nonce_repo.get("0xAddr1") == 6
+
+    async def test_concurrent_workers_never_share_a_nonce(self, tmp_path):
+        """
+        Tests that workers with their own engine, sharing one database file,
+        get disjoint nonces.
+        """
+        # Arrange
+        url = f"sqlite+aiosqlite:///{tmp_path / 'nonces.db'}"
+        engines = [create_async_engine(url) for _ in range(3)]
+        async with engines[0].begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        sessionmakers = [async_sessionmaker(bind=engine) for engine in engines]
+        async with sessionmakers[0]() as session:
+            await NonceRepository(session).initialize("0xAddr1", 0)
+
+        async def worker(sessionmaker) -> list:
+            nonces = []
+            for _ in range(10):
+                async with sessionmaker() as session:
+                    nonces.append(await NonceRepository(session).allocate("0xAddr1"))
+            return nonces
+
+        # Act
+        results = await asyncio.gather(*(worker(sessionmaker) for sessionmaker in sessionmakers))
+
+        # Assert
+        allocated = [nonce for nonces in results for nonce in nonces]
+        assert sorted(allocated) == list(range(30))
+        for engine in engines:
+            await engine.dispose()
@@ -0,0 +1,90 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import Column, Integer, MetaData, String, Table, inspect, text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from src.core.entities.address import Address
+from src.core.enums import AddressStatus
+from src.infra.database.repositories import AddressRepository
+from src.infra.database.schema import create_schema
+
+
+# The addresses table as the first release created it
+baseline_metadata = MetaData()
+Table(
+    "addresses", baseline_metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("public_address", String, unique=True, index=True, nullable=False),
+    Column("encrypted_private_key", String, nullable=False),
+)
+
+
+@pytest_asyncio.fixture(scope="function")
+async def baseline_engine(tmp_path):
+    """
+    Pytest fixture that provides a database holding the baseline schema and one stored address.
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'baseline.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(baseline_metadata.create_all)
+        await conn.execute(text(
+            "INSERT INTO addresses (public_address, encrypted_private_key) VALUES ('0xExisting', 'key')"))
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+class TestCreateSchema:
+    """
+    Integration test suite for the startup schema upgrade.
+    """
+
+    async def test_upgrades_the_baseline_addresses_table(self, baseline_engine):
+        """
+        Tests that an existing database gets the new columns and indexes, its
+        addresses stay assigned, and the repository works on it.
+        """
+        # Act
+        async with baseline_engine.begin() as conn:
+            await conn.run_sync(create_schema)
+
+        # Assert
+        async with baseline_engine.connect() as conn:
+            indexes = await conn.run_sync(
+                lambda sync_conn: {index["name"] for index in inspect(sync_conn).get_indexes("addresses")})
+        assert {"ix_addresses_status_id", "ix_addresses_derivation_index"} <= indexes
+
+        async with async_sessionmaker(bind=baseline_engine)() as session:
+            address_repo = AddressRepository(session)
+            stored_status = (await session.execute(text(
+                "SELECT status FROM addresses WHERE public_address = '0xExisting'"))).scalar_one()
+
+            await address_repo.create_many([
+                Address(public_address="0xPooled", encrypted_private_key="key", status=AddressStatus.UNASSIGNED),
+                Address(public_address="0xDerived", encrypted_private_key="", derivation_index=0),
+            ])
+
+            assert stored_status == AddressStatus.ASSIGNED.value
+            assert [address.public_address for address in await address_repo.get_all()] == [
+                "0xExisting", "0xDerived"]
+            assert await address_repo.find_by_public_address("0xExisting") is not None
+            assert await address_repo.count_unassigned() == 1
+            assert await address_repo.next_derivation_index() == 1
+            with pytest.raises(ValueError):
+                await address_repo.create_many([
+                    Address(public_address="0xDerivedAgain", encrypted_private_key="", derivation_index=0)])
+
+    async def test_running_it_again_changes_nothing(self, baseline_engine):
+        """
+        Tests that the upgrade is idempotent, as it runs on every startup.
+        """
+        # Act
+        for _ in range(2):
+            async with baseline_engine.begin() as conn:
+                await conn.run_sync(create_schema)
+
+        # Assert
+        async with baseline_engine.connect() as conn:
+            columns = await conn.run_sync(
+                lambda sync_conn: [column["name"] for column in inspect(sync_conn).get_columns("addresses")])
+        assert columns.count("status") == 1
+        assert columns.count("derivation_index") == 1
@@ -207,3 +207,71 @@ class TestTransactionRepository:
         assert refetched_tx is not None
         assert refetched_tx.status == TransactionStatus.CONFIRMED
         assert refetched_tx.effective_cost == Decimal("0.005")
+
+    async def test_update_many(self, transaction_repo: TransactionRepository):
+        """
+        Tests that many transactions are updated by hash in a single call.
+        """
+        # Arrange
+        pending = [
+            Transaction(
+                tx_hash=f"0x_bulk_{i}", asset="ETH", from_address="0xFrom", to_address="0xTo",
+                value=Decimal("1"), status=TransactionStatus.PENDING, effective_cost=Decimal("0")
+            )
+            for i in range(3)
+        ]
+        for tx in pending:
+            await transaction_repo.create(tx)
+
+        confirmed = pending[0].model_copy(
+            update={"status": TransactionStatus.CONFIRMED, "effective_cost": Decimal("0.001")})
+        failed = pending[1].model_copy(update={"status": TransactionStatus.FAILED})
+
+        # Act
+        await transaction_repo.update_many([confirmed, failed])
+
+        # Assert
+        assert (await transaction_repo.find_by_hash("0x_bulk_0")).status == TransactionStatus.CONFIRMED
+        assert (await transaction_repo.find_by_hash("0x_bulk_0")).effective_cost == Decimal("0.001")
+        assert (await transaction_repo.find_by_hash("0x_bulk_1")).status == TransactionStatus.FAILED
+        assert (await transaction_repo.find_by_hash("0x_bulk_2")).status == TransactionStatus.PENDING
+
+    async def test_get_by_status(self, transaction_repo: TransactionRepository):
+        """
+        Tests that only transactions with the given status are returned.
+        """
+        # Arrange
+        for tx_hash, tx_status in [("0x_s1", TransactionStatus.PENDING),
+                                   ("0x_s2", TransactionStatus.CONFIRMED),
+                                   ("0x_s3", TransactionStatus.PENDING)]:
+            await transaction_repo.create(Transaction(
+                tx_hash=tx_hash, asset="ETH", from_address="0xFrom", to_address="0xTo",
+                value=Decimal("1"), status=tx_status, effective_cost=Decimal("0")
+            ))
+
+        # Act
+        pending = await transaction_repo.get_by_status(TransactionStatus.PENDING)
+
+        # Assert
+        assert {tx.tx_hash for tx in pending} == {"0x_s1", "0x_s3"}
+
+    async def test_create_many_stores_all_rows(self, transaction_repo: TransactionRepository):
+        """
+        Tests that a batch of pending transactions is stored with one bulk insert.
+        """
+        # Arrange
+        transactions = [
+            Transaction(
+                tx_hash=f"0x_bulk_{i}", asset="ETH", from_address="0xFrom", to_address="0xTo",
+                value=Decimal(i), status=TransactionStatus.PENDING, effective_cost=Decimal("0")
+            )
+            for i in range(1, 4)
+        ]
+
+        # Act
+        await transaction_repo.create_many(transactions)
+
+        # Assert
+        stored = await transaction_repo.get_by_status(TransactionStatus.PENDING)
+        assert sorted((tx.tx_hash, tx.value) for tx in stored) == [
+            ("0x_bulk_1", Decimal("1")), ("0x_bulk_2", Decimal("2")), ("0x_bulk_3", Decimal("3"))]
@@ -0,0 +1,28 @@
+import pytest
+from contextlib import asynccontextmanager
+
+
+class FakeClock:
+    """Stands in for time.monotonic, moved forward by the tests through `now`."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def scope():
+    """Wraps a repository in a factory, like the application's *_repository_scope."""
+    def wrap(repo):
+        @asynccontextmanager
+        async def repo_scope():
+            yield repo
+        return repo_scope
+    return wrap
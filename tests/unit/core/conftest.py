@@ -1,6 +1,6 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock
-from src.core.services import TransactionService
+from src.core.services import TransactionService, ConfirmationScheduler
 from src.core.interfaces import (
     ITransactionRepository,
     IAddressRepository,
@@ -57,3 +57,15 @@ def transaction_service(
         encryption_service=mock_encryption_service,
         nonce_manager=mock_nonce_manager
     )
+
+
+@pytest.fixture
+def scheduler(mock_blockchain_service: IBlockchainService, mock_transaction_repo: ITransactionRepository, clock, scope) -> ConfirmationScheduler:
+    """Provides a ConfirmationScheduler with a mocked node and repository."""
+    return ConfirmationScheduler(
+        blockchain_service=mock_blockchain_service,
+        transaction_repo_factory=scope(mock_transaction_repo),
+        batch_size=2,
+        timeout=300,
+        clock=clock,
+    )
@@ -0,0 +1,126 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.core.services import AddressPool
+from src.core.enums import AddressStatus
+from src.core.interfaces import IAddressRepository, IEncryptionService
+
+
+@pytest.fixture
+def mock_address_repo() -> IAddressRepository:
+    repo = AsyncMock(spec=IAddressRepository)
+    repo.acquire_refill_lease.return_value = True
+    return repo
+
+
+@pytest.fixture
+def mock_encryption_service() -> IEncryptionService:
+    service = MagicMock(spec=IEncryptionService)
+    service.encrypt.return_value = b"encrypted_key"
+    return service
+
+
+@pytest.fixture
+def pool(mock_address_repo, mock_encryption_service, scope) -> AddressPool:
+    return AddressPool(scope(mock_address_repo), mock_encryption_service,
+                       low_watermark=10, high_watermark=50, chunk_size=20, check_interval=60)
+
+
+@pytest.mark.asyncio
+class TestAddressPool:
+    """
+    Unit test suite for the pool of pre-generated addresses.
+    """
+
+    async def test_refills_up_to_high_watermark(self, pool: AddressPool, mock_address_repo: IAddressRepository):
+        """
+        Tests that a pool below its low watermark is topped up to the high one, as unassigned rows.
+        """
+        # Arrange
+        mock_address_repo.count_unassigned.return_value = 5
+
+        # Act
+        added = await pool.refill()
+
+        # Assert
+        assert added == 45
+        stored = mock_address_repo.create_many.await_args.args[0]
+        assert len(stored) == 45
+        assert all(address.status == AddressStatus.UNASSIGNED for address in stored)
+        mock_address_repo.release_refill_lease.assert_awaited_once()
+
+    async def test_no_refill_while_another_worker_holds_the_lease(self, pool: AddressPool, mock_address_repo: IAddressRepository):
+        """
+        Tests that only the worker holding the refill lease tops the pool up,
+        so N workers do not generate N times the shortfall.
+        """
+        # Arrange
+        mock_address_repo.count_unassigned.return_value = 5
+        mock_address_repo.acquire_refill_lease.return_value = False
+
+        # Act
+        added = await pool.refill()
+
+        # Assert
+        assert added == 0
+        mock_address_repo.create_many.assert_not_awaited()
+        mock_address_repo.release_refill_lease.assert_not_awaited()
+
+    async def test_pool_is_counted_again_once_the_lease_is_taken(self, pool: AddressPool, mock_address_repo: IAddressRepository):
+        """
+        Tests that a pool refilled by another worker just before the lease was
+        taken is not topped up a second time, and the lease is given back.
+        """
+        # Arrange
+        mock_address_repo.count_unassigned.side_effect = [5, 50]
+
+        # Act
+        added = await pool.refill()
+
+        # Assert
+        assert added == 0
+        mock_address_repo.create_many.assert_not_awaited()
+        mock_address_repo.release_refill_lease.assert_awaited_once()
+
+    async def test_no_refill_above_low_watermark(self, pool: AddressPool, mock_address_repo: IAddressRepository):
+        """
+        Tests that nothing is generated while enough addresses are pooled.
+        """
+        # Arrange
+        mock_address_repo.count_unassigned.return_value = 10
+
+        # Act
+        added = await pool.refill()
+
+        # Assert
+        assert added == 0
+        mock_address_repo.create_many.assert_not_awaited()
+
+    async def test_handout_wakes_the_background_task(self, mock_address_repo: IAddressRepository, mock_encryption_service: IEncryptionService, scope):
+        """
+        Tests that a refill request is served without waiting for the check interval.
+        """
+        # Arrange
+        pool = AddressPool(scope(mock_address_repo), mock_encryption_service,
+                           low_watermark=1, high_watermark=2, check_interval=60)
+        mock_address_repo.count_unassigned.return_value = 2
+        pool.start()
+        await asyncio.sleep(0.01)
+
+        # Act
+        mock_address_repo.count_unassigned.return_value = 0
+        pool.request_refill()
+        await asyncio.sleep(0.2)
+        await pool.stop()
+
+        # Assert
+        assert mock_address_repo.count_unassigned.await_count == 3
+        mock_address_repo.create_many.assert_awaited_once()
+
+    async def test_rejects_inverted_watermarks(self, mock_address_repo: IAddressRepository, mock_encryption_service: IEncryptionService, scope):
+        """
+        Tests that the low watermark cannot exceed the high one.
+        """
+        # Act & Assert
+        with pytest.raises(ValueError, match="Address pool watermarks must satisfy 0 <= low <= high."):
+            AddressPool(scope(mock_address_repo), mock_encryption_service, low_watermark=100, high_watermark=10)
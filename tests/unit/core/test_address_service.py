@@ -1,8 +1,12 @@
 import pytest
+from cryptography.fernet import Fernet
+from eth_account import Account
 from unittest.mock import MagicMock, AsyncMock
 from src.core.services import AddressService
 from src.core.entities.address import Address
-from src.core.interfaces import IAddressRepository, IEncryptionService
+from src.core.interfaces import IAddressRepository, IEncryptionService, IAddressPool, IHDWallet
+from src.infra.concurrency import BoundedExecutor
+from src.infra.security.encryption import EncryptionService
 
 
 @pytest.fixture
@@ -77,6 +81,28 @@ class TestAddressService:
         with pytest.raises(ValueError, match="Number of addresses to create must be between 1 and 100."):
             await address_service.create_new_addresses(invalid_count)
 
+    async def test_provision_addresses_allows_bulk_counts(
+        self,
+        address_service: AddressService,
+        mock_address_repo: IAddressRepository,
+        mock_encryption_service: IEncryptionService
+    ):
+        """
+        Tests that operators can provision more addresses than a request may create,
+        up to their own cap, and only get the count back.
+        """
+        # Arrange
+        mock_encryption_service.encrypt.return_value = b"encrypted_key"
+
+        # Act
+        created = await address_service.provision_addresses(150)
+
+        # Assert
+        assert created == 150
+        assert len(mock_address_repo.create_many.await_args[0][0]) == 150
+        with pytest.raises(ValueError, match="Number of addresses to create must be between 1 and 50000."):
+            await address_service.provision_addresses(50_001)
+
     async def test_get_all_addresses_success(
         self,
         address_service: AddressService,
@@ -101,3 +127,136 @@ class TestAddressService:
         assert len(result) == 2
         assert result[0].public_address == "0xAddr1"
         mock_address_repo.get_all.assert_awaited_once()
+
+    async def test_addresses_are_generated_in_chunks_on_the_executor(
+        self,
+        mock_address_repo: IAddressRepository,
+        monkeypatch
+    ):
+        """
+        Tests that generation is split into chunks run by the executor, with real keys
+        encrypted by a picklable service.
+        """
+        # Arrange
+        monkeypatch.setenv("ENCRYPTION_KEYS", Fernet.generate_key().decode())
+        encryption_service = EncryptionService()
+        executor = BoundedExecutor("process", max_workers=2, queue_size=0)
+        service = AddressService(
+            address_repo=mock_address_repo,
+            encryption_service=encryption_service,
+            address_executor=executor,
+            chunk_size=4
+        )
+        chunk_sizes = []
+        run = executor.run
+
+        async def recording_run(func, *args):
+            chunk_sizes.append(args[-1])
+            return await run(func, *args)
+
+        executor.run = recording_run
+
+        # Act
+        created_addresses = await service.create_new_addresses(10)
+        executor.shutdown()
+
+        # Assert
+        assert chunk_sizes == [4, 4, 2]
+        saved = mock_address_repo.create_many.await_args[0][0]
+        assert len({address.public_address for address in saved}) == 10
+        decrypted = encryption_service.decrypt(saved[0].encrypted_private_key.encode())
+        assert Account.from_key(decrypted).address == saved[0].public_address
+        assert all(address.encrypted_private_key == "" for address in created_addresses)
+
+    async def test_create_new_addresses_hands_out_pooled_addresses_first(
+        self,
+        mock_address_repo: IAddressRepository,
+        mock_encryption_service: IEncryptionService
+    ):
+        """
+        Tests that pooled addresses are assigned, only the shortfall is generated,
+        and the pool is asked to refill.
+        """
+        # Arrange
+        address_pool = MagicMock(spec=IAddressPool)
+        service = AddressService(
+            address_repo=mock_address_repo,
+            encryption_service=mock_encryption_service,
+            address_pool=address_pool
+        )
+        mock_address_repo.assign_unassigned.return_value = [
+            Address(public_address="0xPooled1", encrypted_private_key="key1"),
+            Address(public_address="0xPooled2", encrypted_private_key="key2"),
+        ]
+        mock_encryption_service.encrypt.return_value = b"encrypted_key"
+
+        # Act
+        created_addresses = await service.create_new_addresses(3)
+
+        # Assert
+        mock_address_repo.assign_unassigned.assert_awaited_once_with(3)
+        assert [address.public_address for address in created_addresses][:2] == ["0xPooled1", "0xPooled2"]
+        assert len(created_addresses) == 3
+        assert len(mock_address_repo.create_many.await_args.args[0]) == 1
+        address_pool.request_refill.assert_called_once()
+
+    async def test_create_new_addresses_derives_them_from_the_hd_wallet(
+        self,
+        mock_address_repo: IAddressRepository,
+        mock_encryption_service: IEncryptionService
+    ):
+        """
+        Tests that in HD mode addresses are derived from the next free index, and
+        only the index is stored.
+        """
+        # Arrange
+        hd_wallet = MagicMock(spec=IHDWallet)
+        hd_wallet.derive_addresses.side_effect = lambda start, count: [
+            f"0xDerived{index}" for index in range(start, start + count)]
+        service = AddressService(
+            address_repo=mock_address_repo,
+            encryption_service=mock_encryption_service,
+            chunk_size=2,
+            hd_wallet=hd_wallet
+        )
+        mock_address_repo.next_derivation_index.return_value = 5
+
+        # Act
+        created_addresses = await service.create_new_addresses(3)
+
+        # Assert
+        saved = mock_address_repo.create_many.await_args.args[0]
+        assert [(address.public_address, address.derivation_index) for address in saved] == [
+            ("0xDerived5", 5), ("0xDerived6", 6), ("0xDerived7", 7)]
+        assert all(address.encrypted_private_key == "" for address in saved)
+        assert [address.public_address for address in created_addresses] == [
+            "0xDerived5", "0xDerived6", "0xDerived7"]
+        mock_encryption_service.encrypt.assert_not_called()
+
+    async def test_hd_mode_retries_when_the_indexes_are_taken(
+        self,
+        mock_address_repo: IAddressRepository,
+        mock_encryption_service: IEncryptionService
+    ):
+        """
+        Tests that indexes claimed by a concurrent request are skipped by reading
+        the next free index again.
+        """
+        # Arrange
+        hd_wallet = MagicMock(spec=IHDWallet)
+        hd_wallet.derive_addresses.side_effect = lambda start, count: [
+            f"0xDerived{index}" for index in range(start, start + count)]
+        service = AddressService(
+            address_repo=mock_address_repo,
+            encryption_service=mock_encryption_service,
+            hd_wallet=hd_wallet
+        )
+        mock_address_repo.next_derivation_index.side_effect = [0, 1]
+        mock_address_repo.create_many.side_effect = [ValueError("One of the addresses already exists"), None]
+
+        # Act
+        created_addresses = await service.create_new_addresses(1)
+
+        # Assert
+        assert [address.public_address for address in created_addresses] == ["0xDerived1"]
+        assert mock_address_repo.create_many.await_count == 2
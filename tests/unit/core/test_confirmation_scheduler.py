@@ -0,0 +1,132 @@
+import asyncio
+import pytest
+from decimal import Decimal
+from src.core.services import ConfirmationScheduler
+from src.core.entities.transaction import Transaction as TransactionEntity
+from src.core.enums import TransactionStatus
+from src.core.interfaces import ITransactionRepository, IBlockchainService
+
+
+def pending_tx(tx_hash: str) -> TransactionEntity:
+    return TransactionEntity(
+        tx_hash=tx_hash, asset="ETH", from_address="0xFrom", to_address="0xTo",
+        value=Decimal("1"), status=TransactionStatus.PENDING, effective_cost=Decimal("0")
+    )
+
+
+@pytest.mark.asyncio
+class TestConfirmationScheduler:
+    """
+    Test suite for the scheduler monitoring every pending transaction.
+    """
+
+    async def test_receipts_are_fetched_in_batches_and_saved_in_bulk(self, scheduler: ConfirmationScheduler, mock_blockchain_service: IBlockchainService, mock_transaction_repo: ITransactionRepository):
+        """
+        Scenario: Three pending transactions are resolved with two batched RPC calls
+        and a single bulk update.
+        """
+        # Arrange
+        for tx_hash in ["0x1", "0x2", "0x3"]:
+            scheduler.watch(pending_tx(tx_hash))
+        mock_blockchain_service.get_latest_block_number.return_value = 100
+        mock_blockchain_service.batch_call.side_effect = [
+            [{'status': 1, 'gasUsed': 21000, 'effectiveGasPrice': 10**9}, {'status': 0}],
+            [None],
+        ]
+
+        # Act
+        finished = await scheduler.poll_once()
+
+        # Assert
+        assert mock_blockchain_service.batch_call.await_count == 2
+        assert mock_blockchain_service.batch_call.await_args_list[0].args[0] == [
+            ("eth_getTransactionReceipt", ["0x1"]), ("eth_getTransactionReceipt", ["0x2"])]
+
+        mock_transaction_repo.update_many.assert_awaited_once()
+        updated = mock_transaction_repo.update_many.await_args.args[0]
+        assert [(tx.tx_hash, tx.status) for tx in updated] == [
+            ("0x1", TransactionStatus.CONFIRMED), ("0x2", TransactionStatus.FAILED)]
+        assert updated[0].effective_cost == Decimal("0.000021")
+        assert finished == updated
+        assert len(scheduler) == 1
+
+    async def test_receipts_are_checked_once_per_block(self, scheduler: ConfirmationScheduler, mock_blockchain_service: IBlockchainService, mock_transaction_repo: ITransactionRepository):
+        """
+        Scenario: Polling again within the same block costs no receipt fetch.
+        """
+        # Arrange
+        scheduler.watch(pending_tx("0x1"))
+        mock_blockchain_service.get_latest_block_number.return_value = 100
+        mock_blockchain_service.batch_call.return_value = [None]
+
+        # Act
+        await scheduler.poll_once()
+        await scheduler.poll_once()
+        mock_blockchain_service.get_latest_block_number.return_value = 101
+        await scheduler.poll_once()
+
+        # Assert
+        assert mock_blockchain_service.batch_call.await_count == 2
+        mock_transaction_repo.update_many.assert_not_awaited()
+
+    async def test_no_rpc_without_pending_transactions(self, scheduler: ConfirmationScheduler, mock_blockchain_service: IBlockchainService):
+        """
+        Scenario: An idle scheduler does not touch the node.
+        """
+        # Act
+        finished = await scheduler.poll_once()
+
+        # Assert
+        assert finished == []
+        mock_blockchain_service.get_latest_block_number.assert_not_awaited()
+
+    async def test_transaction_is_dropped_after_timeout(self, scheduler: ConfirmationScheduler, mock_blockchain_service: IBlockchainService, mock_transaction_repo: ITransactionRepository, clock):
+        """
+        Scenario: A transaction without receipt after the timeout stops being monitored.
+        """
+        # Arrange
+        scheduler.watch(pending_tx("0x1"))
+        mock_blockchain_service.get_latest_block_number.return_value = 100
+        mock_blockchain_service.batch_call.return_value = [None]
+        clock.now += 301
+
+        # Act
+        await scheduler.poll_once()
+
+        # Assert
+        assert len(scheduler) == 0
+        mock_transaction_repo.update_many.assert_not_awaited()
+
+    async def test_recovered_transactions_are_checked_without_a_new_block(self, scheduler: ConfirmationScheduler, mock_blockchain_service: IBlockchainService, mock_transaction_repo: ITransactionRepository):
+        """
+        Scenario: Rows left pending by a previous run are checked on the next poll,
+        with a bounded number of concurrent batches.
+        """
+        # Arrange
+        mock_blockchain_service.get_latest_block_number.return_value = 100
+        mock_blockchain_service.batch_call.return_value = [None]
+        scheduler.watch(pending_tx("0x0"))
+        await scheduler.poll_once()
+
+        scheduler.max_concurrent_batches = 2
+        in_flight, max_in_flight = 0, 0
+
+        async def batch_call(calls):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return [{'status': 1, 'gasUsed': 0, 'effectiveGasPrice': 0}] * len(calls)
+
+        mock_blockchain_service.batch_call.side_effect = batch_call
+
+        # Act
+        scheduler.watch_many([pending_tx(f"0x{i}") for i in range(1, 11)])
+        finished = await scheduler.poll_once()
+
+        # Assert
+        assert len(finished) == 11
+        assert max_in_flight == 2
+        mock_transaction_repo.update_many.assert_awaited_once()
+        assert len(scheduler) == 0
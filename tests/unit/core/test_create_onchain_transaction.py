@@ -1,15 +1,23 @@
+import asyncio
 import pytest
+from unittest.mock import AsyncMock, MagicMock
 from decimal import Decimal
 from eth_account import Account
-from src.core.services import TransactionService
+from web3.exceptions import Web3RPCError
+from src.core.services import TransactionService, ManagedAddressIndex
+from src.core.services.transaction_service import sign_transaction
 from src.core.entities.address import Address as AddressEntity
-from src.core.enums import TransactionStatus
+from src.core.enums import FeeTier, TransactionStatus
 from src.core.interfaces import (
     ITransactionRepository,
     IAddressRepository,
     IBlockchainService,
     IEncryptionService,
-    INonceManager
+    INonceManager,
+    ITaskExecutor,
+    IFeeOracle,
+    IGasLimitResolver,
+    IHDWallet
 )
 
 
@@ -27,7 +35,7 @@ class TestCreateOnchainTransaction:
         to_addr = receiver_account.address
         value = Decimal("0.5")
 
-        mock_nonce_manager.get_next_nonce.return_value = 10
+        mock_nonce_manager.reserve_nonce.return_value = 10
         mock_address_repo.find_by_public_address.return_value = AddressEntity(
             public_address=from_addr, encrypted_private_key="encrypted_key")
         mock_encryption_service.decrypt.return_value = sender_account.key
@@ -44,12 +52,53 @@ class TestCreateOnchainTransaction:
         assert result.status == TransactionStatus.PENDING
 
         # Verify that dependencies were called correctly
-        mock_nonce_manager.get_next_nonce.assert_awaited_with(from_addr)
+        mock_nonce_manager.reserve_nonce.assert_awaited_with(from_addr)
+        mock_nonce_manager.commit_nonce.assert_awaited_once_with(from_addr, 10)
+        mock_nonce_manager.release_nonce.assert_not_awaited()
         mock_encryption_service.decrypt.assert_called_once()
         mock_blockchain_service.broadcast_transaction.assert_awaited_once()
         mock_transaction_repo.create.assert_awaited_once()
 
-    async def test_creation_fails_if_from_address_not_managed(self, transaction_service: TransactionService, mock_address_repo: IAddressRepository):
+    async def test_decrypt_and_sign_run_on_the_cpu_executor(self, mock_transaction_repo: ITransactionRepository, mock_address_repo: IAddressRepository, mock_nonce_manager: INonceManager, mock_encryption_service: IEncryptionService, mock_blockchain_service: IBlockchainService):
+        """
+        Tests that key decryption and signing are handed to the configured executor.
+        """
+        # Arrange
+        sender_account = Account.create()
+        ran = []
+
+        class RecordingExecutor(ITaskExecutor):
+            async def run(self, func, *args):
+                ran.append(func)
+                return func(*args)
+
+            def shutdown(self):
+                pass
+
+        service = TransactionService(
+            transaction_repo=mock_transaction_repo,
+            address_repo=mock_address_repo,
+            blockchain_service=mock_blockchain_service,
+            encryption_service=mock_encryption_service,
+            nonce_manager=mock_nonce_manager,
+            cpu_executor=RecordingExecutor()
+        )
+        mock_nonce_manager.reserve_nonce.return_value = 0
+        mock_address_repo.find_by_public_address.return_value = AddressEntity(
+            public_address=sender_account.address, encrypted_private_key="encrypted_key")
+        mock_encryption_service.decrypt.return_value = sender_account.key
+        mock_blockchain_service.get_base_fee.return_value = 20 * 10**9
+        mock_blockchain_service.estimate_gas.return_value = 21000
+        mock_blockchain_service.broadcast_transaction.return_value = "0x_new_tx_hash"
+
+        # Act
+        await service.create_onchain_transaction(
+            sender_account.address, Account.create().address, "ETH", Decimal("0.5"))
+
+        # Assert
+        assert ran == [mock_encryption_service.decrypt, sign_transaction]
+
+    async def test_creation_fails_if_from_address_not_managed(self, transaction_service: TransactionService, mock_address_repo: IAddressRepository, mock_nonce_manager: INonceManager):
         """
         Tests if creation fails if the source address is not managed by the service.
         """
@@ -59,3 +108,357 @@ class TestCreateOnchainTransaction:
         # Act & Assert
         with pytest.raises(ValueError, match="Source address not managed by this service."):
             await transaction_service.create_onchain_transaction("0x" + "a" * 40, "0x" + "b" * 40, "ETH", Decimal("1"))
+
+        # Failed before gas estimation, so no nonce was reserved
+        mock_nonce_manager.reserve_nonce.assert_not_awaited()
+        mock_nonce_manager.release_nonce.assert_not_awaited()
+
+    async def test_nonce_is_released_if_broadcast_is_rejected(self, transaction_service: TransactionService, mock_address_repo: IAddressRepository, mock_nonce_manager: INonceManager, mock_encryption_service: IEncryptionService, mock_blockchain_service: IBlockchainService, mock_transaction_repo: ITransactionRepository):
+        """
+        Tests that a transaction rejected by the node gives its nonce back for reuse.
+        """
+        # Arrange
+        sender_account = Account.create()
+        mock_nonce_manager.reserve_nonce.return_value = 4
+        mock_address_repo.find_by_public_address.return_value = AddressEntity(
+            public_address=sender_account.address, encrypted_private_key="encrypted_key")
+        mock_encryption_service.decrypt.return_value = sender_account.key
+        mock_blockchain_service.get_base_fee.return_value = 20 * 10**9
+        mock_blockchain_service.estimate_gas.return_value = 21000
+        mock_blockchain_service.broadcast_transaction.side_effect = Web3RPCError(
+            "insufficient funds for gas * price + value")
+
+        # Act & Assert
+        with pytest.raises(Web3RPCError):
+            await transaction_service.create_onchain_transaction(
+                sender_account.address, Account.create().address, "ETH", Decimal("1"))
+
+        mock_nonce_manager.release_nonce.assert_awaited_once_with(sender_account.address, 4)
+        mock_nonce_manager.commit_nonce.assert_not_awaited()
+        mock_transaction_repo.create.assert_not_awaited()
+
+    async def test_nonce_is_kept_if_broadcast_outcome_is_unknown(self, transaction_service: TransactionService, mock_address_repo: IAddressRepository, mock_nonce_manager: INonceManager, mock_encryption_service: IEncryptionService, mock_blockchain_service: IBlockchainService):
+        """
+        Tests that a nonce is not reused when the node may have accepted the transaction.
+        """
+        # Arrange
+        sender_account = Account.create()
+        mock_nonce_manager.reserve_nonce.return_value = 4
+        mock_address_repo.find_by_public_address.return_value = AddressEntity(
+            public_address=sender_account.address, encrypted_private_key="encrypted_key")
+        mock_encryption_service.decrypt.return_value = sender_account.key
+        mock_blockchain_service.get_base_fee.return_value = 20 * 10**9
+        mock_blockchain_service.estimate_gas.return_value = 21000
+        mock_blockchain_service.broadcast_transaction.side_effect = TimeoutError()
+
+        # Act & Assert
+        with pytest.raises(TimeoutError):
+            await transaction_service.create_onchain_transaction(
+                sender_account.address, Account.create().address, "ETH", Decimal("1"))
+
+        mock_nonce_manager.commit_nonce.assert_awaited_once_with(sender_account.address, 4)
+        mock_nonce_manager.release_nonce.assert_not_awaited()
+
+    async def test_used_nonce_is_committed_and_repaired(self, transaction_service: TransactionService, mock_address_repo: IAddressRepository, mock_nonce_manager: INonceManager, mock_encryption_service: IEncryptionService, mock_blockchain_service: IBlockchainService):
+        """
+        Tests that a nonce the node reports as used is not handed out again, and
+        that the address is repaired right away.
+        """
+        # Arrange
+        sender_account = Account.create()
+        mock_nonce_manager.reserve_nonce.return_value = 4
+        mock_address_repo.find_by_public_address.return_value = AddressEntity(
+            public_address=sender_account.address, encrypted_private_key="encrypted_key")
+        mock_encryption_service.decrypt.return_value = sender_account.key
+        mock_blockchain_service.get_base_fee.return_value = 20 * 10**9
+        mock_blockchain_service.estimate_gas.return_value = 21000
+        mock_blockchain_service.broadcast_transaction.side_effect = Web3RPCError("nonce too low")
+
+        # Act & Assert
+        with pytest.raises(Web3RPCError):
+            await transaction_service.create_onchain_transaction(
+                sender_account.address, Account.create().address, "ETH", Decimal("1"))
+
+        mock_nonce_manager.commit_nonce.assert_awaited_once_with(sender_account.address, 4)
+        mock_nonce_manager.release_nonce.assert_not_awaited()
+        mock_nonce_manager.repair_nonce.assert_awaited_once_with(sender_account.address)
+
+    async def test_nonce_is_released_if_the_request_is_cancelled(self, transaction_service: TransactionService, mock_address_repo: IAddressRepository, mock_nonce_manager: INonceManager, mock_encryption_service: IEncryptionService, mock_blockchain_service: IBlockchainService):
+        """
+        Tests that a request cancelled before signing (e.g. on shutdown) gives its nonce back.
+        """
+        # Arrange
+        sender_account = Account.create()
+        mock_nonce_manager.reserve_nonce.return_value = 4
+        mock_address_repo.find_by_public_address.return_value = AddressEntity(
+            public_address=sender_account.address, encrypted_private_key="encrypted_key")
+        mock_encryption_service.decrypt.return_value = sender_account.key
+        mock_blockchain_service.get_base_fee.return_value = 20 * 10**9
+        mock_blockchain_service.estimate_gas.return_value = 21000
+        signing = asyncio.Event()
+
+        async def slow_sign(tx_dict, private_key_bytes):
+            signing.set()
+            await asyncio.sleep(10)
+
+        transaction_service._sign_transaction = slow_sign
+
+        # Act
+        task = asyncio.ensure_future(transaction_service.create_onchain_transaction(
+            sender_account.address, Account.create().address, "ETH", Decimal("1")))
+        await signing.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # Assert
+        mock_nonce_manager.release_nonce.assert_awaited_once_with(sender_account.address, 4)
+        mock_nonce_manager.commit_nonce.assert_not_awaited()
+
+    async def test_nonce_reserved_during_gas_estimation_is_released_on_cancellation(self, transaction_service: TransactionService, mock_address_repo: IAddressRepository, mock_nonce_manager: INonceManager, mock_encryption_service: IEncryptionService, mock_blockchain_service: IBlockchainService):
+        """
+        Tests that a request cancelled once the nonce is reserved, but while the
+        gas is still being estimated, gives that nonce back.
+        """
+        # Arrange
+        sender_account = Account.create()
+        reserved = asyncio.Event()
+
+        async def reserve_nonce(address):
+            reserved.set()
+            return 4
+
+        async def slow_estimate_gas(tx_dict):
+            await asyncio.sleep(10)
+
+        mock_nonce_manager.reserve_nonce.side_effect = reserve_nonce
+        mock_address_repo.find_by_public_address.return_value = AddressEntity(
+            public_address=sender_account.address, encrypted_private_key="encrypted_key")
+        mock_encryption_service.decrypt.return_value = sender_account.key
+        mock_blockchain_service.get_base_fee.return_value = 20 * 10**9
+        mock_blockchain_service.estimate_gas.side_effect = slow_estimate_gas
+
+        # Act
+        task = asyncio.ensure_future(transaction_service.create_onchain_transaction(
+            sender_account.address, Account.create().address, "ETH", Decimal("1")))
+        await reserved.wait()
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # Assert
+        mock_nonce_manager.release_nonce.assert_awaited_once_with(sender_account.address, 4)
+        mock_nonce_manager.commit_nonce.assert_not_awaited()
+
+    async def test_nonce_still_being_reserved_is_released_on_cancellation(self, transaction_service: TransactionService, mock_address_repo: IAddressRepository, mock_nonce_manager: INonceManager, mock_encryption_service: IEncryptionService, mock_blockchain_service: IBlockchainService):
+        """
+        Tests that a request cancelled while its nonce is being reserved waits for
+        the reservation and gives the nonce back.
+        """
+        # Arrange
+        sender_account = Account.create()
+        reserving = asyncio.Event()
+        finish_reservation = asyncio.Event()
+
+        async def slow_reserve_nonce(address):
+            reserving.set()
+            await finish_reservation.wait()
+            return 4
+
+        mock_nonce_manager.reserve_nonce.side_effect = slow_reserve_nonce
+        mock_address_repo.find_by_public_address.return_value = AddressEntity(
+            public_address=sender_account.address, encrypted_private_key="encrypted_key")
+        mock_encryption_service.decrypt.return_value = sender_account.key
+        mock_blockchain_service.get_base_fee.return_value = 20 * 10**9
+        mock_blockchain_service.estimate_gas.return_value = 21000
+
+        # Act
+        task = asyncio.ensure_future(transaction_service.create_onchain_transaction(
+            sender_account.address, Account.create().address, "ETH", Decimal("1")))
+        await reserving.wait()
+        task.cancel()
+        await asyncio.sleep(0)
+        finish_reservation.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # Assert
+        mock_nonce_manager.release_nonce.assert_awaited_once_with(sender_account.address, 4)
+        mock_nonce_manager.commit_nonce.assert_not_awaited()
+
+    async def test_lookup_and_fee_fetch_overlap(self, transaction_service: TransactionService, mock_address_repo: IAddressRepository, mock_nonce_manager: INonceManager, mock_encryption_service: IEncryptionService, mock_blockchain_service: IBlockchainService):
+        """
+        Tests that the fee fetch runs while the sender is looked up, and that each
+        stage reports its duration.
+        """
+        # Arrange
+        sender_account = Account.create()
+        fees_started = asyncio.Event()
+
+        async def find_by_public_address(address):
+            # Only returns once the fee fetch has started
+            await asyncio.wait_for(fees_started.wait(), timeout=1)
+            return AddressEntity(public_address=address, encrypted_private_key="encrypted_key")
+
+        async def get_base_fee():
+            fees_started.set()
+            return 20 * 10**9
+
+        mock_address_repo.find_by_public_address.side_effect = find_by_public_address
+        mock_blockchain_service.get_base_fee.side_effect = get_base_fee
+        mock_nonce_manager.reserve_nonce.return_value = 0
+        mock_encryption_service.decrypt.return_value = sender_account.key
+        mock_blockchain_service.estimate_gas.return_value = 21000
+        mock_blockchain_service.broadcast_transaction.return_value = "0x_new_tx_hash"
+
+        # Act
+        await transaction_service.create_onchain_transaction(
+            sender_account.address, Account.create().address, "ETH", Decimal("1"))
+
+        # Assert
+        timings = transaction_service.get_stage_timings()
+        assert set(timings) == {"lookup", "decrypt", "fees", "gas", "nonce", "sign", "broadcast", "total", "store"}
+        assert all(seconds >= 0 for seconds in timings.values())
+
+    async def test_nonce_is_released_if_gas_estimation_fails(self, transaction_service: TransactionService, mock_address_repo: IAddressRepository, mock_nonce_manager: INonceManager, mock_encryption_service: IEncryptionService, mock_blockchain_service: IBlockchainService):
+        """
+        Tests that the nonce reserved alongside gas estimation is given back when it fails.
+        """
+        # Arrange
+        sender_account = Account.create()
+        mock_nonce_manager.reserve_nonce.return_value = 4
+        mock_address_repo.find_by_public_address.return_value = AddressEntity(
+            public_address=sender_account.address, encrypted_private_key="encrypted_key")
+        mock_encryption_service.decrypt.return_value = sender_account.key
+        mock_blockchain_service.get_base_fee.return_value = 20 * 10**9
+        mock_blockchain_service.estimate_gas.side_effect = Web3RPCError("execution reverted")
+
+        # Act & Assert
+        with pytest.raises(Web3RPCError):
+            await transaction_service.create_onchain_transaction(
+                sender_account.address, Account.create().address, "ETH", Decimal("1"))
+
+        mock_nonce_manager.release_nonce.assert_awaited_once_with(sender_account.address, 4)
+        mock_blockchain_service.broadcast_transaction.assert_not_awaited()
+
+    async def test_fees_come_from_the_oracle_for_the_tier(self, mock_transaction_repo: ITransactionRepository, mock_address_repo: IAddressRepository, mock_nonce_manager: INonceManager, mock_encryption_service: IEncryptionService, mock_blockchain_service: IBlockchainService):
+        """
+        Tests that the requested tier is priced by the fee oracle instead of the latest block.
+        """
+        # Arrange
+        sender_account = Account.create()
+        fee_oracle = AsyncMock(spec=IFeeOracle)
+        fee_oracle.get_fees.return_value = {"maxFeePerGas": 50 * 10**9, "maxPriorityFeePerGas": 3 * 10**9}
+        service = TransactionService(
+            transaction_repo=mock_transaction_repo,
+            address_repo=mock_address_repo,
+            blockchain_service=mock_blockchain_service,
+            encryption_service=mock_encryption_service,
+            nonce_manager=mock_nonce_manager,
+            fee_oracle=fee_oracle
+        )
+        mock_nonce_manager.reserve_nonce.return_value = 0
+        mock_address_repo.find_by_public_address.return_value = AddressEntity(
+            public_address=sender_account.address, encrypted_private_key="encrypted_key")
+        mock_encryption_service.decrypt.return_value = sender_account.key
+        mock_blockchain_service.estimate_gas.return_value = 21000
+        mock_blockchain_service.broadcast_transaction.return_value = "0x_new_tx_hash"
+
+        # Act
+        await service.create_onchain_transaction(
+            sender_account.address, Account.create().address, "ETH", Decimal("1"), fee_tier=FeeTier.FAST)
+
+        # Assert
+        fee_oracle.get_fees.assert_awaited_once_with(FeeTier.FAST)
+        mock_blockchain_service.get_base_fee.assert_not_awaited()
+        estimated = mock_blockchain_service.estimate_gas.await_args.args[0]
+        assert estimated["maxPriorityFeePerGas"] == 3 * 10**9
+
+    async def test_gas_limit_comes_from_the_resolver(self, mock_transaction_repo: ITransactionRepository, mock_address_repo: IAddressRepository, mock_nonce_manager: INonceManager, mock_encryption_service: IEncryptionService, mock_blockchain_service: IBlockchainService):
+        """
+        Tests that a known gas limit is used without calling estimate_gas.
+        """
+        # Arrange
+        sender_account = Account.create()
+        gas_limit_resolver = AsyncMock(spec=IGasLimitResolver)
+        gas_limit_resolver.resolve.return_value = 21000
+        service = TransactionService(
+            transaction_repo=mock_transaction_repo,
+            address_repo=mock_address_repo,
+            blockchain_service=mock_blockchain_service,
+            encryption_service=mock_encryption_service,
+            nonce_manager=mock_nonce_manager,
+            gas_limit_resolver=gas_limit_resolver
+        )
+        mock_nonce_manager.reserve_nonce.return_value = 0
+        mock_address_repo.find_by_public_address.return_value = AddressEntity(
+            public_address=sender_account.address, encrypted_private_key="encrypted_key")
+        mock_encryption_service.decrypt.return_value = sender_account.key
+        mock_blockchain_service.get_base_fee.return_value = 20 * 10**9
+        mock_blockchain_service.broadcast_transaction.return_value = "0x_new_tx_hash"
+
+        # Act
+        await service.create_onchain_transaction(
+            sender_account.address, Account.create().address, "ETH", Decimal("1"))
+
+        # Assert
+        gas_limit_resolver.resolve.assert_awaited_once()
+        mock_blockchain_service.estimate_gas.assert_not_awaited()
+
+    async def test_derived_sender_signs_with_the_hd_wallet_key(self, mock_transaction_repo: ITransactionRepository, mock_address_repo: IAddressRepository, mock_nonce_manager: INonceManager, mock_encryption_service: IEncryptionService, mock_blockchain_service: IBlockchainService):
+        """
+        Tests that an address with a derivation index signs with the key derived
+        by the HD wallet, without decrypting a stored key.
+        """
+        # Arrange
+        sender_account = Account.create()
+        hd_wallet = MagicMock(spec=IHDWallet)
+        hd_wallet.derive_private_key.return_value = sender_account.key
+        service = TransactionService(
+            transaction_repo=mock_transaction_repo,
+            address_repo=mock_address_repo,
+            blockchain_service=mock_blockchain_service,
+            encryption_service=mock_encryption_service,
+            nonce_manager=mock_nonce_manager,
+            hd_wallet=hd_wallet
+        )
+        mock_nonce_manager.reserve_nonce.return_value = 0
+        mock_address_repo.find_by_public_address.return_value = AddressEntity(
+            public_address=sender_account.address, encrypted_private_key="", derivation_index=4)
+        mock_blockchain_service.get_base_fee.return_value = 20 * 10**9
+        mock_blockchain_service.estimate_gas.return_value = 21000
+        mock_blockchain_service.broadcast_transaction.return_value = "0x_new_tx_hash"
+
+        # Act
+        await service.create_onchain_transaction(
+            sender_account.address, Account.create().address, "ETH", Decimal("1"))
+
+        # Assert
+        hd_wallet.derive_private_key.assert_called_once_with(4)
+        mock_encryption_service.decrypt.assert_not_called()
+        mock_blockchain_service.broadcast_transaction.assert_awaited_once()
+
+    async def test_sender_missing_from_the_address_index_is_looked_up(self, mock_transaction_repo: ITransactionRepository, mock_address_repo: IAddressRepository, mock_nonce_manager: INonceManager, mock_encryption_service: IEncryptionService, mock_blockchain_service: IBlockchainService):
+        """
+        Tests that a sender the address index does not know yet, e.g. created by
+        another worker since its last refresh, is still checked in the database,
+        and rejected only if it is not there either, before any nonce is reserved.
+        """
+        # Arrange
+        service = TransactionService(
+            transaction_repo=mock_transaction_repo,
+            address_repo=mock_address_repo,
+            blockchain_service=mock_blockchain_service,
+            encryption_service=mock_encryption_service,
+            nonce_manager=mock_nonce_manager,
+            address_index=ManagedAddressIndex(address_repo_factory=None)
+        )
+        mock_address_repo.find_by_public_address.return_value = None
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Source address not managed by this service."):
+            await service.create_onchain_transaction(
+                Account.create().address, Account.create().address, "ETH", Decimal("1"))
+        mock_address_repo.find_by_public_address.assert_awaited_once()
+        mock_nonce_manager.reserve_nonce.assert_not_awaited()
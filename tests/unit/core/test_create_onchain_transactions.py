@@ -0,0 +1,162 @@
+import pytest
+from decimal import Decimal
+from eth_account import Account
+from eth_account.typed_transactions import TypedTransaction
+from hexbytes import HexBytes
+from web3.exceptions import Web3RPCError
+from src.core.services import TransactionService
+from src.infra.blockchain.nonce_manager import NonceManager
+from src.core.entities import Address as AddressEntity, Transfer
+from src.core.enums import TransactionStatus
+from src.core.interfaces import (
+    ITransactionRepository,
+    IAddressRepository,
+    IBlockchainService,
+    IEncryptionService,
+    INonceManager
+)
+
+
+@pytest.fixture
+def sender():
+    return Account.create()
+
+
+@pytest.fixture
+def arranged(sender, mock_address_repo: IAddressRepository, mock_encryption_service: IEncryptionService, mock_blockchain_service: IBlockchainService, mock_nonce_manager: INonceManager):
+    """A managed sender with fees, gas and consecutive nonces from 7."""
+    mock_address_repo.find_by_public_address.side_effect = lambda address: AddressEntity(
+        public_address=address, encrypted_private_key="encrypted_key") if address == sender.address else None
+    mock_encryption_service.decrypt.return_value = sender.key
+    mock_blockchain_service.get_base_fee.return_value = 20 * 10**9
+    mock_blockchain_service.estimate_gas.return_value = 21000
+    mock_nonce_manager.reserve_nonces.side_effect = lambda address, count: list(range(7, 7 + count))
+
+
+@pytest.mark.asyncio
+class TestCreateOnchainTransactions:
+    """
+    Test suite for the batch creation of transactions.
+    """
+
+    async def test_batch_is_sent_once_per_sender(self, arranged, sender, transaction_service: TransactionService, mock_address_repo: IAddressRepository, mock_nonce_manager: INonceManager, mock_encryption_service: IEncryptionService, mock_blockchain_service: IBlockchainService, mock_transaction_repo: ITransactionRepository):
+        """
+        Scenario: Transfers of one sender share the key lookup, the fees, the gas estimate
+        of a recipient and a single broadcast, and are stored with one bulk insert.
+        """
+        # Arrange
+        recipient = Account.create().address
+        transfers = [
+            Transfer(from_address=sender.address, to_address=recipient, asset="ETH", value=Decimal(i))
+            for i in range(1, 4)
+        ]
+        mock_blockchain_service.broadcast_transactions.side_effect = lambda signed: [
+            f"0x_hash_{i}" for i in range(len(signed))]
+
+        # Act
+        results = await transaction_service.create_onchain_transactions(transfers)
+
+        # Assert
+        assert [result.transaction.tx_hash for result in results] == ["0x_hash_0", "0x_hash_1", "0x_hash_2"]
+        assert all(result.transaction.status == TransactionStatus.PENDING for result in results)
+        mock_address_repo.find_by_public_address.assert_awaited_once_with(sender.address)
+        mock_encryption_service.decrypt.assert_called_once()
+        mock_blockchain_service.get_base_fee.assert_awaited_once()
+        mock_blockchain_service.estimate_gas.assert_awaited_once()
+        mock_nonce_manager.reserve_nonces.assert_awaited_once_with(sender.address, 3)
+        mock_blockchain_service.broadcast_transactions.assert_awaited_once()
+
+        signed = mock_blockchain_service.broadcast_transactions.await_args.args[0]
+        assert [TypedTransaction.from_bytes(HexBytes(tx)).as_dict()["nonce"] for tx in signed] == [7, 8, 9]
+        assert [call.args for call in mock_nonce_manager.commit_nonce.await_args_list] == [
+            (sender.address, 7), (sender.address, 8), (sender.address, 9)]
+        mock_transaction_repo.create_many.assert_awaited_once_with(
+            [result.transaction for result in results])
+
+    async def test_released_nonces_are_broadcast_in_ascending_order(self, arranged, sender, mock_transaction_repo: ITransactionRepository, mock_address_repo: IAddressRepository, mock_encryption_service: IEncryptionService, mock_blockchain_service: IBlockchainService, scope):
+        """
+        Scenario: Released nonces are pending when a batch is reserved, so its nonces
+        are not consecutive. The batch is still broadcast in ascending nonce order.
+        """
+        # Arrange
+        mock_blockchain_service.get_transaction_count.return_value = 5
+        nonce_manager = NonceManager(scope(mock_address_repo), mock_blockchain_service)
+        service = TransactionService(
+            transaction_repo=mock_transaction_repo,
+            address_repo=mock_address_repo,
+            blockchain_service=mock_blockchain_service,
+            encryption_service=mock_encryption_service,
+            nonce_manager=nonce_manager
+        )
+        reserved = await nonce_manager.reserve_nonces(sender.address, 4)  # 5, 6, 7, 8
+        for nonce in (6, 8):
+            await nonce_manager.commit_nonce(sender.address, nonce)
+        for nonce in (7, 5):
+            await nonce_manager.release_nonce(sender.address, nonce)
+        transfers = [
+            Transfer(from_address=sender.address, to_address=Account.create().address, asset="ETH", value=Decimal(1))
+            for _ in range(3)
+        ]
+        mock_blockchain_service.broadcast_transactions.side_effect = lambda signed: [
+            f"0x_hash_{i}" for i in range(len(signed))]
+
+        # Act
+        results = await service.create_onchain_transactions(transfers)
+
+        # Assert
+        assert reserved == [5, 6, 7, 8]
+        assert all(result.error is None for result in results)
+        signed = mock_blockchain_service.broadcast_transactions.await_args.args[0]
+        assert [TypedTransaction.from_bytes(HexBytes(tx)).as_dict()["nonce"] for tx in signed] == [5, 7, 9]
+
+    async def test_failures_are_reported_per_item(self, arranged, sender, transaction_service: TransactionService, mock_nonce_manager: INonceManager, mock_blockchain_service: IBlockchainService, mock_transaction_repo: ITransactionRepository):
+        """
+        Scenario: An unmanaged sender and a rejected broadcast fail on their own,
+        and the rejected nonce is released.
+        """
+        # Arrange
+        transfers = [
+            Transfer(from_address=sender.address, to_address=Account.create().address, asset="ETH", value=Decimal("1")),
+            Transfer(from_address="0xUnmanaged", to_address=Account.create().address, asset="ETH", value=Decimal("1")),
+            Transfer(from_address=sender.address, to_address=Account.create().address, asset="ETH", value=Decimal("1")),
+        ]
+        mock_blockchain_service.broadcast_transactions.return_value = [
+            "0x_hash_0", Web3RPCError("insufficient funds for gas * price + value")]
+
+        # Act
+        results = await transaction_service.create_onchain_transactions(transfers)
+
+        # Assert
+        assert results[0].transaction.tx_hash == "0x_hash_0"
+        assert results[1].error == "Source address not managed by this service."
+        assert "insufficient funds" in results[2].error
+        mock_nonce_manager.commit_nonce.assert_awaited_once_with(sender.address, 7)
+        mock_nonce_manager.release_nonce.assert_awaited_once_with(sender.address, 8)
+        mock_transaction_repo.create_many.assert_awaited_once_with([results[0].transaction])
+
+    async def test_no_nonce_is_reserved_for_failed_estimates(self, arranged, sender, transaction_service: TransactionService, mock_nonce_manager: INonceManager, mock_blockchain_service: IBlockchainService):
+        """
+        Scenario: Transfers failing gas estimation get no nonce, so the others stay consecutive.
+        """
+        # Arrange
+        reverting = Account.create().address
+        transfers = [
+            Transfer(from_address=sender.address, to_address=reverting, asset="ETH", value=Decimal("1")),
+            Transfer(from_address=sender.address, to_address=Account.create().address, asset="ETH", value=Decimal("1")),
+        ]
+
+        async def estimate_gas(tx):
+            if tx["to"] == reverting:
+                raise Web3RPCError("execution reverted")
+            return 21000
+
+        mock_blockchain_service.estimate_gas.side_effect = estimate_gas
+        mock_blockchain_service.broadcast_transactions.return_value = ["0x_hash_0"]
+
+        # Act
+        results = await transaction_service.create_onchain_transactions(transfers)
+
+        # Assert
+        assert results[0].error == "execution reverted"
+        assert results[1].transaction.tx_hash == "0x_hash_0"
+        mock_nonce_manager.reserve_nonces.assert_awaited_once_with(sender.address, 1)
@@ -0,0 +1,84 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+from src.core.services import FeeOracle
+from src.core.enums import FeeTier
+from src.core.interfaces import IBlockchainService
+
+GWEI = 10**9
+
+
+@pytest.fixture
+def mock_blockchain_service() -> IBlockchainService:
+    service = AsyncMock(spec=IBlockchainService)
+    service.get_latest_block_number.return_value = 100
+    service.get_fee_history.return_value = {
+        "oldestBlock": 97,
+        # The last base fee is the one of the next block
+        "baseFeePerGas": [10 * GWEI, 11 * GWEI, 12 * GWEI, 13 * GWEI],
+        "reward": [
+            [1 * GWEI, 2 * GWEI, 5 * GWEI],
+            [0, 0, 0],  # Empty block
+            [1 * GWEI, 3 * GWEI, 6 * GWEI],
+        ],
+    }
+    return service
+
+
+@pytest.fixture
+def fee_oracle(mock_blockchain_service: IBlockchainService) -> FeeOracle:
+    return FeeOracle(mock_blockchain_service, block_count=3,
+                     tier_percentiles={"slow": 10, "normal": 50, "fast": 90},
+                     base_fee_multiplier=2, default_priority_fee=2 * GWEI)
+
+
+@pytest.mark.asyncio
+class TestFeeOracle:
+    """
+    Unit test suite for the fees derived from eth_feeHistory.
+    """
+
+    async def test_tiers_follow_reward_percentiles(self, fee_oracle: FeeOracle, mock_blockchain_service: IBlockchainService):
+        """
+        Tests that each tier pays the median reward of its percentile, ignoring empty blocks,
+        on top of twice the next base fee.
+        """
+        # Act
+        slow = await fee_oracle.get_fees(FeeTier.SLOW)
+        normal = await fee_oracle.get_fees(FeeTier.NORMAL)
+        fast = await fee_oracle.get_fees(FeeTier.FAST)
+
+        # Assert
+        mock_blockchain_service.get_fee_history.assert_awaited_once_with(3, [10.0, 50.0, 90.0])
+        assert slow == {"maxFeePerGas": 27 * GWEI, "maxPriorityFeePerGas": 1 * GWEI}
+        assert normal == {"maxFeePerGas": 28 * GWEI, "maxPriorityFeePerGas": 2 * GWEI}
+        assert fast == {"maxFeePerGas": 31 * GWEI, "maxPriorityFeePerGas": 5 * GWEI}
+
+    async def test_history_is_fetched_once_per_block(self, fee_oracle: FeeOracle, mock_blockchain_service: IBlockchainService):
+        """
+        Tests that concurrent and repeated calls within a block share one eth_feeHistory call.
+        """
+        # Act
+        await asyncio.gather(*(fee_oracle.get_fees() for _ in range(10)))
+        calls_in_first_block = mock_blockchain_service.get_fee_history.await_count
+        mock_blockchain_service.get_latest_block_number.return_value = 101
+        await fee_oracle.get_fees()
+
+        # Assert
+        assert calls_in_first_block == 1
+        assert mock_blockchain_service.get_fee_history.await_count == 2
+
+    async def test_falls_back_without_history(self, fee_oracle: FeeOracle, mock_blockchain_service: IBlockchainService):
+        """
+        Tests that a node returning no history gets the latest base fee and the default priority fee.
+        """
+        # Arrange
+        mock_blockchain_service.get_fee_history.return_value = {
+            "oldestBlock": 1, "baseFeePerGas": [], "reward": []}
+        mock_blockchain_service.get_base_fee.return_value = 20 * GWEI
+
+        # Act
+        fees = await fee_oracle.get_fees(FeeTier.FAST)
+
+        # Assert
+        assert fees == {"maxFeePerGas": 42 * GWEI, "maxPriorityFeePerGas": 2 * GWEI}
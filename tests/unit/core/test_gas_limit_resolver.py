@@ -0,0 +1,83 @@
+import pytest
+from unittest.mock import AsyncMock
+from src.core.services import GasLimitResolver
+from src.core.interfaces import IBlockchainService
+
+EOA = "0x" + "a" * 40
+CONTRACT = "0x" + "c" * 40
+TRANSFER_CALL = "0xa9059cbb" + "0" * 128
+
+
+@pytest.fixture
+def mock_blockchain_service() -> IBlockchainService:
+    service = AsyncMock(spec=IBlockchainService)
+    service.get_code.side_effect = lambda address: b"\x60\x80" if address == CONTRACT else b""
+    service.estimate_gas.return_value = 50_000
+    return service
+
+
+@pytest.fixture
+def resolver(mock_blockchain_service: IBlockchainService, clock) -> GasLimitResolver:
+    return GasLimitResolver(mock_blockchain_service, no_code_ttl=60,
+                            estimate_ttl=60, estimate_margin=1.2, clock=clock)
+
+
+@pytest.mark.asyncio
+class TestGasLimitResolver:
+    """
+    Unit test suite for the gas limits resolved without eth_estimateGas.
+    """
+
+    async def test_transfers_to_accounts_without_code_skip_estimation(self, resolver: GasLimitResolver, mock_blockchain_service: IBlockchainService):
+        """
+        Tests that value transfers to an EOA cost 21000 gas and one cached eth_getCode.
+        """
+        # Act
+        limits = [await resolver.resolve({"to": EOA, "value": 1}) for _ in range(3)]
+
+        # Assert
+        assert limits == [21000] * 3
+        mock_blockchain_service.get_code.assert_awaited_once_with(EOA)
+        mock_blockchain_service.estimate_gas.assert_not_awaited()
+
+    async def test_empty_account_is_checked_again_after_ttl(self, resolver: GasLimitResolver, mock_blockchain_service: IBlockchainService, clock):
+        """
+        Tests that an account without code is looked up again, as a contract may be deployed there.
+        """
+        # Arrange
+        await resolver.resolve({"to": EOA, "value": 1})
+        clock.now += 61
+
+        # Act
+        await resolver.resolve({"to": EOA, "value": 1})
+
+        # Assert
+        assert mock_blockchain_service.get_code.await_count == 2
+
+    async def test_contract_calls_reuse_the_estimate_per_selector(self, resolver: GasLimitResolver, mock_blockchain_service: IBlockchainService, clock):
+        """
+        Tests that calls with the same target and selector share one estimate, with the
+        same headroom on the first call and the reused ones, until it expires.
+        """
+        # Act
+        first = await resolver.resolve({"to": CONTRACT, "data": TRANSFER_CALL})
+        second = await resolver.resolve({"to": CONTRACT.upper().replace("0X", "0x"), "data": TRANSFER_CALL})
+        clock.now += 61
+        await resolver.resolve({"to": CONTRACT, "data": TRANSFER_CALL})
+
+        # Assert
+        assert first == 60_000
+        assert second == 60_000
+        assert mock_blockchain_service.estimate_gas.await_count == 2
+        mock_blockchain_service.get_code.assert_not_awaited()
+
+    async def test_value_transfers_to_contracts_are_estimated(self, resolver: GasLimitResolver, mock_blockchain_service: IBlockchainService):
+        """
+        Tests that a contract receiving ETH is estimated, since its fallback may run code.
+        """
+        # Act
+        limit = await resolver.resolve({"to": CONTRACT, "value": 1})
+
+        # Assert
+        assert limit == 60_000
+        mock_blockchain_service.estimate_gas.assert_awaited_once()
@@ -0,0 +1,122 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+from src.core.services import ManagedAddressIndex
+from src.core.services.managed_address_index import normalize_address
+from src.core.interfaces import IAddressRepository
+
+ADDRESS = "0x52908400098527886E0F7030069857D2E4169EE7"
+
+
+@pytest.fixture
+def mock_address_repo() -> IAddressRepository:
+    return AsyncMock(spec=IAddressRepository)
+
+
+@pytest.mark.asyncio
+class TestManagedAddressIndex:
+    """
+    Unit test suite for the ManagedAddressIndex.
+    """
+
+    async def test_membership_ignores_letter_case(self, mock_address_repo: IAddressRepository, scope):
+        """
+        Tests that an added address is managed in checksum, lower and upper case.
+        """
+        # Arrange
+        address_index = ManagedAddressIndex(scope(mock_address_repo))
+
+        # Act
+        address_index.add([ADDRESS])
+
+        # Assert
+        assert address_index.is_managed(ADDRESS)
+        assert address_index.is_managed(ADDRESS.lower())
+        assert address_index.is_managed("0x" + ADDRESS[2:].upper())
+        assert not address_index.is_managed("0x" + "1" * 40)
+
+    @pytest.mark.parametrize("address", ["", "0x1234", "not-an-address", "0x" + "zz" * 20, None])
+    async def test_invalid_addresses_are_not_managed(self, mock_address_repo: IAddressRepository, scope, address):
+        """
+        Tests that malformed values are neither stored nor reported as managed.
+        """
+        # Arrange
+        address_index = ManagedAddressIndex(scope(mock_address_repo))
+
+        # Act
+        address_index.add([address, ADDRESS])
+
+        # Assert
+        assert normalize_address(address) is None
+        assert not address_index.is_managed(address)
+        assert len(address_index) == 1
+
+    async def test_refresh_loads_pages_and_then_only_new_rows(self, mock_address_repo: IAddressRepository, scope):
+        """
+        Tests that the first refresh pages through the table and the next one
+        only reads the rows stored after the last id seen.
+        """
+        # Arrange
+        address_index = ManagedAddressIndex(scope(mock_address_repo), page_size=2)
+        mock_address_repo.oldest_unassigned_id.return_value = None
+        first, second, third, fourth = ("0x" + str(i) * 40 for i in range(1, 5))
+        mock_address_repo.list_public_addresses.side_effect = [
+            [(1, first), (2, second)],
+            [(3, third)],
+            [(7, fourth)],
+        ]
+
+        # Act
+        loaded_at_startup = await address_index.refresh()
+        loaded_later = await address_index.refresh()
+
+        # Assert
+        assert loaded_at_startup == 3
+        assert loaded_later == 1
+        assert [call.args for call in mock_address_repo.list_public_addresses.await_args_list] == [
+            (0, 2), (2, 2), (3, 2)]
+        assert all(address_index.is_managed(address) for address in (first, second, third, fourth))
+
+    async def test_rows_above_the_oldest_pooled_one_are_read_again(self, mock_address_repo: IAddressRepository, scope):
+        """
+        Tests that a pooled row assigned by another process after a refresh is
+        still picked up, though rows with higher ids were already read.
+        """
+        # Arrange
+        address_index = ManagedAddressIndex(scope(mock_address_repo), page_size=10)
+        first, pooled, third = ("0x" + str(i) * 40 for i in range(1, 4))
+        mock_address_repo.oldest_unassigned_id.side_effect = [2, None]
+        mock_address_repo.list_public_addresses.side_effect = [
+            [(1, first), (3, third)],
+            [(2, pooled), (3, third)],
+        ]
+
+        # Act
+        loaded_at_startup = await address_index.refresh()
+        loaded_later = await address_index.refresh()
+
+        # Assert
+        assert loaded_at_startup == 2
+        assert loaded_later == 1
+        assert [call.args for call in mock_address_repo.list_public_addresses.await_args_list] == [
+            (0, 10), (1, 10)]
+        assert address_index.is_managed(pooled)
+
+    async def test_background_task_refreshes_periodically(self, mock_address_repo: IAddressRepository, scope):
+        """
+        Tests that the started index picks up rows stored by other processes.
+        """
+        # Arrange
+        address_index = ManagedAddressIndex(scope(mock_address_repo), refresh_interval=0.01)
+        mock_address_repo.oldest_unassigned_id.return_value = None
+        mock_address_repo.list_public_addresses.return_value = []
+
+        # Act
+        address_index.start()
+        await asyncio.sleep(0.05)
+        mock_address_repo.list_public_addresses.return_value = [(1, ADDRESS)]
+        await asyncio.sleep(0.05)
+        await address_index.stop()
+
+        # Assert
+        assert address_index.is_managed(ADDRESS)
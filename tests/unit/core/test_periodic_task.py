@@ -0,0 +1,79 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+from src.core.periodic_task import PeriodicTask
+
+
+@pytest.mark.asyncio
+class TestPeriodicTask:
+    """
+    Unit test suite for the PeriodicTask shared by the background loops.
+    """
+
+    async def test_failed_step_does_not_stop_the_loop(self):
+        """
+        Tests that an error in one step is reported and the next step still runs.
+        """
+        # Arrange
+        step = AsyncMock(side_effect=[RuntimeError("node down"), None, None, None, None])
+        periodic = PeriodicTask(step, interval=0.01, error_message="TEST ERROR")
+
+        # Act
+        periodic.start()
+        await asyncio.sleep(0.05)
+        await periodic.stop()
+
+        # Assert
+        assert step.await_count >= 2
+
+    async def test_first_step_waits_one_interval_unless_run_first(self):
+        """
+        Tests that a task started with run_first=False only steps after the interval.
+        """
+        # Arrange
+        step = AsyncMock()
+        periodic = PeriodicTask(step, interval=60, error_message="TEST ERROR", run_first=False)
+
+        # Act
+        periodic.start()
+        await asyncio.sleep(0.01)
+        await periodic.stop()
+
+        # Assert
+        step.assert_not_awaited()
+
+    async def test_wake_runs_the_next_step_at_once(self):
+        """
+        Tests that a woken task does not wait for the end of the interval.
+        """
+        # Arrange
+        step = AsyncMock()
+        periodic = PeriodicTask(step, interval=60, error_message="TEST ERROR")
+        periodic.start()
+        await asyncio.sleep(0.01)
+
+        # Act
+        periodic.wake()
+        await asyncio.sleep(0.01)
+        await periodic.stop()
+
+        # Assert
+        assert step.await_count == 2
+
+    async def test_start_is_idempotent_and_stop_can_run_twice(self):
+        """
+        Tests that starting twice keeps a single loop and stopping twice is harmless.
+        """
+        # Arrange
+        step = AsyncMock()
+        periodic = PeriodicTask(step, interval=60, error_message="TEST ERROR")
+
+        # Act
+        periodic.start()
+        periodic.start()
+        await asyncio.sleep(0.01)
+        await periodic.stop()
+        await periodic.stop()
+
+        # Assert
+        step.assert_awaited_once()
@@ -1,7 +1,7 @@
 import pytest
 from decimal import Decimal
 from eth_account import Account
-from src.core.services import TransactionService
+from src.core.services import TransactionService, ManagedAddressIndex
 from src.core.entities.transaction import Transaction as TransactionEntity
 from src.core.entities.address import Address as AddressEntity
 from src.core.enums import TransactionStatus
@@ -9,6 +9,8 @@ from src.core.interfaces import (
     ITransactionRepository,
     IAddressRepository,
     IBlockchainService,
+    IEncryptionService,
+    INonceManager,
 )
 
 
@@ -22,13 +24,13 @@ class TestValidateOnchainTransaction:
         managed_address = Account.create().address
         sender_address = "0x" + "c" * 40
 
-        mock_blockchain_service.get_transaction_details.return_value = {
-            'hash': tx_hash, 'from': sender_address, 'to': managed_address, 'value': 10**18, 'input': '0x'
-        }
-        mock_blockchain_service.get_transaction_receipt.return_value = {
-            'status': 1, 'blockNumber': 100, 'gasUsed': 21000, 'effectiveGasPrice': 10**9
-        }
-        mock_blockchain_service.get_latest_block_number.return_value = 112
+        mock_blockchain_service.get_transaction_with_receipt.return_value = (
+            {'hash': tx_hash, 'from': sender_address,
+                'to': managed_address, 'value': 10**18, 'input': '0x'},
+            {'status': 1, 'blockNumber': 100,
+                'gasUsed': 21000, 'effectiveGasPrice': 10**9},
+            112
+        )
         mock_address_repo.find_by_public_address.return_value = AddressEntity(
             public_address=managed_address, encrypted_private_key="key")
 
@@ -89,11 +91,11 @@ class TestValidateOnchainTransaction:
         """
         # Arrange
         tx_hash = "0x_unconfirmed_tx"
-        mock_blockchain_service.get_transaction_details.return_value = {
-            'to': '0x' + 'd' * 40, 'value': 1}
-        mock_blockchain_service.get_transaction_receipt.return_value = {
-            'status': 1, 'blockNumber': 100}
-        mock_blockchain_service.get_latest_block_number.return_value = 105  # Only 6 confirmations
+        mock_blockchain_service.get_transaction_with_receipt.return_value = (
+            {'to': '0x' + 'd' * 40, 'value': 1},
+            {'status': 1, 'blockNumber': 100},
+            105  # Only 6 confirmations
+        )
 
         # Act
         result = await transaction_service.validate_onchain_transaction(tx_hash)
@@ -108,12 +110,13 @@ class TestValidateOnchainTransaction:
         # Arrange
         tx_hash = "0x_other_tx"
         # Provide a complete mock dictionary to avoid KeyError
-        mock_blockchain_service.get_transaction_details.return_value = {
-            'to': '0x' + 'e' * 40, 'value': 1, 'input': '0x', 'from': '0x' + 'f' * 40
-        }
-        mock_blockchain_service.get_transaction_receipt.return_value = {
-            'status': 1, 'blockNumber': 100, 'gasUsed': 21000, 'effectiveGasPrice': 10**9}
-        mock_blockchain_service.get_latest_block_number.return_value = 120
+        mock_blockchain_service.get_transaction_with_receipt.return_value = (
+            {'to': '0x' + 'e' * 40, 'value': 1,
+                'input': '0x', 'from': '0x' + 'f' * 40},
+            {'status': 1, 'blockNumber': 100,
+                'gasUsed': 21000, 'effectiveGasPrice': 10**9},
+            120
+        )
         mock_address_repo.find_by_public_address.return_value = None  # Address not found
 
         # Act
@@ -121,3 +124,54 @@ class TestValidateOnchainTransaction:
 
         # Assert
         assert result is None
+
+    async def test_validation_fetches_everything_in_one_batch(self, transaction_service: TransactionService, common_mocks, mock_blockchain_service: IBlockchainService, mock_transaction_repo: ITransactionRepository):
+        """
+        Tests that validation uses a single batched round trip instead of separate calls.
+        """
+        # Arrange
+        tx_hash, _ = common_mocks
+        mock_transaction_repo.find_by_hash.return_value = None
+
+        # Act
+        await transaction_service.validate_onchain_transaction(tx_hash)
+
+        # Assert
+        mock_blockchain_service.get_transaction_with_receipt.assert_awaited_once_with(
+            tx_hash)
+        mock_blockchain_service.get_transaction_details.assert_not_awaited()
+        mock_blockchain_service.get_transaction_receipt.assert_not_awaited()
+        mock_blockchain_service.get_latest_block_number.assert_not_awaited()
+        mock_blockchain_service.decode_contract_transaction.assert_not_awaited()
+
+    async def test_managed_destination_is_checked_in_the_address_index(self, common_mocks, mock_transaction_repo: ITransactionRepository, mock_address_repo: IAddressRepository, mock_blockchain_service: IBlockchainService, mock_encryption_service: IEncryptionService, mock_nonce_manager: INonceManager):
+        """
+        Tests that an address found in the index skips the database, while one
+        it does not know yet is looked up there, and added once found.
+        """
+        # Arrange
+        tx_hash, managed_address = common_mocks
+        address_index = ManagedAddressIndex(address_repo_factory=None)
+        service = TransactionService(
+            transaction_repo=mock_transaction_repo,
+            address_repo=mock_address_repo,
+            blockchain_service=mock_blockchain_service,
+            encryption_service=mock_encryption_service,
+            nonce_manager=mock_nonce_manager,
+            address_index=address_index
+        )
+        mock_transaction_repo.find_by_hash.return_value = None
+        mock_address_repo.find_by_public_address.side_effect = [
+            None, AddressEntity(public_address=managed_address, encrypted_private_key="key")]
+
+        # Act
+        unmanaged_result = await service.validate_onchain_transaction(tx_hash)
+        created_elsewhere_result = await service.validate_onchain_transaction(tx_hash)
+        indexed_result = await service.validate_onchain_transaction(tx_hash)
+
+        # Assert
+        assert unmanaged_result is None
+        assert created_elsewhere_result is not None
+        assert indexed_result is not None
+        assert mock_address_repo.find_by_public_address.await_count == 2
+        assert address_index.is_managed(managed_address)
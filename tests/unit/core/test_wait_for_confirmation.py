@@ -1,94 +1,90 @@
 import pytest
 from decimal import Decimal
-from web3.exceptions import TimeExhausted
-from src.core.services import TransactionService
+from src.core.services import ConfirmationScheduler
 from src.core.entities.transaction import Transaction as TransactionEntity
 from src.core.enums import TransactionStatus
 from src.core.interfaces import ITransactionRepository, IBlockchainService
-from src.core.constants import TRANSACTION_CONFIRMATION_TIMEOUT_SECONDS
+
+
+def pending_tx(tx_hash: str) -> TransactionEntity:
+    return TransactionEntity(
+        tx_hash=tx_hash, asset="ETH", from_address="0xFrom", to_address="0xTo",
+        value=Decimal("1"), status=TransactionStatus.PENDING, effective_cost=Decimal("0")
+    )
 
 
 @pytest.mark.asyncio
 class TestWaitForConfirmation:
     """
-    Test suite for the wait_for_confirmation background task method.
+    Test suite for waiting on the confirmation of a sent transaction, done by
+    the ConfirmationScheduler.
     """
 
-    async def test_wait_for_confirmation_success(self, transaction_service: TransactionService, mock_blockchain_service: IBlockchainService, mock_transaction_repo: ITransactionRepository):
+    async def test_wait_for_confirmation_success(self, scheduler: ConfirmationScheduler, mock_blockchain_service: IBlockchainService, mock_transaction_repo: ITransactionRepository):
         """
         Scenario: Tests that the transaction status is updated to CONFIRMED
         when a successful receipt is returned.
         """
         # Arrange
         tx_hash = "0x_confirmed_tx"
-
-        # Mock the blockchain service to return a successful receipt
-        mock_receipt = {'status': 1, 'gasUsed': 50000,
-                        'effectiveGasPrice': 20 * 10**9}
-        mock_blockchain_service.wait_for_transaction_receipt.return_value = mock_receipt
-
-        # Mock the repository to return a pending transaction that needs updating
-        pending_tx = TransactionEntity(
-            tx_hash=tx_hash, asset="ETH", from_address="0xFrom", to_address="0xTo",
-            value=Decimal("1"), status=TransactionStatus.PENDING, effective_cost=Decimal("0")
-        )
-        mock_transaction_repo.find_by_hash.return_value = pending_tx
+        scheduler.watch(pending_tx(tx_hash))
+        mock_blockchain_service.get_latest_block_number.return_value = 100
+        mock_blockchain_service.batch_call.return_value = [
+            {'status': 1, 'gasUsed': 50000, 'effectiveGasPrice': 20 * 10**9}]
 
         # Act
-        await transaction_service.wait_for_confirmation(tx_hash)
+        await scheduler.poll_once()
 
         # Assert
-        mock_blockchain_service.wait_for_transaction_receipt.assert_awaited_once_with(
-            tx_hash, timeout=TRANSACTION_CONFIRMATION_TIMEOUT_SECONDS)
-        mock_transaction_repo.find_by_hash.assert_awaited_once_with(tx_hash)
-
-        # Verify that the update method was called with the correct, updated entity
-        mock_transaction_repo.update.assert_awaited_once()
+        mock_blockchain_service.batch_call.assert_awaited_once_with(
+            [("eth_getTransactionReceipt", [tx_hash])])
 
-        updated_entity_arg = mock_transaction_repo.update.await_args[0][0]
+        # Verify that the update was called with the correct, updated entity
+        mock_transaction_repo.update_many.assert_awaited_once()
+        updated_entity_arg = mock_transaction_repo.update_many.await_args[0][0][0]
 
+        assert updated_entity_arg.tx_hash == tx_hash
         assert updated_entity_arg.status == TransactionStatus.CONFIRMED
         assert updated_entity_arg.effective_cost > 0
+        assert len(scheduler) == 0
 
-    async def test_wait_for_confirmation_failed_tx(self, transaction_service: TransactionService, mock_blockchain_service: IBlockchainService, mock_transaction_repo: ITransactionRepository):
+    async def test_wait_for_confirmation_failed_tx(self, scheduler: ConfirmationScheduler, mock_blockchain_service: IBlockchainService, mock_transaction_repo: ITransactionRepository):
         """
         Scenario: Tests that the transaction status is updated to FAILED
         when a failed receipt (status 0) is returned.
         """
         # Arrange
-        tx_hash = "0x_failed_tx"
-        mock_receipt = {'status': 0}  # Failed transaction
-        mock_blockchain_service.wait_for_transaction_receipt.return_value = mock_receipt
-
-        pending_tx = TransactionEntity(
-            tx_hash=tx_hash, asset="ETH", from_address="0xFrom", to_address="0xTo",
-            value=Decimal("1"), status=TransactionStatus.PENDING, effective_cost=Decimal("0")
-        )
-        mock_transaction_repo.find_by_hash.return_value = pending_tx
+        scheduler.watch(pending_tx("0x_failed_tx"))
+        mock_blockchain_service.get_latest_block_number.return_value = 100
+        mock_blockchain_service.batch_call.return_value = [{'status': 0}]  # Failed transaction
 
         # Act
-        await transaction_service.wait_for_confirmation(tx_hash)
+        await scheduler.poll_once()
 
         # Assert
-        mock_transaction_repo.update.assert_awaited_once()
-        updated_entity_arg = mock_transaction_repo.update.await_args[0][0]
+        mock_transaction_repo.update_many.assert_awaited_once()
+        updated_entity_arg = mock_transaction_repo.update_many.await_args[0][0][0]
 
         assert updated_entity_arg.status == TransactionStatus.FAILED
 
-    async def test_wait_for_confirmation_timeout(self, transaction_service: TransactionService, mock_blockchain_service: IBlockchainService, mock_transaction_repo: ITransactionRepository):
+    async def test_wait_for_confirmation_timeout(self, scheduler: ConfirmationScheduler, mock_blockchain_service: IBlockchainService, mock_transaction_repo: ITransactionRepository, clock):
         """
         Scenario: Tests that the transaction status is NOT updated
-        if the wait for receipt times out.
+        if no receipt arrives before the timeout.
         """
         # Arrange
-        tx_hash = "0x_timeout_tx"
-        # Configure the mock to simulate a timeout
-        mock_blockchain_service.wait_for_transaction_receipt.side_effect = TimeExhausted(
-            "Timeout")
+        scheduler.watch(pending_tx("0x_timeout_tx"))
+        mock_blockchain_service.get_latest_block_number.side_effect = [100, 101]
+        mock_blockchain_service.batch_call.return_value = [None]
 
         # Act
-        await transaction_service.wait_for_confirmation(tx_hash)
+        await scheduler.poll_once()
+        still_watched = len(scheduler)
+        clock.now += 301
+        await scheduler.poll_once()
 
         # Assert
         # The most important assertion is that the update method was NEVER called
-        mock_transaction_repo.update.assert_not_awaited()
+        mock_transaction_repo.update_many.assert_not_awaited()
+        assert still_watched == 1
+        assert len(scheduler) == 0
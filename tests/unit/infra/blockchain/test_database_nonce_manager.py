@@ -0,0 +1,161 @@
+import pytest
+from unittest.mock import AsyncMock
+from src.infra.blockchain.database_nonce_manager import DatabaseNonceManager
+from src.core.entities.address import Address as AddressEntity
+from src.core.interfaces import IAddressRepository, IBlockchainService, INonceRepository
+
+
+class InMemoryNonceRepository(INonceRepository):
+    """Shared counters, standing in for the database used by every worker."""
+
+    def __init__(self):
+        self.counters = {}
+        self.allocations = 0
+
+    async def get(self, address):
+        return self.counters.get(address)
+
+    async def initialize(self, address, nonce):
+        self.counters[address] = max(self.counters.get(address, nonce), nonce)
+
+    async def allocate(self, address, count=1):
+        self.allocations += 1
+        start = self.counters[address]
+        self.counters[address] = start + count
+        return start
+
+    async def advance_to(self, address, nonce):
+        self.counters[address] = max(self.counters[address], nonce)
+
+    async def give_back(self, address, start, end):
+        if self.counters[address] != end:
+            return False
+        self.counters[address] = start
+        return True
+
+
+@pytest.fixture
+def nonce_repo() -> InMemoryNonceRepository:
+    return InMemoryNonceRepository()
+
+
+@pytest.fixture
+def mock_address_repo() -> IAddressRepository:
+    repo = AsyncMock(spec=IAddressRepository)
+    repo.find_by_public_address.side_effect = lambda address: AddressEntity(
+        public_address=address, encrypted_private_key="key")
+    return repo
+
+
+@pytest.fixture
+def mock_blockchain_service() -> IBlockchainService:
+    service = AsyncMock(spec=IBlockchainService)
+    service.get_transaction_count.return_value = 5
+    return service
+
+
+@pytest.fixture
+def make_worker(nonce_repo, mock_address_repo, mock_blockchain_service, clock, scope):
+    def make(lease_size: int = 1) -> DatabaseNonceManager:
+        return DatabaseNonceManager(
+            scope(mock_address_repo), scope(nonce_repo), mock_blockchain_service,
+            lease_size=lease_size, lease_ttl=5, clock=clock)
+    return make
+
+
+@pytest.mark.asyncio
+class TestDatabaseNonceManager:
+    """
+    Unit test suite for the nonce manager shared by several workers.
+    """
+
+    async def test_workers_share_one_sequence(self, make_worker, nonce_repo: InMemoryNonceRepository):
+        """
+        Tests that nonces handed out by different workers never collide.
+        """
+        # Arrange
+        worker1, worker2 = make_worker(), make_worker()
+
+        # Act
+        nonces = [
+            await worker1.get_next_nonce("0xAddr1"),
+            await worker2.get_next_nonce("0xAddr1"),
+            await worker1.get_next_nonce("0xAddr1"),
+        ]
+
+        # Assert
+        assert nonces == [5, 6, 7]
+        assert nonce_repo.counters["0xAddr1"] == 8
+
+    async def test_lease_is_served_from_memory(self, make_worker, nonce_repo: InMemoryNonceRepository):
+        """
+        Tests that a lease costs one database allocation for several nonces.
+        """
+        # Arrange
+        worker = make_worker(lease_size=3)
+
+        # Act
+        nonces = [await worker.get_next_nonce("0xAddr1") for _ in range(4)]
+
+        # Assert
+        assert nonces == [5, 6, 7, 8]
+        assert nonce_repo.allocations == 2
+
+    async def test_expired_lease_is_given_back(self, make_worker, nonce_repo: InMemoryNonceRepository, clock):
+        """
+        Tests that an idle lease is returned to the shared counter so other workers
+        are not held back by it.
+        """
+        # Arrange
+        worker1, worker2 = make_worker(lease_size=5), make_worker()
+        await worker1.get_next_nonce("0xAddr1")
+        clock.now += 10
+
+        # Act
+        await worker1.repair_nonces()
+
+        # Assert
+        assert nonce_repo.counters["0xAddr1"] == 6
+        assert await worker2.get_next_nonce("0xAddr1") == 6
+
+    async def test_unused_lease_is_given_back_on_stop(self, make_worker, nonce_repo: InMemoryNonceRepository):
+        """
+        Tests that stopping a worker returns the unused part of its lease.
+        """
+        # Arrange
+        worker = make_worker(lease_size=10)
+        await worker.get_next_nonce("0xAddr1")
+
+        # Act
+        await worker.stop()
+
+        # Assert
+        assert nonce_repo.counters["0xAddr1"] == 6
+
+    async def test_gap_is_only_refilled_by_its_owner(self, make_worker, mock_blockchain_service: IBlockchainService):
+        """
+        Tests that a worker does not reuse a missing nonce allocated by another worker.
+        """
+        # Arrange
+        worker1, worker2 = make_worker(), make_worker()
+        await worker1.get_next_nonce("0xAddr1")
+        await worker2.get_next_nonce("0xAddr1")
+        # Nonce 5 from worker1 never reached the mempool
+        mock_blockchain_service.get_transaction_count.return_value = 5
+
+        # Act
+        for _ in range(2):
+            await worker1.repair_nonces()
+            await worker2.repair_nonces()
+
+        # Assert
+        assert worker2._released["0xAddr1"] == []
+        assert await worker1.reserve_nonce("0xAddr1") == 5
+
+    async def test_rejects_empty_lease(self, make_worker):
+        """
+        Tests that a lease must hold at least one nonce.
+        """
+        # Act & Assert
+        with pytest.raises(ValueError, match="Nonce lease size must be at least 1."):
+            make_worker(lease_size=0)
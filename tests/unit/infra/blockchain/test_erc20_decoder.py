@@ -0,0 +1,101 @@
+import json
+import pytest
+from eth_abi import encode as abi_encode
+from eth_account import Account
+from web3 import Web3
+from src.infra.blockchain.erc20_decoder import SelectorDecoder
+
+with open("src/infra/blockchain/erc20_abi.json") as f:
+    ERC20_ABI = json.load(f)
+
+TRANSFER_SELECTOR = bytes.fromhex("a9059cbb")
+TRANSFER_FROM_SELECTOR = bytes.fromhex("23b872dd")
+APPROVE_SELECTOR = bytes.fromhex("095ea7b3")
+BALANCE_OF_SELECTOR = bytes.fromhex("70a08231")
+
+
+@pytest.fixture(scope="module")
+def decoder() -> SelectorDecoder:
+    return SelectorDecoder(ERC20_ABI)
+
+
+class TestSelectorDecoder:
+    """
+    Unit test suite for the selector-indexed ERC-20 calldata decoder.
+    """
+
+    def test_table_contains_erc20_selectors(self, decoder: SelectorDecoder):
+        """Tests that the standard ERC-20 selectors are precompiled."""
+        # Assert
+        assert TRANSFER_SELECTOR in decoder
+        assert TRANSFER_FROM_SELECTOR in decoder
+        assert APPROVE_SELECTOR in decoder
+
+    def test_decode_transfer(self, decoder: SelectorDecoder):
+        """Tests decoding a transfer call from hex calldata."""
+        # Arrange
+        recipient = Account.create().address
+        calldata = "0x" + (TRANSFER_SELECTOR +
+                           abi_encode(["address", "uint256"], [recipient, 10**18])).hex()
+
+        # Act
+        decoded = decoder.decode(calldata)
+
+        # Assert
+        assert decoded == {"function": "transfer",
+                           "params": {"_to": recipient, "_value": 10**18}}
+
+    def test_decode_transfer_from(self, decoder: SelectorDecoder):
+        """Tests decoding a transferFrom call from raw bytes."""
+        # Arrange
+        owner = Account.create().address
+        recipient = Account.create().address
+        calldata = TRANSFER_FROM_SELECTOR + \
+            abi_encode(["address", "address", "uint256"], [owner, recipient, 5])
+
+        # Act
+        decoded = decoder.decode(calldata)
+
+        # Assert
+        assert decoded["function"] == "transferFrom"
+        assert decoded["params"] == {
+            "_from": owner, "_to": recipient, "_value": 5}
+
+    def test_decode_approve(self, decoder: SelectorDecoder):
+        """Tests decoding an approve call."""
+        # Arrange
+        spender = Account.create().address
+        calldata = APPROVE_SELECTOR + \
+            abi_encode(["address", "uint256"], [spender, 2**256 - 1])
+
+        # Act
+        decoded = decoder.decode(calldata)
+
+        # Assert
+        assert decoded["function"] == "approve"
+        assert decoded["params"]["_spender"] == Web3.to_checksum_address(
+            spender)
+        assert decoded["params"]["_value"] == 2**256 - 1
+
+    def test_decode_unknown_selector_returns_none(self, decoder: SelectorDecoder):
+        """Tests that calldata for a function outside the ABI is not decoded."""
+        # Act & Assert
+        assert decoder.decode("0xdeadbeef" + "00" * 64) is None
+
+    def test_decode_short_calldata_raises(self, decoder: SelectorDecoder):
+        """Tests that truncated calldata raises ValueError instead of returning garbage."""
+        # Arrange
+        calldata = TRANSFER_SELECTOR + b"\x00" * 40
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Calldata too short for transfer"):
+            decoder.decode(calldata)
+
+    def test_decode_dirty_address_padding_raises(self, decoder: SelectorDecoder):
+        """Tests that an address word with non-zero padding is rejected."""
+        # Arrange
+        calldata = BALANCE_OF_SELECTOR + b"\x01" * 32
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Invalid address padding"):
+            decoder.decode(calldata)
@@ -0,0 +1,96 @@
+import pytest
+from unittest.mock import AsyncMock
+from src.infra.blockchain.head_tracker import BlockHeadTracker
+
+
+@pytest.fixture
+def fetch_block_number() -> AsyncMock:
+    return AsyncMock(return_value=100)
+
+
+@pytest.fixture
+def fetch_latest_block() -> AsyncMock:
+    return AsyncMock(return_value={"number": 100, "baseFeePerGas": 7 * 10**9, "timestamp": 1700000000})
+
+
+@pytest.fixture
+def tracker(fetch_block_number, fetch_latest_block, clock) -> BlockHeadTracker:
+    return BlockHeadTracker(
+        fetch_block_number=fetch_block_number,
+        fetch_latest_block=fetch_latest_block,
+        poll_interval=2,
+        max_staleness=12,
+        clock=clock,
+    )
+
+
+@pytest.mark.asyncio
+class TestBlockHeadTracker:
+    """
+    Unit test suite for the in-memory BlockHeadTracker.
+    """
+
+    async def test_no_head_before_first_poll(self, tracker: BlockHeadTracker):
+        """Tests that nothing is served from memory before the first refresh."""
+        # Assert
+        assert tracker.get_fresh_head() is None
+
+    async def test_poll_stores_number_base_fee_and_timestamp(self, tracker: BlockHeadTracker):
+        """Tests that a poll on a new block stores its head data."""
+        # Act
+        await tracker.poll_once()
+        head = tracker.get_fresh_head()
+
+        # Assert
+        assert head.number == 100
+        assert head.base_fee == 7 * 10**9
+        assert head.timestamp == 1700000000
+
+    async def test_full_block_is_fetched_once_per_block(self, tracker: BlockHeadTracker, fetch_block_number: AsyncMock, fetch_latest_block: AsyncMock):
+        """Tests that polling the same block only calls the cheap block number RPC."""
+        # Act
+        await tracker.poll_once()
+        await tracker.poll_once()
+        await tracker.poll_once()
+
+        # Assert
+        assert fetch_block_number.await_count == 3
+        fetch_latest_block.assert_awaited_once()
+
+        # Act
+        fetch_block_number.return_value = 101
+        fetch_latest_block.return_value = {
+            "number": 101, "baseFeePerGas": 8 * 10**9, "timestamp": 1700000012}
+        await tracker.poll_once()
+
+        # Assert
+        assert fetch_latest_block.await_count == 2
+        assert tracker.get_fresh_head().base_fee == 8 * 10**9
+
+    async def test_stale_head_is_not_served(self, tracker: BlockHeadTracker, clock):
+        """Tests the configurable staleness bound."""
+        # Arrange
+        await tracker.poll_once()
+
+        # Act
+        clock.now += 12
+        fresh_head = tracker.get_fresh_head()
+        clock.now += 1
+        stale_head = tracker.get_fresh_head()
+
+        # Assert
+        assert fresh_head is not None
+        assert stale_head is None
+
+    async def test_same_block_poll_refreshes_observation_time(self, tracker: BlockHeadTracker, clock):
+        """Tests that confirming the same head keeps it fresh."""
+        # Arrange
+        await tracker.poll_once()
+        clock.now += 10
+
+        # Act
+        await tracker.poll_once()
+        clock.now += 10
+
+        # Assert
+        assert tracker.get_fresh_head() is not None
@@ -3,7 +3,7 @@ import asyncio
 from unittest.mock import AsyncMock
 from src.infra.blockchain.nonce_manager import NonceManager
 from src.core.entities.address import Address as AddressEntity
-from src.core.interfaces import IAddressRepository, IBlockchainService
+from src.core.interfaces import IAddressRepository, IBlockchainService, INonceCheckpointRepository
 
 
 @pytest.fixture
@@ -23,7 +23,7 @@ class TestNonceManager:
     """
 
     async def test_initialize_nonces_successfully(
-        self, mock_address_repo: IAddressRepository, mock_blockchain_service: IBlockchainService
+        self, mock_address_repo: IAddressRepository, mock_blockchain_service: IBlockchainService, scope
     ):
         """
         Tests that the manager correctly fetches and stores initial nonces on startup.
@@ -42,7 +42,7 @@ class TestNonceManager:
             INITIAL_NONCE_ADDR1, INITIAL_NONCE_ADDR2
         ]
 
-        manager = NonceManager(mock_address_repo, mock_blockchain_service)
+        manager = NonceManager(scope(mock_address_repo), mock_blockchain_service)
 
         # Act
         await manager.initialize_nonces()
@@ -53,7 +53,7 @@ class TestNonceManager:
         assert mock_blockchain_service.get_transaction_count.call_count == 2
 
     async def test_get_next_nonce_returns_sequential_values(
-        self, mock_address_repo: IAddressRepository, mock_blockchain_service: IBlockchainService
+        self, mock_address_repo: IAddressRepository, mock_blockchain_service: IBlockchainService, scope
     ):
         """
         Tests that sequential calls for the same address return incrementing nonces.
@@ -64,7 +64,7 @@ class TestNonceManager:
         mock_address_repo.get_all.return_value = [address1]
         mock_blockchain_service.get_transaction_count.return_value = 5
 
-        manager = NonceManager(mock_address_repo, mock_blockchain_service)
+        manager = NonceManager(scope(mock_address_repo), mock_blockchain_service)
 
         await manager.initialize_nonces()
 
@@ -82,7 +82,7 @@ class TestNonceManager:
         assert manager._nonces["0xAddr1"] == 8
 
     async def test_get_next_nonce_is_async_safe(
-        self, mock_address_repo: IAddressRepository, mock_blockchain_service: IBlockchainService
+        self, mock_address_repo: IAddressRepository, mock_blockchain_service: IBlockchainService, scope
     ):
         """
         Tests that concurrent calls to get_next_nonce return unique, sequential nonces.
@@ -94,7 +94,7 @@ class TestNonceManager:
         mock_address_repo.get_all.return_value = [address1]
         mock_blockchain_service.get_transaction_count.return_value = 100
 
-        manager = NonceManager(mock_address_repo, mock_blockchain_service)
+        manager = NonceManager(scope(mock_address_repo), mock_blockchain_service)
 
         await manager.initialize_nonces()
 
@@ -118,7 +118,7 @@ class TestNonceManager:
         assert manager._nonces["0xAddr1"] == 150
 
     async def test_get_next_nonce_raises_error_for_unmanaged_address(
-        self, mock_address_repo: IAddressRepository, mock_blockchain_service: IBlockchainService
+        self, mock_address_repo: IAddressRepository, mock_blockchain_service: IBlockchainService, scope
     ):
         """
         Tests that a ValueError is raised if a nonce is requested for an address
@@ -126,10 +126,363 @@ class TestNonceManager:
         """
         # Arrange
         mock_address_repo.get_all.return_value = []  # No addresses initialized
-        manager = NonceManager(mock_address_repo, mock_blockchain_service)
+        mock_address_repo.find_by_public_address.return_value = None
+        manager = NonceManager(scope(mock_address_repo), mock_blockchain_service)
 
         await manager.initialize_nonces()
 
         # Act & Assert
         with pytest.raises(ValueError, match="Nonce for address 0xUnknownAddress is not managed"):
             await manager.get_next_nonce("0xUnknownAddress")
+
+    async def test_nonce_is_initialized_lazily_on_first_use(
+        self, mock_address_repo: IAddressRepository, mock_blockchain_service: IBlockchainService, scope
+    ):
+        """
+        Tests that an address created after startup gets its nonce from the chain on first use.
+        """
+        # Arrange
+        mock_address_repo.find_by_public_address.return_value = AddressEntity(
+            public_address="0xNewAddr", encrypted_private_key="key")
+        mock_blockchain_service.get_transaction_count.return_value = 3
+        manager = NonceManager(scope(mock_address_repo), mock_blockchain_service)
+
+        # Act
+        nonces = await asyncio.gather(*(manager.get_next_nonce("0xNewAddr") for _ in range(5)))
+
+        # Assert
+        assert sorted(nonces) == [3, 4, 5, 6, 7]
+        mock_address_repo.get_all.assert_not_awaited()
+        mock_address_repo.find_by_public_address.assert_awaited_with("0xNewAddr")
+
+    async def test_warm_up_runs_with_bounded_concurrency(
+        self, mock_address_repo: IAddressRepository, mock_blockchain_service: IBlockchainService, scope
+    ):
+        """
+        Tests that the optional warm-up never has more RPC calls in flight than allowed.
+        """
+        # Arrange
+        mock_address_repo.get_all.return_value = [
+            AddressEntity(public_address=f"0xAddr{i}", encrypted_private_key="key") for i in range(20)
+        ]
+        in_flight, max_in_flight = 0, 0
+
+        async def get_transaction_count(address):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return int(address[len("0xAddr"):])
+
+        mock_blockchain_service.get_transaction_count.side_effect = get_transaction_count
+        manager = NonceManager(scope(mock_address_repo),
+                               mock_blockchain_service, warm_up_concurrency=4)
+
+        # Act
+        await manager.initialize_nonces()
+
+        # Assert
+        assert max_in_flight == 4
+        assert manager._nonces == {f"0xAddr{i}": i for i in range(20)}
+
+    async def test_warm_up_does_not_overwrite_a_used_nonce(
+        self, mock_address_repo: IAddressRepository, mock_blockchain_service: IBlockchainService, scope
+    ):
+        """
+        Tests that a nonce already handed out is not reset by a warm-up running concurrently.
+        """
+        # Arrange
+        address = AddressEntity(public_address="0xAddr1", encrypted_private_key="key1")
+        mock_address_repo.get_all.return_value = [address]
+        mock_address_repo.find_by_public_address.return_value = address
+        mock_blockchain_service.get_transaction_count.return_value = 7
+        manager = NonceManager(scope(mock_address_repo), mock_blockchain_service)
+        await manager.get_next_nonce("0xAddr1")
+
+        # Act
+        await manager.initialize_nonces()
+
+        # Assert
+        assert await manager.get_next_nonce("0xAddr1") == 8
+
+    async def test_slow_address_does_not_block_other_senders(
+        self, mock_address_repo: IAddressRepository, mock_blockchain_service: IBlockchainService, scope
+    ):
+        """
+        Tests that a slow first-use RPC call for one address leaves other addresses unblocked.
+        """
+        # Arrange
+        mock_address_repo.find_by_public_address.side_effect = lambda address: AddressEntity(
+            public_address=address, encrypted_private_key="key")
+        release_slow = asyncio.Event()
+
+        async def get_transaction_count(address):
+            if address == "0xSlow":
+                await release_slow.wait()
+            return 1
+
+        mock_blockchain_service.get_transaction_count.side_effect = get_transaction_count
+        manager = NonceManager(scope(mock_address_repo), mock_blockchain_service)
+        slow = asyncio.ensure_future(manager.get_next_nonce("0xSlow"))
+        await asyncio.sleep(0)
+
+        # Act
+        fast_nonce = await asyncio.wait_for(manager.get_next_nonce("0xFast"), timeout=1)
+
+        # Assert
+        assert fast_nonce == 1
+        assert not slow.done()
+        release_slow.set()
+        assert await slow == 1
+
+    async def test_released_nonce_is_reused_first(
+        self, mock_address_repo: IAddressRepository, mock_blockchain_service: IBlockchainService, scope
+    ):
+        """
+        Tests that a nonce released by a failed attempt is handed out before a new one.
+        """
+        # Arrange
+        mock_address_repo.find_by_public_address.return_value = AddressEntity(
+            public_address="0xAddr1", encrypted_private_key="key1")
+        mock_blockchain_service.get_transaction_count.return_value = 5
+        manager = NonceManager(scope(mock_address_repo), mock_blockchain_service)
+        failed, sent = await manager.reserve_nonce("0xAddr1"), await manager.reserve_nonce("0xAddr1")
+        await manager.commit_nonce("0xAddr1", sent)
+
+        # Act
+        await manager.release_nonce("0xAddr1", failed)
+        reused = await manager.reserve_nonce("0xAddr1")
+        fresh = await manager.reserve_nonce("0xAddr1")
+
+        # Assert
+        assert (failed, sent, reused, fresh) == (5, 6, 5, 7)
+
+    async def test_releasing_the_last_nonce_gives_it_back(
+        self, mock_address_repo: IAddressRepository, mock_blockchain_service: IBlockchainService, scope
+    ):
+        """
+        Tests that releasing the highest nonce rolls the counter back, and that a
+        nonce which is not reserved cannot be released.
+        """
+        # Arrange
+        mock_address_repo.find_by_public_address.return_value = AddressEntity(
+            public_address="0xAddr1", encrypted_private_key="key1")
+        mock_blockchain_service.get_transaction_count.return_value = 5
+        manager = NonceManager(scope(mock_address_repo), mock_blockchain_service)
+        committed = await manager.get_next_nonce("0xAddr1")
+        reserved = await manager.reserve_nonce("0xAddr1")
+
+        # Act
+        await manager.release_nonce("0xAddr1", reserved)
+        await manager.release_nonce("0xAddr1", committed)
+
+        # Assert
+        assert manager._nonces["0xAddr1"] == 6
+        assert manager._released["0xAddr1"] == []
+
+    async def test_repair_follows_transactions_sent_elsewhere(
+        self, mock_address_repo: IAddressRepository, mock_blockchain_service: IBlockchainService, scope
+    ):
+        """
+        Tests that the repair moves the nonce forward when the node has more pending
+        transactions than this service sent, dropping released nonces already used.
+        """
+        # Arrange
+        mock_address_repo.find_by_public_address.return_value = AddressEntity(
+            public_address="0xAddr1", encrypted_private_key="key1")
+        mock_blockchain_service.get_transaction_count.return_value = 5
+        manager = NonceManager(scope(mock_address_repo), mock_blockchain_service)
+        released = await manager.reserve_nonce("0xAddr1")
+        await manager.get_next_nonce("0xAddr1")
+        await manager.release_nonce("0xAddr1", released)
+        mock_blockchain_service.get_transaction_count.return_value = 9
+
+        # Act
+        await manager.repair_nonces()
+
+        # Assert
+        mock_blockchain_service.get_transaction_count.assert_awaited_with("0xAddr1", "pending")
+        assert await manager.reserve_nonce("0xAddr1") == 9
+
+    async def test_repair_refills_a_gap_seen_on_two_passes(
+        self, mock_address_repo: IAddressRepository, mock_blockchain_service: IBlockchainService, scope
+    ):
+        """
+        Tests that a committed nonce missing from the node is reused, but only once the
+        gap was seen on two consecutive passes and no transaction is in flight.
+        """
+        # Arrange
+        mock_address_repo.find_by_public_address.return_value = AddressEntity(
+            public_address="0xAddr1", encrypted_private_key="key1")
+        mock_blockchain_service.get_transaction_count.return_value = 5
+        manager = NonceManager(scope(mock_address_repo), mock_blockchain_service)
+        for _ in range(3):
+            await manager.get_next_nonce("0xAddr1")
+        # Nonce 6 never reached the mempool, 7 is stuck behind it
+        mock_blockchain_service.get_transaction_count.return_value = 6
+
+        # Act
+        await manager.repair_nonces()
+        after_first_pass = list(manager._released["0xAddr1"])
+        await manager.repair_nonces()
+
+        # Assert
+        assert after_first_pass == []
+        assert await manager.reserve_nonce("0xAddr1") == 6
+        assert await manager.reserve_nonce("0xAddr1") == 8
+
+    async def test_repair_ignores_gaps_while_a_nonce_is_reserved(
+        self, mock_address_repo: IAddressRepository, mock_blockchain_service: IBlockchainService, scope
+    ):
+        """
+        Tests that a transaction still being sent is not mistaken for a gap.
+        """
+        # Arrange
+        mock_address_repo.find_by_public_address.return_value = AddressEntity(
+            public_address="0xAddr1", encrypted_private_key="key1")
+        mock_blockchain_service.get_transaction_count.return_value = 5
+        manager = NonceManager(scope(mock_address_repo), mock_blockchain_service)
+        await manager.reserve_nonce("0xAddr1")
+
+        # Act
+        await manager.repair_nonces()
+        await manager.repair_nonces()
+
+        # Assert
+        assert manager._released["0xAddr1"] == []
+        assert manager._nonces["0xAddr1"] == 6
+
+    async def test_repair_skips_idle_addresses(
+        self, mock_address_repo: IAddressRepository, mock_blockchain_service: IBlockchainService, scope
+    ):
+        """
+        Tests that warmed-up addresses nobody sends from cost no RPC call on a repair
+        pass, and an address is checked again once it is used.
+        """
+        # Arrange
+        mock_address_repo.get_all.return_value = [
+            AddressEntity(public_address=f"0xAddr{i}", encrypted_private_key="key") for i in range(50)]
+        mock_blockchain_service.get_transaction_count.return_value = 5
+        manager = NonceManager(scope(mock_address_repo), mock_blockchain_service)
+        await manager.initialize_nonces()
+        await manager.get_next_nonce("0xAddr1")
+        mock_blockchain_service.get_transaction_count.reset_mock()
+        mock_blockchain_service.get_transaction_count.return_value = 6
+
+        # Act
+        await manager.repair_nonces()
+        checked_after_use = mock_blockchain_service.get_transaction_count.await_count
+        await manager.repair_nonces()
+
+        # Assert
+        assert checked_after_use == 1
+        mock_blockchain_service.get_transaction_count.assert_awaited_once_with("0xAddr1", "pending")
+
+    async def test_repair_drops_abandoned_reservations(
+        self, mock_address_repo: IAddressRepository, mock_blockchain_service: IBlockchainService, clock, scope
+    ):
+        """
+        Tests that a reservation dropped without commit or release stops holding
+        the repair back once it is older than the reservation TTL.
+        """
+        # Arrange
+        mock_address_repo.find_by_public_address.return_value = AddressEntity(
+            public_address="0xAddr1", encrypted_private_key="key1")
+        mock_blockchain_service.get_transaction_count.return_value = 0
+        manager = NonceManager(scope(mock_address_repo), mock_blockchain_service,
+                               reservation_ttl=60, clock=clock)
+        await manager.reserve_nonce("0xAddr1")  # Dropped by a cancelled request
+        await manager.commit_nonce("0xAddr1", await manager.reserve_nonce("0xAddr1"))
+
+        # Act
+        for _ in range(2):
+            await manager.repair_nonces()
+        released_while_fresh = list(manager._released["0xAddr1"])
+        clock.now += 61
+        for _ in range(2):
+            await manager.repair_nonces()
+
+        # Assert
+        assert released_while_fresh == []
+        assert manager._reserved["0xAddr1"] == {}
+        assert await manager.reserve_nonce("0xAddr1") == 0
+
+    async def test_checkpoints_are_written_in_batches(
+        self, mock_address_repo: IAddressRepository, mock_blockchain_service: IBlockchainService, scope
+    ):
+        """
+        Tests that many allocations end up in one write with the latest nonce per address.
+        """
+        # Arrange
+        mock_address_repo.find_by_public_address.side_effect = lambda address: AddressEntity(
+            public_address=address, encrypted_private_key="key")
+        mock_blockchain_service.get_transaction_count.return_value = 5
+        checkpoint_repo = AsyncMock(spec=INonceCheckpointRepository)
+        manager = NonceManager(scope(mock_address_repo), mock_blockchain_service,
+                               checkpoint_repo_factory=scope(checkpoint_repo))
+
+        # Act
+        for _ in range(3):
+            await manager.get_next_nonce("0xAddr1")
+        await manager.get_next_nonce("0xAddr2")
+        await manager.flush_checkpoints()
+        await manager.flush_checkpoints()
+
+        # Assert
+        checkpoint_repo.save_many.assert_awaited_once_with({"0xAddr1": 8, "0xAddr2": 6})
+
+    async def test_failed_flush_is_retried(
+        self, mock_address_repo: IAddressRepository, mock_blockchain_service: IBlockchainService, scope
+    ):
+        """
+        Tests that checkpoints are kept for the next flush if the write fails.
+        """
+        # Arrange
+        mock_address_repo.find_by_public_address.return_value = AddressEntity(
+            public_address="0xAddr1", encrypted_private_key="key1")
+        mock_blockchain_service.get_transaction_count.return_value = 5
+        checkpoint_repo = AsyncMock(spec=INonceCheckpointRepository)
+        checkpoint_repo.save_many.side_effect = [ConnectionError("database is down"), None]
+        manager = NonceManager(scope(mock_address_repo), mock_blockchain_service,
+                               checkpoint_repo_factory=scope(checkpoint_repo))
+        await manager.get_next_nonce("0xAddr1")
+
+        # Act
+        with pytest.raises(ConnectionError):
+            await manager.flush_checkpoints()
+        await manager.get_next_nonce("0xAddr1")
+        await manager.flush_checkpoints()
+
+        # Assert
+        checkpoint_repo.save_many.assert_awaited_with({"0xAddr1": 7})
+
+    async def test_checkpoint_is_checked_against_the_chain_on_first_use(
+        self, mock_address_repo: IAddressRepository, mock_blockchain_service: IBlockchainService, scope
+    ):
+        """
+        Tests that restart costs one query, and that each stored nonce is only compared
+        with the node's pending count when its address is used.
+        """
+        # Arrange
+        mock_address_repo.find_by_public_address.side_effect = lambda address: AddressEntity(
+            public_address=address, encrypted_private_key="key")
+        checkpoint_repo = AsyncMock(spec=INonceCheckpointRepository)
+        checkpoint_repo.get_all.return_value = {"0xAhead": 12, "0xBehind": 3}
+        # Transactions of 0xAhead are still pending, 0xBehind was used elsewhere since
+        mock_blockchain_service.get_transaction_count.side_effect = lambda address, block: {
+            "0xAhead": 10, "0xBehind": 4}[address]
+        manager = NonceManager(scope(mock_address_repo), mock_blockchain_service,
+                               checkpoint_repo_factory=scope(checkpoint_repo))
+
+        # Act
+        loaded = await manager.load_checkpoints()
+        rpc_calls_after_load = mock_blockchain_service.get_transaction_count.await_count
+        ahead = await manager.get_next_nonce("0xAhead")
+        behind = await manager.get_next_nonce("0xBehind")
+
+        # Assert
+        assert loaded == 2
+        assert rpc_calls_after_load == 0
+        assert (ahead, behind) == (12, 4)
+        mock_blockchain_service.get_transaction_count.assert_awaited_with("0xBehind", "pending")
@@ -0,0 +1,178 @@
+import asyncio
+import time
+import pytest
+from src.infra.blockchain.rate_limiter import (
+    PriorityRateLimiter, RpcPriority, TokenBucket, rpc_priority, use_rpc_priority
+)
+
+
+def make_limiter(total=(100, 2), broadcast=(100, 10), user_read=(100, 10), background=(100, 10)) -> PriorityRateLimiter:
+    return PriorityRateLimiter(
+        total=total,
+        budgets={
+            RpcPriority.BROADCAST: broadcast,
+            RpcPriority.USER_READ: user_read,
+            RpcPriority.BACKGROUND: background,
+        },
+        min_wait=0.001,
+    )
+
+
+@pytest.mark.asyncio
+class TestTokenBucket:
+    """
+    Unit tests for the token bucket.
+    """
+
+    async def test_refills_at_the_configured_rate(self, clock):
+        """Tests that tokens are consumed and refilled over time up to the burst."""
+        # Arrange
+        bucket = TokenBucket(rate=10, burst=5, clock=clock)
+
+        # Act
+        bucket.take(5)
+        empty_wait = bucket.wait_time(1)
+        clock.now += 0.3
+        refilled = bucket.available()
+        clock.now += 60
+
+        # Assert
+        assert empty_wait == pytest.approx(0.1)
+        assert refilled == pytest.approx(3)
+        assert bucket.available() == 5
+
+    async def test_rejects_invalid_budget(self):
+        """Tests that a bucket that can never grant a token is rejected."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Token bucket rate must be positive"):
+            TokenBucket(rate=0, burst=1)
+
+
+@pytest.mark.asyncio
+class TestPriorityRateLimiter:
+    """
+    Unit tests for the priority-aware RPC rate limiter.
+    """
+
+    async def test_burst_is_granted_immediately_then_throttled(self):
+        """Tests that calls above the burst wait for the refill."""
+        # Arrange
+        limiter = make_limiter(total=(50, 2))
+
+        # Act
+        started = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire(RpcPriority.USER_READ)
+        elapsed = time.monotonic() - started
+
+        # Assert
+        assert elapsed >= 0.015
+
+    async def test_higher_class_is_served_first(self):
+        """Tests that a waiting broadcast gets the next token before queued background polls."""
+        # Arrange
+        limiter = make_limiter(total=(20, 1))
+        await limiter.acquire(RpcPriority.USER_READ)
+        order = []
+
+        async def call(priority: RpcPriority):
+            await limiter.acquire(priority)
+            order.append(priority)
+
+        # Act
+        background = [asyncio.ensure_future(call(RpcPriority.BACKGROUND)) for _ in range(2)]
+        await asyncio.sleep(0.005)
+        depth = {priority: limiter.queue_depth(priority) for priority in RpcPriority}
+        broadcast = asyncio.ensure_future(call(RpcPriority.BROADCAST))
+        await asyncio.gather(broadcast, *background)
+
+        # Assert
+        assert depth == {RpcPriority.BROADCAST: 0, RpcPriority.USER_READ: 0, RpcPriority.BACKGROUND: 2}
+        assert order[0] == RpcPriority.BROADCAST
+        assert limiter.queue_depth(RpcPriority.BACKGROUND) == 0
+
+    async def test_exhausted_class_does_not_block_lower_classes(self):
+        """Tests that each class is capped by its own budget only."""
+        # Arrange
+        limiter = make_limiter(total=(100, 10), broadcast=(0.1, 1))
+        await limiter.acquire(RpcPriority.BROADCAST)
+        blocked_broadcast = asyncio.ensure_future(limiter.acquire(RpcPriority.BROADCAST))
+        await asyncio.sleep(0.005)
+
+        # Act
+        await asyncio.wait_for(limiter.acquire(RpcPriority.BACKGROUND), timeout=0.5)
+
+        # Assert
+        assert limiter.queue_depth(RpcPriority.BROADCAST) == 1
+        blocked_broadcast.cancel()
+
+    async def test_cost_larger_than_burst_is_charged_in_full(self):
+        """Tests that a large batch goes once the bucket is full, and its debt delays the next call."""
+        # Arrange
+        limiter = make_limiter(total=(1000, 2), user_read=(1000, 2), background=(1000, 2))
+
+        # Act
+        await asyncio.wait_for(limiter.acquire(RpcPriority.BACKGROUND, cost=50), timeout=0.5)
+        started = time.monotonic()
+        await limiter.acquire(RpcPriority.USER_READ)
+        elapsed = time.monotonic() - started
+
+        # Assert: 48 tokens of debt plus one token, at 1000 tokens per second
+        assert elapsed >= 0.045
+
+    async def test_bucket_debt_is_paid_back_before_the_next_call(self, clock):
+        """Tests the token accounting of a cost above the burst."""
+        # Arrange
+        bucket = TokenBucket(rate=10, burst=20, clock=clock)
+
+        # Act
+        ready = bucket.wait_time(100)
+        bucket.take(100)
+        next_wait = bucket.wait_time(1)
+
+        # Assert
+        assert ready == 0
+        assert bucket.available() == -80
+        assert next_wait == pytest.approx(8.1)
+
+    async def test_queued_waiters_do_not_poll(self):
+        """Tests that queued waiters sleep until the dispatcher grants them tokens."""
+        # Arrange
+        limiter = make_limiter(total=(20, 1), background=(20, 1))
+        dispatches = 0
+        dispatch = limiter._dispatch
+
+        def counting_dispatch():
+            nonlocal dispatches
+            dispatches += 1
+            dispatch()
+
+        limiter._dispatch = counting_dispatch
+
+        # Act
+        waiters = [asyncio.ensure_future(limiter.acquire(RpcPriority.BACKGROUND)) for _ in range(200)]
+        await asyncio.sleep(0.2)
+        granted = sum(waiter.done() for waiter in waiters)
+        dispatched_while_waiting = dispatches
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+
+        # Assert: one dispatch per enqueue, plus one timer per grant
+        assert 1 <= granted <= 6
+        assert dispatched_while_waiting - 200 <= granted + 2
+        assert limiter.queue_depth(RpcPriority.BACKGROUND) == 0
+
+    async def test_use_rpc_priority_sets_the_priority(self):
+        """Tests that work run in the background block is tagged with the background class."""
+        # Arrange
+        async def current_priority():
+            return rpc_priority.get()
+
+        # Act
+        with use_rpc_priority(RpcPriority.BACKGROUND):
+            background = await current_priority()
+
+        # Assert
+        assert background == RpcPriority.BACKGROUND
+        assert rpc_priority.get() == RpcPriority.USER_READ
@@ -0,0 +1,185 @@
+import asyncio
+import pytest
+from aiohttp import ClientConnectionError
+from src.infra.blockchain.rpc_pool import RpcEndpoint, RpcPool
+
+
+class FakeNode:
+    """Stands in for an AsyncWeb3 instance, answering after a delay or failing."""
+
+    def __init__(self, name: str, delay: float = 0, fail: bool = False):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    async def answer(self) -> str:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ClientConnectionError(f"{self.name} is down")
+        return self.name
+
+
+def ask(node: FakeNode):
+    return node.answer()
+
+
+@pytest.mark.asyncio
+class TestRpcPool:
+    """
+    Unit tests for the latency-aware RpcPool.
+    """
+
+    async def test_ewma_and_p95_latency(self):
+        """Tests the latency statistics kept per endpoint."""
+        # Arrange
+        endpoint = RpcEndpoint("a", FakeNode("a"), ewma_alpha=0.5)
+
+        # Act
+        for latency in [1.0, 3.0] + [2.0] * 18:
+            endpoint.record_success(latency)
+        endpoint.record_latency(10.0)
+
+        # Assert
+        assert endpoint.latency_ewma == pytest.approx(6.0, abs=0.01)
+        assert endpoint.p95_latency() == 3.0
+        assert endpoint.error_rate == 0.0
+
+    async def test_reads_go_to_the_fastest_healthy_endpoint(self):
+        """Tests that ranking favors the endpoint with the lowest latency EWMA."""
+        # Arrange
+        slow, fast = RpcEndpoint("slow", FakeNode("slow")), RpcEndpoint("fast", FakeNode("fast"))
+        slow.record_success(0.5)
+        fast.record_success(0.05)
+        pool = RpcPool([slow, fast])
+
+        # Act
+        result = await pool.read(ask)
+
+        # Assert
+        assert result == "fast"
+        assert slow.web3.calls == 0
+
+    async def test_read_fails_over_and_marks_endpoint_unhealthy(self, clock):
+        """Tests that transport errors fail over and push the endpoint out of rotation."""
+        # Arrange
+        down, up = RpcEndpoint("down", FakeNode("down", fail=True)), RpcEndpoint("up", FakeNode("up"))
+        pool = RpcPool([down, up], unhealthy_cooldown=30, clock=clock)
+
+        # Act
+        results = [await pool.read(ask), await pool.read(ask)]
+
+        # Assert
+        assert results == ["up", "up"]
+        assert down.web3.calls == 2
+        assert pool.is_healthy(down) is False
+
+        await pool.read(ask)
+        assert down.web3.calls == 2
+
+        clock.now += 30
+        assert pool.ranked()[0] is down
+
+    async def test_read_raises_when_every_endpoint_fails(self):
+        """Tests that the last transport error is raised when no endpoint answers."""
+        # Arrange
+        pool = RpcPool([RpcEndpoint("a", FakeNode("a", fail=True)),
+                        RpcEndpoint("b", FakeNode("b", fail=True))])
+
+        # Act & Assert
+        with pytest.raises(ClientConnectionError, match="is down"):
+            await pool.read(ask)
+
+    async def test_rpc_errors_are_not_failed_over(self):
+        """Tests that an answer from the node, even an error, is returned as is."""
+        # Arrange
+        first, second = FakeNode("first"), FakeNode("second")
+        pool = RpcPool([RpcEndpoint("first", first), RpcEndpoint("second", second)])
+
+        async def reverted(node: FakeNode):
+            node.calls += 1
+            raise ValueError("execution reverted")
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="execution reverted"):
+            await pool.read(reverted)
+        assert first.calls + second.calls == 1
+        assert pool.endpoints[0].error_rate == 0.0
+
+    async def test_slow_read_is_hedged_on_the_runner_up(self):
+        """Tests that a read slower than the hedge delay is duplicated and the first answer wins."""
+        # Arrange
+        stalled = RpcEndpoint("stalled", FakeNode("stalled", delay=5))
+        backup = RpcEndpoint("backup", FakeNode("backup", delay=0.01))
+        backup.record_success(0.01)
+        pool = RpcPool([stalled, backup], hedge_reads=True, hedge_delay=0.05)
+
+        # Act
+        result = await asyncio.wait_for(pool.read(ask), timeout=1)
+
+        # Assert
+        assert result == "backup"
+        assert pool.hedged_reads == 1
+        assert stalled.web3.calls == 1
+        # The cancelled loser is ranked behind the winner from now on
+        assert stalled.latency_ewma >= 0.05
+        assert pool.ranked()[0] is backup
+
+    async def test_fast_read_is_not_hedged(self):
+        """Tests that no duplicate is sent when the answer arrives before the hedge delay."""
+        # Arrange
+        first, second = FakeNode("first"), FakeNode("second")
+        pool = RpcPool([RpcEndpoint("first", first), RpcEndpoint("second", second)],
+                       hedge_reads=True, hedge_delay=1)
+
+        # Act
+        result = await pool.read(ask)
+
+        # Assert
+        assert result == "first"
+        assert second.calls == 0
+        assert pool.hedged_reads == 0
+
+    async def test_hedges_and_failovers_are_charged(self):
+        """Tests that every request sent to an endpoint is charged, not only the first attempt."""
+        # Arrange
+        charges = []
+
+        async def charge():
+            charges.append(1)
+
+        stalled = RpcEndpoint("stalled", FakeNode("stalled", delay=5))
+        backup = RpcEndpoint("backup", FakeNode("backup", delay=0.01))
+        backup.record_success(0.01)
+        hedging_pool = RpcPool([stalled, backup], hedge_reads=True, hedge_delay=0.05)
+        down, up = RpcEndpoint("down", FakeNode("down", fail=True)), RpcEndpoint("up", FakeNode("up"))
+        failover_pool = RpcPool([down, up])
+
+        # Act
+        await asyncio.wait_for(hedging_pool.read(ask, charge), timeout=1)
+        hedged_charges = len(charges)
+        await failover_pool.read(ask, charge)
+
+        # Assert
+        assert hedged_charges == 2
+        assert len(charges) - hedged_charges == 2
+
+    async def test_writes_are_pinned_to_the_primary(self):
+        """Tests that writes never leave the primary endpoint, even when it fails."""
+        # Arrange
+        primary = RpcEndpoint("primary", FakeNode("primary", fail=True))
+        replica = RpcEndpoint("replica", FakeNode("replica"))
+        replica.record_success(0.001)
+        pool = RpcPool([primary, replica], hedge_reads=True)
+
+        # Act & Assert
+        with pytest.raises(ClientConnectionError):
+            await pool.write(ask)
+        assert replica.web3.calls == 0
+
+    async def test_pool_requires_an_endpoint(self):
+        """Tests that an empty pool is rejected."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="RPC pool requires at least one endpoint."):
+            RpcPool([])
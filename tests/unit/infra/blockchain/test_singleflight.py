@@ -0,0 +1,99 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+from src.infra.blockchain.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+class TestSingleFlight:
+    """
+    Unit tests for the in-flight call coalescing.
+    """
+
+    async def test_concurrent_identical_calls_share_one_call(self):
+        """Tests that callers of the same key get the result of a single call."""
+        # Arrange
+        singleflight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return {"number": 7}
+
+        fetch_mock = AsyncMock(side_effect=fetch)
+
+        # Act
+        callers = [asyncio.ensure_future(singleflight.do("key", fetch_mock)) for _ in range(10)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*callers)
+
+        # Assert
+        assert fetch_mock.await_count == 1
+        assert results == [{"number": 7}] * 10
+        assert singleflight.coalesced == 9
+        assert len(singleflight) == 0
+
+    async def test_different_keys_are_not_coalesced(self):
+        """Tests that only identical keys share a call."""
+        # Arrange
+        singleflight = SingleFlight()
+        fetch_mock = AsyncMock(return_value=1)
+
+        # Act
+        await asyncio.gather(singleflight.do("a", fetch_mock), singleflight.do("b", fetch_mock))
+
+        # Assert
+        assert fetch_mock.await_count == 2
+
+    async def test_finished_call_is_not_reused(self):
+        """Tests that results are never served after the call completes."""
+        # Arrange
+        singleflight = SingleFlight()
+        fetch_mock = AsyncMock(side_effect=[1, 2])
+
+        # Act
+        first = await singleflight.do("key", fetch_mock)
+        second = await singleflight.do("key", fetch_mock)
+
+        # Assert
+        assert (first, second) == (1, 2)
+
+    async def test_error_is_shared_with_every_caller(self):
+        """Tests that a failed call fails every waiting caller."""
+        # Arrange
+        singleflight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0)
+            raise ValueError("node error")
+
+        # Act
+        results = await asyncio.gather(
+            singleflight.do("key", fetch), singleflight.do("key", fetch), return_exceptions=True)
+
+        # Assert
+        assert all(isinstance(r, ValueError) for r in results)
+        assert singleflight.calls == 1
+
+    async def test_cancelled_caller_does_not_cancel_the_others(self):
+        """Tests that the shared call survives one of its callers being cancelled."""
+        # Arrange
+        singleflight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "ok"
+
+        first = asyncio.ensure_future(singleflight.do("key", fetch))
+        second = asyncio.ensure_future(singleflight.do("key", fetch))
+        await asyncio.sleep(0)
+
+        # Act
+        first.cancel()
+        release.set()
+
+        # Assert
+        assert await second == "ok"
+        assert first.cancelled()
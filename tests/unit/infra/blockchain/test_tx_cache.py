@@ -0,0 +1,113 @@
+import pytest
+from src.infra.blockchain.tx_cache import FinalizedTransactionCache, estimate_size
+
+TX_HASH = "0x" + "a" * 64
+
+
+def make_entry(block_number: int = 100):
+    tx = {"hash": TX_HASH, "value": 10**18, "to": "0x" + "b" * 40}
+    receipt = {"status": 1, "blockNumber": block_number, "gasUsed": 21000}
+    return tx, receipt
+
+
+@pytest.fixture
+def cache() -> FinalizedTransactionCache:
+    return FinalizedTransactionCache(min_confirmations=12, max_entries=3, max_bytes=1024 * 1024)
+
+
+class TestFinalizedTransactionCache:
+    """
+    Unit test suite for the finality-aware LRU cache.
+    """
+
+    def test_final_transaction_is_admitted(self, cache: FinalizedTransactionCache):
+        """Tests that a transaction past the confirmation threshold is cached."""
+        # Arrange
+        tx, receipt = make_entry(block_number=100)
+
+        # Act
+        admitted = cache.put(TX_HASH, tx, receipt, latest_block=111)
+
+        # Assert
+        assert admitted is True
+        assert cache.get(TX_HASH) == (tx, receipt, 111)
+
+    def test_unconfirmed_transaction_is_not_admitted(self, cache: FinalizedTransactionCache):
+        """Tests that a transaction with too few confirmations is not cached."""
+        # Arrange
+        tx, receipt = make_entry(block_number=100)
+
+        # Act
+        admitted = cache.put(TX_HASH, tx, receipt, latest_block=110)
+
+        # Assert
+        assert admitted is False
+        assert cache.get(TX_HASH) is None
+
+    @pytest.mark.parametrize("tx, receipt", [
+        (None, {"blockNumber": 1}),
+        ({"hash": TX_HASH}, None),
+        ({"hash": TX_HASH}, {"status": 1}),
+    ])
+    def test_incomplete_entries_are_not_admitted(self, cache: FinalizedTransactionCache, tx, receipt):
+        """Tests that missing transactions or pending receipts are never cached."""
+        # Act & Assert
+        assert cache.put(TX_HASH, tx, receipt, latest_block=1000) is False
+
+    def test_lookup_is_case_insensitive(self, cache: FinalizedTransactionCache):
+        """Tests that the tx hash key is normalized."""
+        # Arrange
+        tx, receipt = make_entry()
+        cache.put(TX_HASH.upper().replace("0X", "0x"),
+                  tx, receipt, latest_block=200)
+
+        # Act & Assert
+        assert cache.get(TX_HASH) is not None
+
+    def test_lru_eviction_by_entry_count(self, cache: FinalizedTransactionCache):
+        """Tests that the least recently used entry is evicted first."""
+        # Arrange
+        hashes = [f"0x{i:064x}" for i in range(4)]
+        for tx_hash in hashes[:3]:
+            cache.put(tx_hash, *make_entry(), latest_block=200)
+
+        # Touch the oldest entry so the second one becomes the LRU
+        cache.get(hashes[0])
+
+        # Act
+        cache.put(hashes[3], *make_entry(), latest_block=200)
+
+        # Assert
+        assert len(cache) == 3
+        assert cache.get(hashes[0]) is not None
+        assert cache.get(hashes[1]) is None
+
+    def test_eviction_by_memory_budget(self):
+        """Tests that entries are evicted when the memory budget is exceeded."""
+        # Arrange
+        tx, receipt = make_entry()
+        entry_size = estimate_size(tx) + estimate_size(receipt)
+        cache = FinalizedTransactionCache(
+            min_confirmations=1, max_entries=100, max_bytes=entry_size * 2)
+
+        # Act
+        for i in range(3):
+            cache.put(f"0x{i:064x}", *make_entry(), latest_block=200)
+
+        # Assert
+        assert len(cache) == 2
+        assert cache.size_bytes <= entry_size * 2
+
+    def test_hit_and_miss_counters(self, cache: FinalizedTransactionCache):
+        """Tests that hits and misses are counted."""
+        # Arrange
+        cache.put(TX_HASH, *make_entry(), latest_block=200)
+
+        # Act
+        cache.get(TX_HASH)
+        cache.get(TX_HASH)
+        cache.get("0x" + "f" * 64)
+
+        # Assert
+        assert cache.stats()["hits"] == 2
+        assert cache.stats()["misses"] == 1
@@ -0,0 +1,73 @@
+import asyncio
+import threading
+import pytest
+from src.infra.concurrency import BoundedExecutor
+
+
+def square(value: int) -> int:
+    return value * value
+
+
+@pytest.mark.asyncio
+class TestBoundedExecutor:
+    """
+    Unit test suite for the pool running CPU-bound work off the event loop.
+    """
+
+    async def test_runs_calls_off_the_event_loop(self):
+        """
+        Tests that calls run on a pool thread and return their result.
+        """
+        # Arrange
+        executor = BoundedExecutor("thread", max_workers=2, queue_size=0)
+
+        # Act
+        thread_name = await executor.run(lambda: threading.current_thread().name)
+        result = await executor.run(square, 7)
+        executor.shutdown()
+
+        # Assert
+        assert thread_name.startswith("cpu-worker")
+        assert result == 49
+
+    async def test_callers_wait_when_the_pool_is_full(self):
+        """
+        Tests that no more than max_workers + queue_size calls are handed to the pool.
+        """
+        # Arrange
+        executor = BoundedExecutor("thread", max_workers=1, queue_size=1)
+        release = threading.Event()
+        tasks = [asyncio.create_task(executor.run(release.wait)) for _ in range(3)]
+        await asyncio.sleep(0.05)
+
+        # Act
+        waiting = executor.waiting
+        release.set()
+        await asyncio.gather(*tasks)
+        executor.shutdown()
+
+        # Assert
+        assert waiting == 1
+        assert executor.waiting == 0
+
+    async def test_process_pool_runs_module_functions(self):
+        """
+        Tests that the process pool runs picklable functions.
+        """
+        # Arrange
+        executor = BoundedExecutor("process", max_workers=1, queue_size=0)
+
+        # Act
+        result = await executor.run(square, 3)
+        executor.shutdown()
+
+        # Assert
+        assert result == 9
+
+    async def test_rejects_unknown_kind(self):
+        """
+        Tests that only thread and process pools are supported.
+        """
+        # Act & Assert
+        with pytest.raises(ValueError, match="Unknown executor kind 'fiber'"):
+            BoundedExecutor("fiber")
@@ -0,0 +1,89 @@
+import pickle
+import pytest
+from cryptography.fernet import Fernet
+from eth_account import Account
+from src.infra.security.encryption import EncryptionService
+from src.infra.security.hd_wallet import HDWallet
+
+# Well-known development mnemonic (Hardhat/Anvil), never used with real funds
+MNEMONIC = "test test test test test test test test test test test junk"
+
+
+@pytest.fixture
+def hd_wallet(monkeypatch) -> HDWallet:
+    monkeypatch.setenv("ENCRYPTION_KEYS", Fernet.generate_key().decode())
+    encryption_service = EncryptionService()
+    return HDWallet(
+        encrypted_mnemonic=encryption_service.encrypt(MNEMONIC.encode()),
+        encryption_service=encryption_service,
+        cache_size=2
+    )
+
+
+class TestHDWallet:
+    """
+    Unit test suite for the HDWallet.
+    """
+
+    def test_derived_addresses_match_the_bip44_path(self, hd_wallet: HDWallet):
+        """
+        Tests that address i is the one derived at m/44'/60'/0'/0/i.
+        """
+        Account.enable_unaudited_hdwallet_features()
+
+        # Act
+        addresses = hd_wallet.derive_addresses(3, 3)
+
+        # Assert
+        assert addresses == [
+            Account.from_mnemonic(MNEMONIC, account_path=f"m/44'/60'/0'/0/{index}").address
+            for index in range(3, 6)
+        ]
+
+    def test_private_key_matches_the_derived_address(self, hd_wallet: HDWallet):
+        """
+        Tests that the private key of an index signs for the address of that index.
+        """
+        # Act
+        private_key = hd_wallet.derive_private_key(7)
+
+        # Assert
+        assert Account.from_key(private_key).address == hd_wallet.derive_addresses(7, 1)[0]
+
+    def test_private_keys_are_cached_up_to_the_cache_size(self, hd_wallet: HDWallet):
+        """
+        Tests that derived keys are cached, and the least recently used one is evicted.
+        """
+        # Act
+        first_key = hd_wallet.derive_private_key(0)
+        hd_wallet.derive_private_key(1)
+        hd_wallet.derive_private_key(0)
+        hd_wallet.derive_private_key(2)
+
+        # Assert
+        assert list(hd_wallet._keys) == [0, 2]
+        assert hd_wallet.derive_private_key(0) is first_key
+
+    def test_invalid_index_raises_error(self, hd_wallet: HDWallet):
+        """
+        Tests that hardened or negative indexes are rejected.
+        """
+        # Act & Assert
+        with pytest.raises(ValueError, match="Derivation index must be between"):
+            hd_wallet.derive_private_key(2**31)
+        with pytest.raises(ValueError, match="Derivation index must be between"):
+            hd_wallet.derive_addresses(-1, 1)
+
+    def test_pickled_wallet_derives_the_same_addresses_without_the_cache(self, hd_wallet: HDWallet):
+        """
+        Tests that the wallet can be sent to a process pool, leaving its cached keys behind.
+        """
+        # Arrange
+        hd_wallet.derive_private_key(0)
+
+        # Act
+        copy = pickle.loads(pickle.dumps(hd_wallet))
+
+        # Assert
+        assert len(copy._keys) == 0
+        assert copy.derive_addresses(0, 2) == hd_wallet.derive_addresses(0, 2)